@@ -0,0 +1,328 @@
+"""Scaling benchmarks for NumericSet operations.
+
+    Every operation is timed on random, clustered and adversarial
+    interval distributions at sizes from 10^2 to 10^6. For each
+    operation and distribution the script records time and peak memory,
+    fits the empirical growth exponent k of time ~ n^k and compares it
+    with the stored baseline. The script exits with status 1 if an
+    exponent exceeds its baseline by more than the tolerance.
+
+    Usage
+    ----------------
+        python benchmarks/bench_scaling.py
+        python benchmarks/bench_scaling.py --max-size 100000 --operations add update
+        python benchmarks/bench_scaling.py --update-baseline
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from numeric_sets.main import Interval, NumericSet  # noqa: E402
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+SIZES = [100, 300, 1000, 3000, 10000, 30000, 100000, 300000, 1000000]
+
+# Measurements shorter than this are dominated by noise and are not used for fitting
+MIN_FIT_TIME = 0.001
+
+# Runs are repeated while their total time is below REPEAT_TIME seconds
+REPEATS = 5
+REPEAT_TIME = 0.2
+
+
+def random_intervals(size: int, generator: random.Random):
+    """
+    Construct disjoint intervals with random lengths and gaps in random order.
+    """
+    intervals, position = [], 0.0
+
+    for _ in range(size):
+        start = position + generator.uniform(0.1, 10)
+        position = start + generator.uniform(0.1, 10)
+        intervals.append(
+            Interval(start, position, generator.random() < 0.5, generator.random() < 0.5))
+
+    generator.shuffle(intervals)
+
+    return intervals
+
+
+def clustered_intervals(size: int, generator: random.Random):
+    """
+    Construct disjoint intervals packed into a few dense clusters in random order.
+    """
+    intervals, position = [], 0.0
+
+    for i in range(size):
+        # Wide gaps separate clusters of about one hundred intervals
+        gap = 1000.0 if generator.random() < 0.01 else generator.uniform(0.001, 0.01)
+        start = position + gap
+        position = start + generator.uniform(0.1, 1)
+        intervals.append(Interval(start, position, True, False))
+
+    generator.shuffle(intervals)
+
+    return intervals
+
+
+def adversarial_intervals(size: int, generator: random.Random):
+    """
+    Construct open intervals that touch their neighbours without merging with them.
+    Intervals are ordered from the middle outwards, so none of them hits the fast
+    paths for the leftmost and the rightmost intervals.
+    """
+    intervals = [Interval(2 * i + generator.random(), 2 * i + 2 + generator.random())
+                 for i in range(size)]
+
+    # Make each interval end where the next one starts
+    for left, right in zip(intervals, intervals[1:]):
+        right.start = left.end
+
+    middle = size // 2
+    order = [middle]
+
+    for offset in range(1, size):
+        index = middle + (offset + 1) // 2 if offset % 2 else middle - offset // 2
+
+        if 0 <= index < size:
+            order.append(index)
+
+    return [intervals[index] for index in order]
+
+
+DISTRIBUTIONS = {
+    'random': random_intervals,
+    'clustered': clustered_intervals,
+    'adversarial': adversarial_intervals,
+}
+
+
+def canonical(intervals):
+    """
+    Construct a numeric set from disjoint intervals without adding them one by one.
+    """
+    return NumericSet([interval.copy() for interval in intervals])
+
+
+def prepare_add(base, operand, directory):
+    numeric_set = NumericSet()
+
+    return lambda: [numeric_set.add(interval) for interval in operand]
+
+
+def prepare_remove(base, operand, directory):
+    numeric_set = canonical(base)
+
+    return lambda: [numeric_set.remove(interval) for interval in operand]
+
+
+def prepare_update(base, operand, directory):
+    numeric_set_1, numeric_set_2 = canonical(base), canonical(operand)
+
+    return lambda: numeric_set_1.update(numeric_set_2)
+
+
+def prepare_intersection_update(base, operand, directory):
+    numeric_set_1, numeric_set_2 = canonical(base), canonical(operand)
+
+    return lambda: numeric_set_1.intersection_update(numeric_set_2)
+
+
+def prepare_difference_update(base, operand, directory):
+    numeric_set_1, numeric_set_2 = canonical(base), canonical(operand)
+
+    return lambda: numeric_set_1.difference_update(numeric_set_2)
+
+
+def prepare_issubset(base, operand, directory):
+    numeric_set_1, numeric_set_2 = canonical(base), canonical(operand)
+
+    return lambda: numeric_set_1.issubset(numeric_set_2)
+
+
+def prepare_read(base, operand, directory):
+    filename = os.path.join(directory, 'read.txt')
+    canonical(base).save(filename)
+
+    return lambda: NumericSet.read(filename)
+
+
+def prepare_save(base, operand, directory):
+    filename = os.path.join(directory, 'save.txt')
+    numeric_set = canonical(base)
+
+    return lambda: numeric_set.save(filename)
+
+
+OPERATIONS = {
+    'add': prepare_add,
+    'remove': prepare_remove,
+    'update': prepare_update,
+    'intersection_update': prepare_intersection_update,
+    'difference_update': prepare_difference_update,
+    'issubset': prepare_issubset,
+    'read': prepare_read,
+    'save': prepare_save,
+}
+
+
+def measure(operation: str, distribution: str, size: int, directory: str):
+    """
+    Time the operation and run it once more under tracemalloc for peak memory.
+    Short runs are repeated, and the best time is kept to reduce noise.
+
+    :return: elapsed time in seconds and peak memory in bytes
+    """
+    def prepare():
+        generator = random.Random(size)
+        base = sorted(DISTRIBUTIONS[distribution](size, generator),
+                      key=lambda interval: interval.start)
+        operand = DISTRIBUTIONS[distribution](size, generator)
+
+        return OPERATIONS[operation](base, operand, directory)
+
+    times = []
+
+    while len(times) < REPEATS and sum(times) < REPEAT_TIME:
+        run = prepare()
+
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    run = prepare()
+
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return min(times), peak
+
+
+def fit_exponent(sizes, times):
+    """
+    Fit k in time ~ c * size^k with least squares on the log-log scale.
+
+    :return: the exponent or None if there are not enough reliable measurements
+    """
+    points = [(math.log(size), math.log(elapsed)) for size, elapsed in zip(sizes, times)
+              if elapsed >= MIN_FIT_TIME]
+
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    return covariance / variance
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--operations', nargs='+', choices=sorted(OPERATIONS),
+                        default=list(OPERATIONS))
+    parser.add_argument('--distributions', nargs='+', choices=sorted(DISTRIBUTIONS),
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument('--min-size', type=int, default=SIZES[0])
+    parser.add_argument('--max-size', type=int, default=SIZES[-1])
+    parser.add_argument('--time-limit', type=float, default=2.0,
+                        help='stop growing the size once a run takes longer (seconds)')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed increase of the growth exponent over the baseline')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--output', help='write measurements to a JSON file')
+    arguments = parser.parse_args(arguments)
+
+    sizes = [size for size in SIZES if arguments.min_size <= size <= arguments.max_size]
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for operation in arguments.operations:
+            for distribution in arguments.distributions:
+                key = f'{operation}/{distribution}'
+                measured_sizes, times, memory = [], [], []
+
+                for size in sizes:
+                    elapsed, peak = measure(operation, distribution, size, directory)
+
+                    measured_sizes.append(size)
+                    times.append(elapsed)
+                    memory.append(peak)
+
+                    print(f'{key:35} n={size:<8} {elapsed:10.4f} s '
+                          f'{peak / 2 ** 20:10.2f} MiB', flush=True)
+
+                    if elapsed > arguments.time_limit:
+                        break
+
+                results[key] = {
+                    'sizes': measured_sizes,
+                    'times': times,
+                    'peak_memory': memory,
+                    'exponent': fit_exponent(measured_sizes, times),
+                }
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if arguments.update_baseline:
+        baseline = {}
+
+        if os.path.exists(arguments.baseline):
+            with open(arguments.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+
+        for key, result in results.items():
+            exponent = result['exponent']
+            baseline[key] = round(exponent, 2) if exponent is not None else None
+
+        with open(arguments.baseline, 'w') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+
+        return 0
+
+    with open(arguments.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    regressions = []
+
+    print()
+
+    for key, result in results.items():
+        exponent, expected = result['exponent'], baseline.get(key)
+
+        if exponent is None or expected is None:
+            print(f'{key:35} exponent {exponent}, baseline {expected}: skipped')
+            continue
+
+        status = 'ok'
+
+        if exponent > expected + arguments.tolerance:
+            status = 'REGRESSION'
+            regressions.append(key)
+
+        print(f'{key:35} exponent {exponent:5.2f}, baseline {expected:5.2f}: {status}')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Command-line tool for set operations on interval files.
+
+    Inputs are read as sorted streams in the format of NumericSet.save,
+    or of packed.save with --binary, so files larger than the available
+    memory can be combined. Results are written to the output file, or
+    to the standard output by default, as they are computed. Unsorted
+    files can be normalized first with the sort command.
+
+    Usage
+    ----------------
+        python -m numeric_sets union a.txt b.txt c.txt -o union.txt
+        python -m numeric_sets intersection a.txt b.txt
+        python -m numeric_sets difference a.txt b.txt c.txt
+        python -m numeric_sets symmetric-difference a.txt b.txt
+        python -m numeric_sets subset a.txt b.txt
+        python -m numeric_sets stats a.txt b.txt
+        python -m numeric_sets sort unsorted.txt -o sorted.txt
+"""
+
+import argparse
+import functools
+import sys
+
+from numeric_sets import packed, streams
+from numeric_sets.external import external_sort
+from numeric_sets.main import NumericSet
+
+
+PARSERS = {'float': float, 'int': int}
+
+
+def _read(filename: str, args):
+    """
+    Return a lazy stream of intervals of the file.
+    """
+    if args.binary:
+        return packed.iter_read(filename)
+
+    return streams.iter_read(filename, PARSERS[args.parse])
+
+
+def _write(intervals, args) -> None:
+    """
+    Write a stream of intervals to the output file or to the standard output.
+    """
+    if args.binary:
+        # The packed layout stores all starts before all ends, so the result is collected
+        numeric_set = NumericSet()
+        numeric_set.intervals = list(intervals)
+        packed.save(numeric_set, args.output)
+    elif args.output is not None:
+        streams.iter_save(intervals, args.output)
+    else:
+        for interval in intervals:
+            sys.stdout.write(interval.get_formatted() + '\n')
+
+
+def _union(args) -> int:
+    _write(streams.iter_union(*(_read(filename, args) for filename in args.files)), args)
+    return 0
+
+
+def _intersection(args) -> int:
+    _write(streams.iter_intersection(*(_read(filename, args) for filename in args.files)),
+           args)
+    return 0
+
+
+def _difference(args) -> int:
+    first, *rest = (_read(filename, args) for filename in args.files)
+    _write(streams.iter_difference(first, streams.iter_union(*rest)), args)
+    return 0
+
+
+def _symmetric_difference(args) -> int:
+    first, *rest = (_read(filename, args) for filename in args.files)
+    # A single file is still checked for order and coalesced like the result of an operation
+    _write(functools.reduce(streams.iter_symmetric_difference, rest,
+                            streams.iter_coalesce(first)), args)
+    return 0
+
+
+def _subset(args) -> int:
+    first, *rest = (_read(filename, args) for filename in args.files)
+    is_subset = next(streams.iter_difference(first, streams.iter_union(*rest)), None) is None
+
+    print(is_subset)
+
+    return 0 if is_subset else 1
+
+
+def _stats(args) -> int:
+    for filename in args.files:
+        count = measure = 0
+        start = end = None
+
+        for interval in streams.iter_coalesce(_read(filename, args)):
+            if start is None:
+                start = interval.start
+
+            count += 1
+            measure += interval.end - interval.start
+            end = interval.end
+
+        print(f'{filename}: count={count} measure={measure} start={start} end={end}')
+
+    return 0
+
+
+def _sort(args) -> int:
+    external_sort(args.files[0], args.output, chunk_size=args.chunk_size,
+                  parse=PARSERS[args.parse])
+    return 0
+
+
+COMMANDS = {
+    'union': (_union, 1, 'write the union of the files'),
+    'intersection': (_intersection, 1, 'write the intersection of the files'),
+    'difference': (_difference, 1, 'write the first file minus all the others'),
+    'symmetric-difference': (_symmetric_difference, 1,
+                             'write points covered by an odd number of the files'),
+    'subset': (_subset, 2, 'print whether the first file is a subset of the union of the others'),
+    'stats': (_stats, 1, 'print the count, measure and bounds of every file'),
+    'sort': (_sort, 1, 'sort and coalesce an unsorted text file into the output file'),
+}
+
+# Commands that write a set with _write, which needs an output file for --binary
+SET_COMMANDS = {'union', 'intersection', 'difference', 'symmetric-difference'}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m numeric_sets',
+        description='Set operations on sorted interval files, streamed from disk.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for name, (_, min_files, description) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=description, description=description)
+        subparser.add_argument('files', nargs='+', metavar='file')
+        subparser.add_argument('-o', '--output', help='the output file, stdout by default')
+        subparser.add_argument('--binary', action='store_true',
+                               help='read and write the packed binary format')
+        subparser.add_argument('--parse', choices=PARSERS, default='float',
+                               help='the type of endpoints of text files')
+        subparser.add_argument('--chunk-size', type=int, default=1000000,
+                               help='the number of intervals sorted in memory by sort')
+        subparser.set_defaults(min_files=min_files)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Run the command-line tool.
+
+    :param argv: command-line arguments, sys.argv[1:] by default
+    :return: the exit status
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    function = COMMANDS[args.command][0]
+
+    if len(args.files) < args.min_files:
+        parser.error(f'{args.command} needs at least {args.min_files} files')
+
+    if args.binary and args.command in SET_COMMANDS and args.output is None:
+        parser.error(f'{args.command} needs an output file with --binary')
+
+    if args.command == 'sort':
+        if len(args.files) > 1:
+            parser.error('sort takes a single file')
+
+        if args.output is None:
+            parser.error('sort needs an output file')
+
+        if args.binary:
+            parser.error('sort only supports text files')
+
+    try:
+        return function(args)
+    except (OSError, ValueError) as error:
+        print(f'error: {error}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,322 @@
+"""Box and BoxSet classes for two-dimensional sets of intervals.
+
+    A box is the product of an x interval and a y interval. A BoxSet
+    stores the union of boxes as a list of slabs: disjoint x intervals
+    sorted along the x axis, each with the NumericSet of y coverage
+    that is the same for every x of the slab. Neighbouring slabs with
+    equal y coverage are merged, so the representation of a set does not
+    depend on the boxes it was built from.
+
+    A set is built from boxes with a sweep over the ends of their x
+    intervals. Operations between two sets sweep over the slab
+    boundaries of both sets and combine the y coverage of every slab with
+    the operation of NumericSet, so they take time proportional to the
+    size of both slab lists. Point and box queries find the slabs by a
+    binary search over x. Endpoint inclusivity is kept on both axes.
+
+    Box methods
+    ----------------
+        includes - determine whether the box includes the given point
+        area - return the area of the box
+
+    BoxSet methods
+    ----------------
+        union - return the union of the set and the given set
+        intersection - return the intersection of the set and the given set
+        difference - return the difference between the set and the given set
+        symmetric_difference - return the symmetric difference of two sets
+        includes - determine whether the set includes the given point
+        intersects - determine whether the set intersects the given box
+        covers - determine whether the set covers the given box
+        area - return the total area of the set
+        boxes - return disjoint boxes that make up the set
+        is_empty - determine whether the set is empty
+"""
+
+from bisect import bisect_left, bisect_right
+from numbers import Number
+from typing import List
+
+from numeric_sets.main import (
+    Interval, NumericSet, _from_cuts, _length, _lower_cut, _upper_cut)
+
+
+class Box:
+    """Class for a product of two numeric intervals."""
+
+    def __init__(self, x: Interval, y: Interval):
+        """
+        Initialize a box spanning the x interval by the y interval.
+        """
+        self.x = x
+        self.y = y
+
+    def get_formatted(self) -> str:
+        """
+        Return formatted box as a string.
+
+        :return: the formatted intervals of both axes
+        """
+        return f'{self.x.get_formatted()} x {self.y.get_formatted()}'
+
+    def includes(self, x: Number, y: Number) -> bool:
+        """
+        Determine whether the box includes the given point.
+
+        :param x: the x coordinate of the point
+        :param y: the y coordinate of the point
+        :return: True if the box includes the point, False otherwise
+        """
+        return self.x.includes(x) and self.y.includes(y)
+
+    def area(self):
+        """
+        Return the area of the box.
+
+        :return: the product of the lengths of both intervals
+        """
+        return _length(self.x) * _length(self.y)
+
+
+def _key(numeric_set: NumericSet) -> list:
+    """
+    Return the cuts of a numeric set, which are equal for sets of the same coverage.
+    """
+    return [(_lower_cut(interval), _upper_cut(interval)) for interval in numeric_set.intervals]
+
+
+def _append_slab(slabs: list, lower: tuple, upper: tuple, numeric_set: NumericSet) -> None:
+    """
+    Append a slab between two cuts, merging it into the last slab of the same coverage.
+    """
+    if numeric_set.is_empty():
+        return
+
+    if slabs:
+        last_x, last_set = slabs[-1]
+
+        if _upper_cut(last_x) == lower and _key(last_set) == _key(numeric_set):
+            slabs[-1] = (_from_cuts(_lower_cut(last_x), upper), last_set)
+            return
+
+    slabs.append((_from_cuts(lower, upper), numeric_set))
+
+
+class BoxSet:
+    """Class for performing operations on sets of boxes."""
+
+    def __init__(self, boxes: List[Box] = None):
+        """
+        Initialize a set covering the union of the given boxes.
+        """
+        events = {}
+
+        # Boxes are tracked by their position, so the same box may be given more than once
+        for index, box in enumerate(boxes or []):
+            lower, upper = _lower_cut(box.x), _upper_cut(box.x)
+
+            if lower < upper and _lower_cut(box.y) < _upper_cut(box.y):
+                events.setdefault(lower, ([], []))[0].append((index, box))
+                events.setdefault(upper, ([], []))[1].append((index, box))
+
+        slabs = []
+        active = {}
+        numeric_set = NumericSet()
+        cuts = sorted(events)
+
+        for lower, upper in zip(cuts, cuts[1:]):
+            added, removed = events[lower]
+
+            for index, _ in removed:
+                del active[index]
+
+            for index, box in added:
+                active[index] = box.y
+
+            # Additions only extend the coverage of the previous slab
+            if removed:
+                numeric_set = NumericSet()
+                numeric_set.add_many(active.values())
+            elif added:
+                numeric_set = numeric_set.copy()
+                numeric_set.add_many(box.y for _, box in added)
+
+            _append_slab(slabs, lower, upper, numeric_set)
+
+        self.slabs = slabs
+
+    @property
+    def slabs(self) -> list:
+        """
+        Sorted list of disjoint x intervals with the y coverage of each of them.
+        """
+        return self._slabs
+
+    @slabs.setter
+    def slabs(self, slabs: list) -> None:
+        self._slabs = slabs
+        self._upper_cuts = [_upper_cut(x) for x, _ in slabs]
+
+    @staticmethod
+    def _from_slabs(slabs: list):
+        box_set = BoxSet()
+        box_set.slabs = slabs
+
+        return box_set
+
+    def _combine(self, box_set, operation: str):
+        """
+        Return a set with the y coverage of both sets combined by a NumericSet operation.
+        """
+        cuts = sorted({cut for slabs in (self.slabs, box_set.slabs) for x, _ in slabs
+                       for cut in (_lower_cut(x), _upper_cut(x))})
+        empty = NumericSet()
+        slabs = []
+        indexes = [0, 0]
+
+        for lower, upper in zip(cuts, cuts[1:]):
+            numeric_sets = []
+
+            for side, own_slabs in enumerate((self.slabs, box_set.slabs)):
+                index = indexes[side]
+
+                # Skip slabs that end before the elementary slab
+                while index < len(own_slabs) and _upper_cut(own_slabs[index][0]) <= lower:
+                    index += 1
+
+                indexes[side] = index
+
+                if index < len(own_slabs) and _lower_cut(own_slabs[index][0]) <= lower:
+                    numeric_sets.append(own_slabs[index][1])
+                else:
+                    numeric_sets.append(empty)
+
+            numeric_set = getattr(numeric_sets[0], operation)(numeric_sets[1])
+            _append_slab(slabs, lower, upper, numeric_set)
+
+        return BoxSet._from_slabs(slabs)
+
+    def union(self, box_set):
+        """
+        Return a union of the set and the given set.
+
+        :param box_set: a set of boxes
+        :return: union of the set and the given set
+        """
+        return self._combine(box_set, 'union')
+
+    def intersection(self, box_set):
+        """
+        Return an intersection of the set and the given set.
+
+        :param box_set: a set of boxes
+        :return: intersection of the set and the given set
+        """
+        return self._combine(box_set, 'intersection')
+
+    def difference(self, box_set):
+        """
+        Return a difference between the set and the given set.
+
+        :param box_set: a set of boxes
+        :return: difference between the set and the given set
+        """
+        return self._combine(box_set, 'difference')
+
+    def symmetric_difference(self, box_set):
+        """
+        Return a symmetric difference of the set and the given set.
+
+        :param box_set: a set of boxes
+        :return: symmetric difference of the set and the given set
+        """
+        return self._combine(box_set, 'symmetric_difference')
+
+    def _overlapping(self, x: Interval) -> list:
+        """
+        Return the slabs that overlap the x interval.
+        """
+        start = bisect_right(self._upper_cuts, _lower_cut(x))
+        upper = _upper_cut(x)
+        slabs = []
+
+        for index in range(start, len(self.slabs)):
+            if _lower_cut(self.slabs[index][0]) >= upper:
+                break
+
+            slabs.append(self.slabs[index])
+
+        return slabs
+
+    def includes(self, x: Number, y: Number) -> bool:
+        """
+        Determine whether the set includes the given point.
+
+        :param x: the x coordinate of the point
+        :param y: the y coordinate of the point
+        :return: True if the set includes the point, False otherwise
+        """
+        # The only slab that may include x is the first one ending after it
+        index = bisect_left(self._upper_cuts, (x, 1))
+
+        if index == len(self.slabs):
+            return False
+
+        slab_x, numeric_set = self.slabs[index]
+
+        return slab_x.includes(x) and numeric_set.includes(y)
+
+    def intersects(self, box: Box) -> bool:
+        """
+        Determine whether the set and the given box have a common point.
+
+        :param box: a box
+        :return: True if the set intersects the box, False otherwise
+        """
+        y_set = NumericSet([box.y])
+
+        return any(not numeric_set.intersection(y_set).is_empty()
+                   for _, numeric_set in self._overlapping(box.x))
+
+    def covers(self, box: Box) -> bool:
+        """
+        Determine whether the set includes every point of the given box.
+
+        :param box: a box
+        :return: True if the set covers the box, False otherwise
+        """
+        y_set = NumericSet([box.y])
+        position = _lower_cut(box.x)
+
+        for x, numeric_set in self._overlapping(box.x):
+            if _lower_cut(x) > position or not numeric_set.issuperset(y_set):
+                return False
+
+            position = _upper_cut(x)
+
+        return position >= _upper_cut(box.x)
+
+    def area(self):
+        """
+        Return the total area of the set.
+
+        :return: the sum of areas of the slabs
+        """
+        return sum(_length(x) * numeric_set.measure() for x, numeric_set in self.slabs)
+
+    def boxes(self) -> List[Box]:
+        """
+        Return disjoint boxes that make up the set, one per y interval of every slab.
+
+        :return: a list of boxes sorted by x and then by y
+        """
+        return [Box(x.copy(), y.copy()) for x, numeric_set in self.slabs
+                for y in numeric_set.intervals]
+
+    def is_empty(self) -> bool:
+        """
+        Determine whether the set is empty.
+
+        :return: whether the set is empty
+        """
+        return not self.slabs
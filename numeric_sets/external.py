@@ -0,0 +1,93 @@
+"""External-memory sort of interval files larger than the available memory.
+
+    The input file is read in chunks of at most chunk_size intervals.
+    Each chunk is sorted, coalesced and written to a temporary run file.
+    Runs are then merged at most max_open_runs at a time, pass after pass,
+    until a single sorted file of disjoint intervals remains.
+
+    With r runs every pass reads and writes each interval once, so the
+    temporary I/O is bounded by the input size times the number of passes,
+    ceil(log(r) / log(max_open_runs)).
+
+    Functions
+    ----------------
+        external_sort - sort and coalesce an interval file into another file
+"""
+
+import os
+import tempfile
+from itertools import islice
+
+from numeric_sets.main import _coalesce, _lower_cut
+from numeric_sets.streams import iter_read, iter_save, iter_union
+
+
+def _write_runs(input_filename: str, directory: str, chunk_size: int, parse) -> list:
+    """
+    Split the input file into sorted and coalesced run files.
+
+    :return: a list of names of the run files
+    """
+    runs = []
+    intervals = iter_read(input_filename, parse)
+
+    while True:
+        chunk = list(islice(intervals, chunk_size))
+
+        if not chunk:
+            break
+
+        run = os.path.join(directory, f'run_0_{len(runs)}.txt')
+        iter_save(_coalesce(sorted(chunk, key=_lower_cut)), run)
+        runs.append(run)
+
+    return runs
+
+
+def _merge_runs(runs: list, output_filename: str, parse) -> None:
+    """
+    Merge sorted run files into one sorted file of disjoint intervals.
+    """
+    iter_save(iter_union(*(iter_read(run, parse) for run in runs)), output_filename)
+
+
+def external_sort(input_filename: str, output_filename: str, chunk_size: int = 1000000,
+                  max_open_runs: int = 64, directory: str = None, parse=float) -> None:
+    """
+    Sort and coalesce intervals of a file that does not fit in memory.
+    The output file holds the sorted disjoint intervals in the format of NumericSet.save.
+
+    :param input_filename: the name of the file with unsorted intervals
+    :param output_filename: the name of the output file
+    :param chunk_size: the maximum number of intervals held in memory
+    :param max_open_runs: the maximum number of run files merged at once
+    :param directory: the directory for temporary files, the system default if None
+    :param parse: a function that converts a formatted endpoint to a value
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+
+    if max_open_runs < 2:
+        raise ValueError('max_open_runs must be at least 2')
+
+    with tempfile.TemporaryDirectory(dir=directory) as temporary_directory:
+        runs = _write_runs(input_filename, temporary_directory, chunk_size, parse)
+        merge_pass = 0
+
+        while len(runs) > max_open_runs:
+            merge_pass += 1
+            merged_runs = []
+
+            for start in range(0, len(runs), max_open_runs):
+                run = os.path.join(temporary_directory,
+                                   f'run_{merge_pass}_{len(merged_runs)}.txt')
+                _merge_runs(runs[start:start + max_open_runs], run, parse)
+                merged_runs.append(run)
+
+            # Remove merged runs right away to keep the temporary space bounded
+            for run in runs:
+                os.remove(run)
+
+            runs = merged_runs
+
+        _merge_runs(runs, output_filename, parse)
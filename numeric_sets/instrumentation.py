@@ -0,0 +1,318 @@
+"""Optional instrumentation of Interval and NumericSet operations.
+
+    While instrumentation is enabled, methods of Interval and NumericSet
+    are replaced with wrappers that count calls, interval comparisons,
+    Interval allocations and elapsed time per operation. Disabling it
+    restores the original methods, so there is no overhead otherwise.
+
+    Comparisons are calls of is_overlapping, is_almost_overlapping and
+    includes, plus one comparison for every interval that passes through
+    the single-pass merges used by add_many and remove_many.
+
+    Counts are inclusive: comparisons and allocations made by nested
+    operations, such as add_many called by update, are also counted for
+    the outer operation.
+
+    Functions and classes
+    ----------------
+        OperationStats - statistics of one operation
+        Stats - statistics of all instrumented operations
+        Tracer - base class for tracers notified about every operation
+        enable - start collecting statistics
+        disable - stop collecting statistics and restore original methods
+        instrumented - context manager that enables instrumentation
+"""
+
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+from numeric_sets import main
+from numeric_sets.main import Interval, NumericSet
+
+
+INTERVAL_OPERATIONS = ('difference', 'intersection', 'union')
+
+INTERVAL_COMPARISONS = ('is_overlapping', 'is_almost_overlapping', 'includes')
+
+NUMERIC_SET_OPERATIONS = (
+    'get_left_intervals', 'get_right_intervals', 'add', 'add_many', 'clear', 'closing',
+    'coalesce', 'copy', 'difference', 'difference_update', 'dilate', 'erode', 'intersection',
+    'intersection_update', 'issubset', 'issuperset', 'opening', 'pop', 'remove',
+    'remove_many', 'simplify', 'symmetric_difference', 'symmetric_difference_update',
+    'union', 'update', 'includes', 'measure', 'count', 'bounds', 'histogram', 'sample',
+    'sample_intervals', 'save', 'read',
+)
+
+
+class OperationStats:
+    """Class for statistics of one operation."""
+
+    def __init__(self):
+        self.calls = 0
+        self.comparisons = 0
+        self.allocations = 0
+        self.elapsed = 0.0
+
+    def get_formatted(self) -> str:
+        """
+        Return formatted statistics as a string.
+
+        :return: statistics as a formatted string
+        """
+        return (f'calls={self.calls} comparisons={self.comparisons} '
+                f'allocations={self.allocations} elapsed={self.elapsed:.6f}s')
+
+
+class Stats:
+    """Class for statistics of all instrumented operations."""
+
+    def __init__(self):
+        self.operations: Dict[str, OperationStats] = {}
+
+    def get(self, operation: str) -> OperationStats:
+        """
+        Return statistics of the operation, such as 'NumericSet.add'.
+
+        :param operation: the name of the operation
+        :return: statistics of the operation
+        """
+        return self.operations.setdefault(operation, OperationStats())
+
+    def reset(self) -> None:
+        """
+        Clear statistics of all operations.
+        """
+        self.operations = {}
+
+    def get_formatted(self) -> str:
+        """
+        Return formatted statistics of all operations, slowest first.
+
+        :return: statistics as a formatted string
+        """
+        operations = sorted(self.operations.items(),
+                            key=lambda item: item[1].elapsed, reverse=True)
+
+        return '\n'.join(f'{name}: {stats.get_formatted()}' for name, stats in operations)
+
+
+class Tracer:
+    """Base class for tracers notified about every instrumented operation."""
+
+    def on_start(self, operation: str) -> None:
+        """
+        Handle the start of an operation.
+
+        :param operation: the name of the operation
+        """
+
+    def on_end(self, operation: str, stats: OperationStats) -> None:
+        """
+        Handle the end of an operation.
+
+        :param operation: the name of the operation
+        :param stats: statistics of this call of the operation
+        """
+
+
+class _CallbackTracer(Tracer):
+    """Tracer that passes finished operations to a callback."""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def on_end(self, operation: str, stats: OperationStats) -> None:
+        self.callback(operation, stats)
+
+
+_stats = None
+_tracer = None
+_originals = []
+_local = threading.local()
+
+
+def _current_calls() -> list:
+    """
+    Return the stack of operations running in the current thread.
+    """
+    if not hasattr(_local, 'calls'):
+        _local.calls = []
+
+    return _local.calls
+
+
+def _wrap_operation(name: str, function):
+    def wrapper(*args, **kwargs):
+        calls = _current_calls()
+        call = OperationStats()
+        call.calls = 1
+        calls.append(call)
+
+        if _tracer is not None:
+            _tracer.on_start(name)
+
+        start = time.perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            call.elapsed = time.perf_counter() - start
+            calls.pop()
+
+            # Add nested counts to the calling operation
+            if calls:
+                calls[-1].comparisons += call.comparisons
+                calls[-1].allocations += call.allocations
+
+            stats = _stats.get(name)
+            stats.calls += 1
+            stats.comparisons += call.comparisons
+            stats.allocations += call.allocations
+            stats.elapsed += call.elapsed
+
+            if _tracer is not None:
+                _tracer.on_end(name, call)
+
+    return wrapper
+
+
+def _wrap_comparison(function):
+    def wrapper(*args, **kwargs):
+        calls = _current_calls()
+
+        if calls:
+            calls[-1].comparisons += 1
+
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def _count_comparisons(count: int) -> None:
+    """
+    Add comparisons made by a merge to the running operation.
+    """
+    calls = _current_calls()
+
+    if calls:
+        calls[-1].comparisons += count
+
+
+def _wrap_coalesce(function):
+    def counted(intervals):
+        for interval in intervals:
+            _count_comparisons(1)
+            yield interval
+
+    def wrapper(intervals):
+        return function(counted(intervals))
+
+    return wrapper
+
+
+def _wrap_subtract(function):
+    def wrapper(intervals, removed):
+        _count_comparisons(len(intervals) + len(removed))
+
+        return function(intervals, removed)
+
+    return wrapper
+
+
+def _wrap_allocation(function):
+    def wrapper(*args, **kwargs):
+        calls = _current_calls()
+
+        if calls:
+            calls[-1].allocations += 1
+
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def _patch(cls, name: str, wrap) -> None:
+    """
+    Replace a method of the class with a wrapper, keeping static methods static.
+    """
+    original = inspect.getattr_static(cls, name)
+
+    if isinstance(original, staticmethod):
+        wrapped = staticmethod(wrap(original.__func__))
+    else:
+        wrapped = wrap(original)
+
+    _originals.append((cls, name, original))
+    setattr(cls, name, wrapped)
+
+
+def enable(tracer=None) -> Stats:
+    """
+    Start collecting statistics of Interval and NumericSet operations.
+    The tracer is either a Tracer or a callable that receives the name
+    and statistics of every finished operation.
+
+    :param tracer: an optional tracer or callback
+    :return: statistics that are updated while instrumentation is enabled
+    """
+    global _stats, _tracer
+
+    if _originals:
+        disable()
+
+    _stats = Stats()
+    if tracer is None or isinstance(tracer, Tracer):
+        _tracer = tracer
+    else:
+        _tracer = _CallbackTracer(tracer)
+
+    for name in NUMERIC_SET_OPERATIONS:
+        _patch(NumericSet, name,
+               lambda function, name=name: _wrap_operation(f'NumericSet.{name}', function))
+
+    for name in INTERVAL_OPERATIONS:
+        _patch(Interval, name,
+               lambda function, name=name: _wrap_operation(f'Interval.{name}', function))
+
+    for name in INTERVAL_COMPARISONS:
+        _patch(Interval, name, _wrap_comparison)
+
+    _patch(Interval, '__init__', _wrap_allocation)
+
+    # Single-pass merges compare cuts of intervals instead of calling their methods
+    _patch(main, '_iter_coalesce', _wrap_coalesce)
+    _patch(main, '_subtract', _wrap_subtract)
+
+    return _stats
+
+
+def disable() -> None:
+    """
+    Stop collecting statistics and restore the original methods.
+    """
+    global _tracer
+
+    while _originals:
+        cls, name, original = _originals.pop()
+        setattr(cls, name, original)
+
+    _tracer = None
+
+
+@contextmanager
+def instrumented(tracer=None):
+    """
+    Enable instrumentation for the duration of a with-block.
+
+    :param tracer: an optional tracer or callback
+    :return: statistics collected inside the block
+    """
+    stats = enable(tracer)
+
+    try:
+        yield stats
+    finally:
+        disable()
@@ -0,0 +1,215 @@
+"""IntegerSet class with methods to work with sets of integers.
+
+    Integers are stored as sorted disjoint closed runs [first, last]
+    packed into two int64 arrays, so a set of ports or identifiers
+    takes 16 bytes per run instead of one Interval object per range.
+
+    IntegerSet methods
+    ----------------
+        runs - iterate over the closed runs of the set
+        cardinality - return the number of integers in the set
+        includes - determine whether the set includes the given integer
+        is_empty - determine whether the set is empty
+        copy - return a copy of the integer set
+        union - return a union of the set and the given set
+        intersection - return an intersection of the set and the given set
+        difference - return the difference between the set and the given set
+        to_numeric_set - convert the set to a numeric set
+        from_numeric_set - construct an integer set from a numeric set
+"""
+
+import math
+from array import array
+from bisect import bisect_right
+from typing import Iterator, Tuple
+
+from numeric_sets.main import Interval, NumericSet
+
+
+class IntegerSet:
+    """Class for performing operations on sets of integers stored as closed runs."""
+
+    def __init__(self, runs=None):
+        """
+        Initialize a set of integers from closed runs (first, last).
+        Runs may be unsorted, overlapping or adjacent.
+        """
+        if runs is None:
+            runs = []
+
+        self.starts = array('q')
+        self.ends = array('q')
+
+        self._extend(sorted((first, last) for first, last in runs if first <= last))
+
+    def _extend(self, runs) -> None:
+        """
+        Append sorted runs to the set, joining overlapping and adjacent ones.
+
+        :param runs: an iterable of runs sorted by their first integers
+        """
+        for first, last in runs:
+            if self.ends and first <= self.ends[-1] + 1:
+                if last > self.ends[-1]:
+                    self.ends[-1] = last
+                continue
+
+            self.starts.append(first)
+            self.ends.append(last)
+
+    def runs(self) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the closed runs of the set in ascending order.
+
+        :return: an iterator of (first, last) pairs
+        """
+        return zip(self.starts, self.ends)
+
+    def cardinality(self) -> int:
+        """
+        Return the number of integers in the set.
+
+        :return: the number of integers
+        """
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def includes(self, point: int) -> bool:
+        """
+        Determine whether the set includes the given integer.
+
+        :param point: an integer
+        :return: True if the set includes the integer, False otherweise
+        """
+        index = bisect_right(self.starts, point) - 1
+
+        return index >= 0 and point <= self.ends[index]
+
+    def is_empty(self) -> bool:
+        """
+        Determine whether the set is empty.
+
+        :return: whether the set is empty
+        """
+        return len(self.starts) == 0
+
+    def copy(self):
+        """
+        Return a copy of the integer set.
+
+        :return: a copy of the integer set
+        """
+        integer_set = IntegerSet()
+        integer_set.starts = array('q', self.starts)
+        integer_set.ends = array('q', self.ends)
+
+        return integer_set
+
+    def union(self, integer_set):
+        """
+        Return a union of the set and the given set.
+
+        :param integer_set: an integer set
+        :return: union of the set and the given set
+        """
+        result = IntegerSet()
+        runs_1, runs_2 = list(self.runs()), list(integer_set.runs())
+        i = j = 0
+
+        while i < len(runs_1) or j < len(runs_2):
+            if j == len(runs_2) or (i < len(runs_1) and runs_1[i] <= runs_2[j]):
+                result._extend([runs_1[i]])
+                i += 1
+            else:
+                result._extend([runs_2[j]])
+                j += 1
+
+        return result
+
+    def intersection(self, integer_set):
+        """
+        Return an intersection of the set and the given set.
+
+        :param integer_set: an integer set
+        :return: intersection of the set and the given set
+        """
+        result = IntegerSet()
+        i = j = 0
+
+        while i < len(self.starts) and j < len(integer_set.starts):
+            first = max(self.starts[i], integer_set.starts[j])
+            last = min(self.ends[i], integer_set.ends[j])
+
+            if first <= last:
+                result.starts.append(first)
+                result.ends.append(last)
+
+            # Move past the run that ends first
+            if self.ends[i] < integer_set.ends[j]:
+                i += 1
+            else:
+                j += 1
+
+        return result
+
+    def difference(self, integer_set):
+        """
+        Return the difference between the set and the given set.
+
+        :param integer_set: an integer set
+        :return: difference between the set and the given set
+        """
+        result = IntegerSet()
+        j = 0
+
+        for first, last in self.runs():
+            # Skip runs of the given set that end before the current run
+            while j < len(integer_set.starts) and integer_set.ends[j] < first:
+                j += 1
+
+            k = j
+
+            while k < len(integer_set.starts) and integer_set.starts[k] <= last:
+                if integer_set.starts[k] > first:
+                    result.starts.append(first)
+                    result.ends.append(integer_set.starts[k] - 1)
+
+                first = integer_set.ends[k] + 1
+                k += 1
+
+            if first <= last:
+                result.starts.append(first)
+                result.ends.append(last)
+
+        return result
+
+    def to_numeric_set(self) -> NumericSet:
+        """
+        Convert the set to a numeric set of closed intervals.
+
+        :return: the numeric set
+        """
+        return NumericSet([Interval(first, last, True, True) for first, last in self.runs()])
+
+    @staticmethod
+    def from_numeric_set(numeric_set: NumericSet):
+        """
+        Construct a set of all integers included in the numeric set.
+
+        :param numeric_set: a numeric set
+        :return: the integer set
+        """
+        runs = []
+
+        for interval in numeric_set.intervals:
+            first = math.ceil(interval.start)
+            last = math.floor(interval.end)
+
+            if first == interval.start and not interval.is_start_inclusive:
+                first += 1
+
+            if last == interval.end and not interval.is_end_inclusive:
+                last -= 1
+
+            runs.append((first, last))
+
+        return IntegerSet(runs)
@@ -0,0 +1,59 @@
+"""Overlap join between two collections of labeled numeric intervals.
+
+    Functions
+    ----------------
+        overlap_join - yield every overlapping pair of labeled intervals
+"""
+
+from typing import Iterable, Iterator, Tuple
+
+from numeric_sets.main import Interval, _lower_cut, _upper_cut
+
+
+def overlap_join(left: Iterable[Tuple[Interval, object]], right: Iterable[Tuple[Interval, object]],
+                 with_intersection: bool = False) -> Iterator[tuple]:
+    """
+    Yield every pair of labeled intervals from the two collections whose
+    intersection is not empty. Intervals are swept in the order of their
+    starts, so the join takes O((n + m) log(n + m) + k) time for k pairs.
+
+    :param left: an iterable of (interval, payload) pairs
+    :param right: an iterable of (interval, payload) pairs
+    :param with_intersection: whether to add the intersection to each pair
+    :return: an iterator of (left, right) or (left, right, intersection) tuples
+    """
+    events = []
+
+    for side, items in enumerate((left, right)):
+        for item in items:
+            lower, upper = _lower_cut(item[0]), _upper_cut(item[0])
+
+            # Skip empty intervals
+            if lower < upper:
+                events.append((lower, side, upper, item))
+
+    events.sort(key=lambda event: event[0])
+
+    # Intervals that started before the current one and may still overlap later ones
+    active = ([], [])
+
+    for lower, side, upper, item in events:
+        other_active = []
+
+        for other_upper, other_item in active[1 - side]:
+            # Intervals that end before the current start cannot overlap any
+            # later interval, so they are dropped from the active list
+            if other_upper <= lower:
+                continue
+
+            other_active.append((other_upper, other_item))
+
+            left_item, right_item = (item, other_item) if side == 0 else (other_item, item)
+
+            if with_intersection:
+                yield left_item, right_item, Interval.intersection(left_item[0], right_item[0])
+            else:
+                yield left_item, right_item
+
+        active[1 - side][:] = other_active
+        active[side].append((upper, item))
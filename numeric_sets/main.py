@@ -11,11 +11,14 @@
         intersection - return the intersection of two given intervals
         union - return the union of two given intervals
 
+    Delta - intervals added to and removed from the coverage of a set
+
     NumericSet methods
     ----------------
         get_left_intervals - construct a list of intervals to the left from the interval
         get_right_intervals - construct a list of intervals to the right from the interval
         add - add a numeric interval to the set
+        add_many - add a batch of numeric intervals to the set
         clear - clear the set from all numeric intervals
         copy - return a copy of the numric set
         difference - return the difference between the set and the given set
@@ -26,15 +29,40 @@
         issuperset - determine whether the set is a superset of the given set
         pop - remove the rightmost interval if such exists
         remove - remove a numeric interval from the numeric set
+        remove_many - remove a batch of numeric intervals from the numeric set
         symmetric_difference - return the symmetric difference of two sets
         symmetric_difference_update - assign set to the symmetric difference of two sets
         union - return a union of the set and the given set
         update - assign set to the union of it and the given set
+        includes - determine whether the set includes the given point
+        coalesce - merge intervals separated by narrow gaps
+        simplify - close the narrowest gaps to fit a budget of intervals
+        dilate - return a set with every interval expanded by a margin
+        erode - return a set with every interval shrunk by a margin
+        opening - return the set eroded and then dilated by a margin
+        closing - return the set dilated and then eroded by a margin
+        measure - return the total length of the intervals of the set
+        count - return the number of intervals of the set
+        bounds - return the smallest start and the largest end of the set
+        to_arrays - return the intervals of the set as NumPy arrays
+        from_arrays - construct a numeric set from arrays
+        histogram - return coverage and interval counts per bin
+        sample - draw points uniformly from the measure of the set
+        sample_intervals - draw intervals weighted by their lengths
         is_empty - determine whether a set of intervals is empty
         save - save a set of numeric intervals in the given file
         read - read a set of numerical intervals from the given file
+        add_from - add numeric intervals from an asynchronous iterable
+        aread - asynchronously read a set of numerical intervals from a file or a stream
+        subscribe - call a function with the delta of every mutation of the set
+        unsubscribe - stop calling a subscribed function
 """
 
+import asyncio
+import functools
+import heapq
+import os
+from itertools import islice
 from typing import List
 from numbers import Number
 
@@ -252,15 +280,383 @@ class Interval:
         return NumericSet([result])
 
 
+def _lower_cut(interval: Interval) -> tuple:
+    """
+    Return the position of the interval start on the line of cuts.
+    A cut (x, 0) lies just before the point x and (x, 1) lies just after it.
+
+    :param interval: a numeric interval
+    :return: the lower cut of the interval
+    """
+    return (interval.start, 0 if interval.is_start_inclusive else 1)
+
+
+def _upper_cut(interval: Interval) -> tuple:
+    """
+    Return the position of the interval end on the line of cuts.
+
+    :param interval: a numeric interval
+    :return: the upper cut of the interval
+    """
+    return (interval.end, 1 if interval.is_end_inclusive else 0)
+
+
+def _length(interval: Interval):
+    """
+    Return the length of an interval.
+    """
+    return interval.end - interval.start
+
+
+def _total_length(intervals):
+    """
+    Return the sum of lengths of intervals, or None if there are none.
+    The sum starts from the first length, so timedelta lengths of datetime
+    intervals are summed as well as numbers.
+    """
+    total = None
+
+    for interval in intervals:
+        total = _length(interval) if total is None else total + _length(interval)
+
+    return total
+
+
+def _from_cuts(lower: tuple, upper: tuple) -> Interval:
+    """
+    Construct an interval that spans between two cuts.
+
+    :param lower: the lower cut
+    :param upper: the upper cut
+    :return: a numeric interval
+    """
+    return Interval(lower[0], upper[0], lower[1] == 0, upper[1] == 1)
+
+
+def _iter_coalesce(intervals):
+    """
+    Merge intervals sorted by their starts into disjoint intervals.
+    Overlapping and almost overlapping intervals are joined, empty ones are dropped.
+    Intervals with equal starts may come in any order of inclusivity.
+
+    :param intervals: an iterable of numeric intervals sorted by their starts
+    :return: an iterator of sorted disjoint intervals
+    """
+    lower = upper = None
+
+    for interval in intervals:
+        interval_lower, interval_upper = _lower_cut(interval), _upper_cut(interval)
+
+        if interval_lower >= interval_upper:
+            continue
+
+        if upper is not None and interval_lower <= upper:
+            # An interval with the same start may still include the start point
+            lower = min(lower, interval_lower)
+            upper = max(upper, interval_upper)
+            continue
+
+        if upper is not None:
+            yield _from_cuts(lower, upper)
+
+        lower, upper = interval_lower, interval_upper
+
+    if upper is not None:
+        yield _from_cuts(lower, upper)
+
+
+def _coalesce(intervals) -> List[Interval]:
+    """
+    Merge intervals sorted by their starts into a list of disjoint intervals.
+
+    :param intervals: an iterable of numeric intervals sorted by their starts
+    :return: a sorted list of disjoint intervals
+    """
+    return list(_iter_coalesce(intervals))
+
+
+def _subtract(intervals: List[Interval], removed: List[Interval]) -> List[Interval]:
+    """
+    Subtract one sorted list of disjoint intervals from another one in a single pass.
+
+    :param intervals: a sorted list of disjoint intervals
+    :param removed: a sorted list of disjoint intervals to subtract
+    :return: a sorted list of disjoint intervals
+    """
+    result = []
+    j = 0
+
+    for interval in intervals:
+        lower, upper = _lower_cut(interval), _upper_cut(interval)
+
+        # Skip removed intervals that end before the current interval
+        while j < len(removed) and _upper_cut(removed[j]) <= lower:
+            j += 1
+
+        k = j
+
+        if k == len(removed) or _lower_cut(removed[k]) >= upper:
+            result.append(interval)
+            continue
+
+        while k < len(removed) and _lower_cut(removed[k]) < upper:
+            removed_lower = _lower_cut(removed[k])
+
+            if removed_lower > lower:
+                result.append(_from_cuts(lower, removed_lower))
+
+            lower = max(lower, _upper_cut(removed[k]))
+            k += 1
+
+        if lower < upper:
+            result.append(_from_cuts(lower, upper))
+
+    return result
+
+
+def _close_gaps(intervals: List[Interval], is_closed) -> List[Interval]:
+    """
+    Join neighbouring intervals of a sorted list of disjoint intervals across selected gaps.
+
+    :param intervals: a sorted list of disjoint intervals
+    :param is_closed: a function of the index and the width of a gap that selects it
+    :return: a sorted list of disjoint intervals
+    """
+    result = []
+
+    for index, interval in enumerate(intervals):
+        if result and is_closed(index - 1, interval.start - intervals[index - 1].end):
+            result[-1] = _from_cuts(_lower_cut(result[-1]), _upper_cut(interval))
+        else:
+            result.append(interval)
+
+    return result
+
+
+def _parse_interval(raw_interval: str, parse=float):
+    """
+    Parse an interval formatted by Interval.get_formatted.
+    Return None if the line is blank.
+
+    :param raw_interval: a formatted interval
+    :param parse: a function that converts a formatted endpoint to a value
+    :return: a numeric interval
+    """
+    # remove '\n' at the end of the line
+    raw_interval = raw_interval.strip()
+
+    if not raw_interval:
+        return None
+
+    # remove parentheses, split into parts
+    bounds = raw_interval[1:-1].split(', ')
+
+    if len(bounds) == 1:
+        start = end = parse(bounds[0])
+    else:
+        start, end = map(parse, bounds)
+
+    is_start_inclusive = raw_interval[0] == '['
+    is_end_inclusive = raw_interval[-1] == ']'
+
+    return Interval(start, end, is_start_inclusive, is_end_inclusive)
+
+
+async def _aiter_file_lines(filename, batch_size: int):
+    """
+    Asynchronously iterate over lines of the file, reading them
+    in batches in the default executor.
+
+    :param filename: the name of the file
+    :param batch_size: the number of lines read at once
+    """
+    loop = asyncio.get_running_loop()
+    input_file = await loop.run_in_executor(None, open, filename, 'r')
+
+    try:
+        while True:
+            lines = await loop.run_in_executor(
+                None, list, islice(input_file, batch_size))
+
+            if not lines:
+                break
+
+            for line in lines:
+                yield line
+    finally:
+        input_file.close()
+
+
+async def _aiter_parsed(lines, parse=float):
+    """
+    Asynchronously parse formatted intervals, skipping blank lines.
+
+    :param lines: an asynchronous iterable of formatted intervals as str or bytes
+    :param parse: a function that converts a formatted endpoint to a value
+    """
+    async for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode()
+
+        interval = _parse_interval(line, parse)
+
+        if interval is not None:
+            yield interval
+
+
+class Delta:
+    """Class for intervals added to and removed from the coverage of a set by a mutation."""
+
+    def __init__(self, added: List[Interval], removed: List[Interval]):
+        self.added = added
+        self.removed = removed
+
+    def is_empty(self) -> bool:
+        """
+        Determine whether the mutation left the coverage of the set unchanged.
+
+        :return: whether the delta is empty
+        """
+        return not self.added and not self.removed
+
+
+def _notifies(method):
+    """
+    Make a mutating method of NumericSet drop cached indexes of the set
+    and pass its delta to the subscribers of the set.
+    Mutations called by another mutation are reported as part of the outer one.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._subscribers or self._is_mutating:
+            result = method(self, *args, **kwargs)
+            self._changed()
+
+            return result
+
+        self._is_mutating = True
+
+        try:
+            old_intervals = _coalesce(self.intervals)
+            result = method(self, *args, **kwargs)
+            self._changed()
+            new_intervals = _coalesce(self.intervals)
+        finally:
+            self._is_mutating = False
+
+        delta = Delta(_subtract(new_intervals, old_intervals),
+                      _subtract(old_intervals, new_intervals))
+
+        if not delta.is_empty():
+            for callback in list(self._subscribers):
+                callback(delta)
+
+        return result
+
+    return wrapper
+
+
 class NumericSet:
     """Class for performing operations on sets of numeric intervals."""
 
-    def __init__(self, intervals=None):
+    def __init__(self, intervals=None, deferred: bool = False, buffer_size: int = 4096):
+        """
+        Initialize a set of numeric intervals.
+        In deferred mode, add and remove only append to a pending buffer,
+        which is normalized into the intervals on the next read or once
+        it holds more than buffer_size changes.
+        """
         if intervals is None:
             intervals = []
 
+        self.deferred = deferred
+        self.buffer_size = buffer_size
+        self._subscribers = []
+        self._is_mutating = False
         self.intervals = sorted(intervals, key=lambda interval: interval.start)
 
+    @property
+    def intervals(self) -> List[Interval]:
+        """
+        Sorted list of disjoint intervals of the set.
+        Intervals of a set made by from_arrays are constructed on first access,
+        and pending changes are normalized before the list is returned.
+        """
+        if self._intervals is None:
+            from numeric_sets import vectorized
+
+            self._intervals = vectorized.to_intervals(self._arrays)
+            self._arrays = None
+
+        if self._pending:
+            self._normalize()
+
+        return self._intervals
+
+    @intervals.setter
+    def intervals(self, intervals: List[Interval]) -> None:
+        self._intervals = intervals
+        self._arrays = None
+        self._pending = []
+        self._measure = None
+        self._changed()
+
+    def _changed(self) -> None:
+        """
+        Drop indexes that were computed from the intervals of the set.
+        """
+        self._sampling_index = None
+
+    def _replaced(self, measure, removed: List[Interval], added: List[Interval]) -> None:
+        """
+        Keep the measure of the set known after some of its intervals were replaced.
+
+        :param measure: the measure of the set before the replacement, None if unknown
+        :param removed: the intervals that were removed from the list
+        :param added: the intervals that were added to the list
+        """
+        if measure is not None:
+            for interval in removed:
+                measure -= _length(interval)
+
+            for interval in added:
+                measure += _length(interval)
+
+            self._measure = measure
+
+    def _normalize(self) -> None:
+        """
+        Apply pending changes to the intervals, merging runs of
+        consecutive additions or removals in a single pass each.
+        """
+        pending, self._pending = self._pending, []
+        start = 0
+
+        for end in range(1, len(pending) + 1):
+            if end < len(pending) and pending[end][0] == pending[start][0]:
+                continue
+
+            batch = [interval for _, interval in pending[start:end]]
+
+            if pending[start][0]:
+                self.add_many(batch)
+            else:
+                self.remove_many(batch)
+
+            start = end
+
+    def _defer(self, is_addition: bool, interval: Interval) -> None:
+        """
+        Append a change to the pending buffer, normalizing it once it is full.
+
+        :param is_addition: whether the interval is added or removed
+        :param interval: a numeric interval
+        """
+        self._pending.append((is_addition, interval))
+
+        if len(self._pending) > self.buffer_size:
+            self._normalize()
+
     def get_left_intervals(self, interval: Interval) -> List[Interval]:
         """
         Construct a list of intervals that are to the left from the given interval.
@@ -291,15 +687,21 @@ class NumericSet:
 
         return right
 
+    @_notifies
     def add(self, new_interval: Interval) -> None:
         """
         Add a numeric interval to the set.
 
         :param interval: a numeric interval
         """
+        if self.deferred:
+            self._defer(True, new_interval)
+            return
+
         # If there are no other intervals, simply add the interval
         if self.is_empty():
             self.intervals.append(new_interval)
+            self._replaced(self._measure, [], [new_interval])
             return
 
         # If interval should be the leftmost one and does not
@@ -308,6 +710,7 @@ class NumericSet:
                 not new_interval.is_overlapping(self.intervals[0]) and
                 not new_interval.is_almost_overlapping(self.intervals[0])):
             self.intervals.insert(0, new_interval)
+            self._replaced(self._measure, [], [new_interval])
             return
 
         # If interval should be the right one and does not
@@ -316,6 +719,7 @@ class NumericSet:
                 not new_interval.is_overlapping(self.intervals[-1]) and
                 not new_interval.is_almost_overlapping(self.intervals[-1])):
             self.intervals.append(new_interval)
+            self._replaced(self._measure, [], [new_interval])
             return
 
         new_start, new_end = new_interval.start, new_interval.end
@@ -342,8 +746,49 @@ class NumericSet:
         updated_interval = Interval(
             new_start, new_end, is_start_inclusive, is_end_inclusive)
 
+        measure = self._measure
+        middle = self.intervals[len(left):len(self.intervals) - len(right)]
+
         self.intervals = left + [updated_interval] + right
+        self._replaced(measure, middle, [updated_interval])
+
+    @_notifies
+    def add_many(self, intervals) -> None:
+        """
+        Add a batch of numeric intervals to the set.
+        The batch is sorted and merged with the set in a single pass.
+
+        :param intervals: an iterable of numeric intervals
+        """
+        batch = sorted(intervals, key=_lower_cut)
 
+        self.intervals = _coalesce(
+            heapq.merge(self.intervals, batch, key=_lower_cut))
+
+    async def add_from(self, intervals, batch_size: int = 1024) -> None:
+        """
+        Add numeric intervals from an asynchronous iterable to the set.
+        Intervals are merged into the set in batches, and control is
+        returned to the event loop between batches.
+
+        :param intervals: an asynchronous iterable of numeric intervals
+        :param batch_size: the number of intervals merged at once
+        """
+        batch = []
+
+        async for interval in intervals:
+            batch.append(interval)
+
+            if len(batch) >= batch_size:
+                self.add_many(batch)
+                batch = []
+
+                await asyncio.sleep(0)
+
+        if batch:
+            self.add_many(batch)
+
+    @_notifies
     def clear(self) -> None:
         """
         Clear the set from all numeric intervals.
@@ -354,7 +799,8 @@ class NumericSet:
         """
         Return a copy of the numric set.
         """
-        return NumericSet([interval.copy() for interval in self.intervals])
+        return NumericSet([interval.copy() for interval in self.intervals],
+                          self.deferred, self.buffer_size)
 
     def difference(self, numeric_set) -> None:
         """
@@ -369,6 +815,7 @@ class NumericSet:
 
         return updated_set
 
+    @_notifies
     def difference_update(self, numeric_set) -> None:
         """
         Calculate difference between the set and the
@@ -376,8 +823,7 @@ class NumericSet:
 
         :param numeric_set: a numeric set
         """
-        for interval in numeric_set.intervals:
-            self.remove(interval)
+        self.remove_many(numeric_set.intervals)
 
     def intersection(self, numeric_set):
         """
@@ -391,6 +837,7 @@ class NumericSet:
 
         return updated_set
 
+    @_notifies
     def intersection_update(self, numeric_set) -> None:
         """
         Calculate intersection of the set and the
@@ -427,6 +874,7 @@ class NumericSet:
         """
         return numeric_set.issubset(self)
 
+    @_notifies
     def pop(self) -> Interval:
         """
         Remove the rightmost interval if such exists.
@@ -437,14 +885,22 @@ class NumericSet:
         if self.is_empty():
             return None
 
-        return self.intervals.pop()
+        interval = self.intervals.pop()
+        self._replaced(self._measure, [interval], [])
+
+        return interval
 
+    @_notifies
     def remove(self, interval: Interval) -> None:
         """
         Remove a numeric interval from the set.
 
         :param interval: a numeric interval
         """
+        if self.deferred:
+            self._defer(False, interval)
+            return
+
         # All intervals located to the left from the new interval
         left = self.get_left_intervals(interval)
 
@@ -463,7 +919,20 @@ class NumericSet:
 
             middle += diff.intervals
 
+        measure = self._measure
         self.intervals = left + middle + right
+        self._replaced(measure, middle_intervals, middle)
+
+    @_notifies
+    def remove_many(self, intervals) -> None:
+        """
+        Remove a batch of numeric intervals from the set.
+        The batch is sorted, coalesced and subtracted from the set in a single pass.
+
+        :param intervals: an iterable of numeric intervals
+        """
+        self.intervals = _subtract(
+            self.intervals, _coalesce(sorted(intervals, key=_lower_cut)))
 
     def symmetric_difference(self, numeric_set):
         """
@@ -474,6 +943,7 @@ class NumericSet:
         """
         return self.difference(numeric_set).union(numeric_set.difference(self))
 
+    @_notifies
     def symmetric_difference_update(self, numeric_set):
         """
         Find a set with the symmetric difference of two sets
@@ -496,6 +966,7 @@ class NumericSet:
 
         return updated_set
 
+    @_notifies
     def update(self, numeric_set) -> None:
         """
         Find a union of the set and the given set of numeric intervals
@@ -503,8 +974,196 @@ class NumericSet:
 
         :param numeric_set: a numeric set
         """
-        for interval in numeric_set.intervals:
-            self.add(interval)
+        self.add_many(numeric_set.intervals)
+
+    @_notifies
+    def coalesce(self, max_gap: Number) -> None:
+        """
+        Merge neighbouring intervals separated by gaps no wider than max_gap.
+
+        :param max_gap: the widest gap that is closed
+        """
+        if max_gap < 0:
+            raise ValueError('max_gap must not be negative')
+
+        self.intervals = _close_gaps(
+            self.intervals, lambda index, gap: gap <= max_gap)
+
+    @_notifies
+    def simplify(self, max_intervals: int):
+        """
+        Close the narrowest gaps until the set has at most max_intervals intervals.
+        Gaps of equal width are closed from left to right.
+
+        :param max_intervals: the maximum number of intervals
+        :return: the measure added to the set by closing gaps
+        """
+        if max_intervals < 1:
+            raise ValueError('max_intervals must be positive')
+
+        intervals = self.intervals
+        gaps = [intervals[index + 1].start - intervals[index].end
+                for index in range(len(intervals) - 1)]
+
+        closed = set(sorted(range(len(gaps)), key=gaps.__getitem__)
+                     [:max(0, len(intervals) - max_intervals)])
+
+        self.intervals = _close_gaps(intervals, lambda index, gap: index in closed)
+
+        return sum(gaps[index] for index in closed)
+
+    def _morphed(self, start_offset: Number, end_offset: Number):
+        """
+        Return a set with the starts and ends of intervals moved by the offsets.
+        Intervals that become empty are dropped and the rest are re-merged in a single pass.
+        """
+        intervals = []
+
+        for interval in self.intervals:
+            lower, upper = _lower_cut(interval), _upper_cut(interval)
+            lower = (lower[0] + start_offset, lower[1])
+            upper = (upper[0] + end_offset, upper[1])
+
+            if lower < upper:
+                intervals.append(_from_cuts(lower, upper))
+
+        numeric_set = NumericSet()
+        numeric_set.intervals = _coalesce(intervals)
+
+        return numeric_set
+
+    def dilate(self, margin: Number):
+        """
+        Return a set with every interval expanded by the margin on both sides.
+        Intervals that come to overlap or touch are merged.
+
+        :param margin: a non-negative margin
+        :return: the dilated set
+        """
+        if margin < 0:
+            raise ValueError('margin must not be negative')
+
+        return self._morphed(-margin, margin)
+
+    def erode(self, margin: Number):
+        """
+        Return a set with every interval shrunk by the margin on both sides.
+        Intervals that become empty are dropped.
+
+        :param margin: a non-negative margin
+        :return: the eroded set
+        """
+        if margin < 0:
+            raise ValueError('margin must not be negative')
+
+        return self._morphed(margin, -margin)
+
+    def opening(self, margin: Number):
+        """
+        Return the set eroded and then dilated by the margin.
+        Intervals narrower than twice the margin are removed.
+
+        :param margin: a non-negative margin
+        :return: the opened set
+        """
+        return self.erode(margin).dilate(margin)
+
+    def closing(self, margin: Number):
+        """
+        Return the set dilated and then eroded by the margin.
+        Gaps narrower than twice the margin are closed.
+
+        :param margin: a non-negative margin
+        :return: the closed set
+        """
+        return self.dilate(margin).erode(margin)
+
+    def includes(self, point: Number) -> bool:
+        """
+        Determine whether the set includes the given point.
+
+        :param point: a numeric point
+        :return: True if the set includes the given point, False otherweise
+        """
+        intervals = self.intervals
+        low, high = 0, len(intervals)
+
+        # Find the first interval that starts to the right from the point
+        while low < high:
+            middle = (low + high) // 2
+
+            if intervals[middle].start <= point:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low > 0 and intervals[low - 1].includes(point)
+
+    def _held_arrays(self):
+        """
+        Return the arrays of a set made by from_arrays whose intervals were not built yet.
+
+        :return: a tuple of starts, ends and inclusivity flags, or None
+        """
+        if self._intervals is None and not self._pending:
+            return self._arrays
+
+        return None
+
+    def measure(self):
+        """
+        Return the total length of the intervals of the set.
+        The measure is computed once and then kept up to date by add, remove and pop,
+        so it is only recomputed after other mutations. Sets made by from_arrays are
+        measured from their arrays.
+
+        :return: the sum of lengths of the intervals, 0 for an empty set
+        """
+        if self._pending:
+            self._normalize()
+
+        if self._measure is None:
+            arrays = self._held_arrays()
+
+            if arrays is not None:
+                self._measure = (arrays[1] - arrays[0]).sum().item()
+            else:
+                # An empty set is not cached, so that a later timedelta is not added to 0
+                self._measure = _total_length(self.intervals)
+
+        return 0 if self._measure is None else self._measure
+
+    def count(self) -> int:
+        """
+        Return the number of intervals of the set.
+
+        :return: the number of intervals
+        """
+        arrays = self._held_arrays()
+
+        if arrays is not None:
+            return len(arrays[0])
+
+        return len(self.intervals)
+
+    def bounds(self) -> tuple:
+        """
+        Return the smallest start and the largest end of the intervals of the set.
+        Return None if the set is empty.
+
+        :return: a tuple of the smallest start and the largest end
+        """
+        arrays = self._held_arrays()
+
+        if arrays is not None:
+            return (arrays[0][0].item(), arrays[1][-1].item()) if len(arrays[0]) else None
+
+        intervals = self.intervals
+
+        if not intervals:
+            return None
+
+        return intervals[0].start, intervals[-1].end
 
     def is_empty(self) -> bool:
         """
@@ -512,7 +1171,146 @@ class NumericSet:
 
         :return: whether the set is empty
         """
-        return len(self.intervals) == 0
+        return self.count() == 0
+
+    def to_arrays(self) -> tuple:
+        """
+        Return the intervals of the set as NumPy arrays.
+        Arrays of a set made by from_arrays are returned without copying
+        as long as its intervals have not been accessed.
+
+        :return: a tuple of starts, ends and inclusivity flags
+        """
+        from numeric_sets import vectorized
+
+        arrays = self._held_arrays()
+
+        if arrays is not None:
+            return arrays
+
+        return vectorized.to_arrays(self.intervals)
+
+    @staticmethod
+    def from_arrays(starts, ends, is_start_inclusive, is_end_inclusive,
+                    trusted: bool = False):
+        """
+        Construct a numeric set from arrays or other objects supporting the buffer protocol.
+        Interval objects are only constructed when the intervals of the set are accessed.
+        Trusted arrays must already be sorted and disjoint and are used as they are.
+
+        :param starts: starts of the intervals
+        :param ends: ends of the intervals
+        :param is_start_inclusive: whether starts of the intervals are inclusive
+        :param is_end_inclusive: whether ends of the intervals are inclusive
+        :param trusted: whether to skip validation and sorting
+        :return: the numeric set
+        """
+        from numeric_sets import vectorized
+
+        numeric_set = NumericSet()
+
+        if trusted:
+            arrays = vectorized.as_arrays(starts, ends, is_start_inclusive, is_end_inclusive)
+        else:
+            arrays = vectorized.validate(starts, ends, is_start_inclusive, is_end_inclusive)
+
+            if not vectorized.is_canonical(arrays):
+                numeric_set.add_many(vectorized.to_intervals(arrays))
+                return numeric_set
+
+        numeric_set._intervals = None
+        numeric_set._arrays = arrays
+
+        return numeric_set
+
+    def histogram(self, edges) -> tuple:
+        """
+        Return how much of each bin [edges[i], edges[i + 1]) the set covers
+        and how many intervals of the set include a point of each bin.
+
+        :param edges: a sorted NumPy array of bin edges
+        :return: a tuple of coverage and count arrays with one value per bin
+        """
+        from numeric_sets import vectorized
+
+        return vectorized.histogram(self.to_arrays(), edges)
+
+    def _get_sampling_index(self) -> tuple:
+        """
+        Return the starts of the intervals and the measure covered before each of them.
+        The index is computed once after every change of the set.
+        """
+        import numpy as np
+
+        if self._sampling_index is None:
+            starts, ends, _, _ = self.to_arrays()
+            self._sampling_index = starts, np.concatenate(([0], np.cumsum(ends - starts)))
+
+        return self._sampling_index
+
+    def _sample_indexes(self, k: int, rng) -> tuple:
+        """
+        Draw k offsets uniformly from the measure of the set and find their intervals.
+
+        :return: a tuple of indexes of intervals and offsets within them
+        """
+        import numpy as np
+
+        starts, cumulative = self._get_sampling_index()
+
+        if cumulative[-1] <= 0:
+            raise ValueError('Cannot sample from a set of zero measure')
+
+        offsets = np.random.default_rng(rng).random(k) * cumulative[-1]
+        indexes = np.minimum(np.searchsorted(cumulative, offsets, 'right') - 1, len(starts) - 1)
+
+        return indexes, offsets - cumulative[indexes]
+
+    def sample(self, k: int, rng=None):
+        """
+        Draw k points uniformly from the measure covered by the set.
+        The points are located in a cached index of cumulative lengths with one searchsorted.
+
+        :param k: the number of points
+        :param rng: a NumPy random generator or a seed
+        :return: a NumPy array of points
+        """
+        indexes, offsets = self._sample_indexes(k, rng)
+        starts, _ = self._get_sampling_index()
+
+        return starts[indexes] + offsets
+
+    def sample_intervals(self, k: int, rng=None) -> List[Interval]:
+        """
+        Draw k intervals of the set with probabilities proportional to their lengths.
+
+        :param k: the number of intervals
+        :param rng: a NumPy random generator or a seed
+        :return: a list of numeric intervals
+        """
+        indexes, _ = self._sample_indexes(k, rng)
+        intervals = self.intervals
+
+        return [intervals[index] for index in indexes.tolist()]
+
+    def subscribe(self, callback) -> None:
+        """
+        Call a function with the Delta of every mutation that changes the coverage of the set.
+        Deltas are computed by comparing the set before and after the mutation,
+        so subscribed sets in deferred mode normalize pending changes on every mutation.
+        Direct assignments to intervals are not reported.
+
+        :param callback: a function that receives a Delta
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        """
+        Stop calling a subscribed function.
+
+        :param callback: a subscribed function
+        """
+        self._subscribers.remove(callback)
 
     def save(self, filename: str = 'result.txt') -> None:
         """
@@ -521,37 +1319,74 @@ class NumericSet:
 
         :param filename: the name of the file
         """
+        if self._intervals is None and not self._pending:
+            from numeric_sets import vectorized
+
+            # Intervals of a set made by from_arrays are formatted without being constructed
+            text = vectorized.format_text(self._arrays)
+        else:
+            text = ''.join([interval.get_formatted() + '\n' for interval in self.intervals])
+
         with open(filename, 'w') as output_file:
-            for interval in self.intervals:
-                output_file.write(interval.get_formatted() + '\n')
+            output_file.write(text)
 
     @ staticmethod
-    def read(filename: str):
+    def read(filename: str, parse=float):
         """
         Read a set of numerical intervals from the given file and return a numeric set.
+        Endpoints are read as floats unless another parse function is given,
+        such as int for integer timestamps or datetime.fromisoformat, so [1, 2)
+        reads as [1.0, 2.0) by default and keeps integer endpoints only with int.
+        With NumPy installed, files of int or float endpoints are parsed in bulk
+        into arrays, and intervals are only constructed when they are accessed.
 
         :param filename: the name of the file
+        :param parse: a function that converts a formatted endpoint to a value
         :return: the numeric set
         """
+        if parse in (int, float):
+            try:
+                from numeric_sets import vectorized
+            except ImportError:
+                vectorized = None
+
+            if vectorized is not None:
+                with open(filename, 'rb') as input_file:
+                    data = input_file.read()
+
+                # Files the bulk parser rejects are read line by line below
+                try:
+                    return NumericSet.from_arrays(*vectorized.parse_text(data, parse))
+                except ValueError:
+                    pass
+
         numeric_set = NumericSet()
 
         with open(filename, 'r') as input_file:
-            for raw_interval in input_file.readlines():
-                # remove '\n' at the end of the line, remove parentheses, split into parts
-                raw_interval = raw_interval.rstrip()[1:-1].split(', ')
+            intervals = [_parse_interval(raw_interval, parse) for raw_interval in input_file]
 
-                if not raw_interval:
-                    continue
+        numeric_set.add_many(interval for interval in intervals if interval is not None)
 
-                if len(raw_interval) == 1:
-                    start = end = float(raw_interval[0])
-                else:
-                    start, end = map(float, raw_interval)
+        return numeric_set
+
+    @staticmethod
+    async def aread(source, batch_size: int = 1024, parse=float):
+        """
+        Asynchronously read a set of numerical intervals and return a numeric set.
+        The source is either the name of a file or an asynchronous iterable
+        of formatted intervals, such as asyncio.StreamReader.
 
-                is_start_inclusive = raw_interval[0] == '['
-                is_end_inclusive = raw_interval[-1] == ']'
+        :param source: the name of the file or an asynchronous iterable of lines
+        :param batch_size: the number of intervals merged at once
+        :param parse: a function that converts a formatted endpoint to a value
+        :return: the numeric set
+        """
+        if isinstance(source, (str, os.PathLike)):
+            lines = _aiter_file_lines(source, batch_size)
+        else:
+            lines = source
 
-                numeric_set.add(
-                    Interval(start, end, is_start_inclusive, is_end_inclusive))
+        numeric_set = NumericSet()
+        await numeric_set.add_from(_aiter_parsed(lines, parse), batch_size)
 
         return numeric_set
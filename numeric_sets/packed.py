@@ -0,0 +1,168 @@
+"""Packed binary layout of the intervals of a numeric set.
+
+    A packed set starts with a 16-byte header holding the typecode of
+    the endpoints ('q' for int64 or 'd' for float64) and the number of
+    intervals n. It is followed by n starts, n ends and n flag bytes,
+    where bit 0 marks an inclusive start and bit 1 an inclusive end.
+    Endpoints are stored in native byte order and stay 8-byte aligned.
+
+    Functions
+    ----------------
+        get_typecode - return the typecode that represents endpoints exactly
+        get_size - return the size of a packed set in bytes
+        pack_into - pack intervals into a writable buffer
+        unpack_views - return memoryviews of the arrays of a packed set
+        save - save a numeric set in a packed binary file
+        read - read a numeric set from a packed binary file
+        iter_read - lazily read intervals from a memory-mapped packed binary file
+"""
+
+import mmap
+import struct
+from array import array
+from typing import Iterator, List
+
+from numeric_sets.main import Interval, NumericSet
+
+
+_HEADER = struct.Struct('=c7xq')
+
+IS_START_INCLUSIVE = 1
+IS_END_INCLUSIVE = 2
+
+
+def get_typecode(intervals: List[Interval]) -> str:
+    """
+    Return 'q' if all endpoints are integers and 'd' otherwise.
+
+    :param intervals: a list of numeric intervals
+    :return: the typecode of the endpoints
+    """
+    for interval in intervals:
+        if not isinstance(interval.start, int) or not isinstance(interval.end, int):
+            return 'd'
+
+    return 'q'
+
+
+def get_size(count: int) -> int:
+    """
+    Return the size of a packed set of intervals in bytes.
+
+    :param count: the number of intervals
+    :return: the size in bytes
+    """
+    return _HEADER.size + count * 17
+
+
+def pack_into(buffer, intervals: List[Interval], typecode: str = None) -> None:
+    """
+    Pack intervals into a writable buffer of at least get_size(len(intervals)) bytes.
+
+    :param buffer: a writable object supporting the buffer protocol
+    :param intervals: a list of numeric intervals
+    :param typecode: 'q' or 'd', chosen by get_typecode by default
+    """
+    if typecode is None:
+        typecode = get_typecode(intervals)
+
+    count = len(intervals)
+    _HEADER.pack_into(buffer, 0, typecode.encode(), count)
+
+    typecode, starts, ends, flags = unpack_views(buffer)
+
+    starts[:] = array(typecode, [interval.start for interval in intervals])
+    ends[:] = array(typecode, [interval.end for interval in intervals])
+    flags[:] = bytes(IS_START_INCLUSIVE * interval.is_start_inclusive
+                     | IS_END_INCLUSIVE * interval.is_end_inclusive for interval in intervals)
+
+    for view in (starts, ends, flags):
+        view.release()
+
+
+def unpack_views(buffer) -> tuple:
+    """
+    Return memoryviews of the starts, ends and flags of a packed set.
+    The views share memory with the buffer and must be released before it is closed.
+
+    :param buffer: an object supporting the buffer protocol
+    :return: a tuple of the typecode, starts, ends and flags
+    """
+    typecode, count = _HEADER.unpack_from(buffer, 0)
+    typecode = typecode.decode()
+
+    if typecode not in ('q', 'd'):
+        raise ValueError(f'Unknown typecode of a packed set: {typecode!r}')
+
+    view = memoryview(buffer)
+    offset = _HEADER.size
+
+    starts = view[offset:offset + 8 * count].cast(typecode)
+    ends = view[offset + 8 * count:offset + 16 * count].cast(typecode)
+    flags = view[offset + 16 * count:offset + 17 * count]
+
+    return typecode, starts, ends, flags
+
+
+def save(numeric_set: NumericSet, filename: str) -> None:
+    """
+    Save a numeric set in a packed binary file.
+    Integer endpoints, such as nanosecond timestamps, are stored as int64 and stay exact.
+
+    :param numeric_set: a numeric set
+    :param filename: the name of the file
+    """
+    intervals = numeric_set.intervals
+    buffer = bytearray(get_size(len(intervals)))
+    pack_into(buffer, intervals)
+
+    with open(filename, 'wb') as output_file:
+        output_file.write(buffer)
+
+
+def read(filename: str) -> NumericSet:
+    """
+    Read a numeric set from a packed binary file.
+
+    :param filename: the name of the file
+    :return: the numeric set
+    """
+    with open(filename, 'rb') as input_file:
+        buffer = input_file.read()
+
+    typecode, starts, ends, flags = unpack_views(buffer)
+
+    intervals = [Interval(start, end, bool(flag & IS_START_INCLUSIVE),
+                          bool(flag & IS_END_INCLUSIVE))
+                 for start, end, flag in zip(starts.tolist(), ends.tolist(), flags.tolist())]
+
+    numeric_set = NumericSet()
+    numeric_set.add_many(intervals)
+
+    return numeric_set
+
+
+def iter_read(filename: str) -> Iterator[Interval]:
+    """
+    Lazily read intervals from a packed binary file.
+    The file is memory-mapped, so only the pages that are read are loaded.
+
+    :param filename: the name of the file
+    :return: an iterator of numeric intervals
+    """
+    with open(filename, 'rb') as input_file:
+        buffer = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    typecode, starts, ends, flags = unpack_views(buffer)
+
+    try:
+        for index in range(len(starts)):
+            flag = flags[index]
+
+            yield Interval(starts[index], ends[index], bool(flag & IS_START_INCLUSIVE),
+                           bool(flag & IS_END_INCLUSIVE))
+    finally:
+        for view in (starts, ends, flags):
+            view.release()
+
+        buffer.close()
@@ -0,0 +1,453 @@
+"""Asyncio server that answers queries about named numeric sets.
+
+    A server loads numeric sets once and keeps their intervals and arrays
+    in memory, so short-lived client processes can query a large set
+    without reading it at startup. Clients connect over a Unix socket or
+    localhost TCP and send one JSON request per line:
+
+        {"id": 1, "op": "includes", "set": "allowed", "point": 4.5}
+
+    and receive one JSON response per line with the same id and either
+    a "result" or an "error". Requests of a connection are answered
+    concurrently, so responses may come out of order.
+
+    Point queries that arrive in the same iteration of the event loop are
+    answered together with one binary search over the arrays of the set.
+    It requires NumPy (pip install numeric_sets_dyaroshevych[numpy]).
+
+    Operations
+    ----------------
+        includes - whether the set includes the point
+        slice - intervals of the set within the closed range [start, end]
+        measure - the total length of the intervals of the set
+        count - the number of intervals of the set
+        bounds - the smallest start and the largest end of the set
+        union, intersection, difference, symmetric_difference - the result
+            of the operation between the set and another named set or a list
+            of formatted intervals
+        sets - the names of the loaded sets
+
+    Intervals are sent as strings formatted by Interval.get_formatted.
+
+    Usage
+    ----------------
+        python -m numeric_sets.server --unix /tmp/sets.sock allowed=allowed.txt
+
+    Functions and classes
+    ----------------
+        NumericSetServer - server of queries about named numeric sets
+        Client - client that sends concurrent requests to a server
+        serve - load numeric sets from files and serve them until interrupted
+"""
+
+import argparse
+import asyncio
+import json
+from bisect import bisect_left, bisect_right
+from typing import Dict
+
+import numpy as np
+
+from numeric_sets import packed, vectorized
+from numeric_sets.main import Interval, NumericSet, _parse_interval
+
+
+OPERATIONS = ('union', 'intersection', 'difference', 'symmetric_difference')
+
+
+def _formatted(numeric_set: NumericSet) -> list:
+    return [interval.get_formatted() for interval in numeric_set.intervals]
+
+
+class NumericSetServer:
+    """Class for serving queries about named numeric sets."""
+
+    def __init__(self, numeric_sets: Dict[str, NumericSet]):
+        """
+        Initialize a server of the given sets by their names.
+        """
+        self.numeric_sets = dict(numeric_sets)
+        self.batches = 0
+        self._arrays = {}
+        self._starts = {}
+        self._ends = {}
+        self._pending = {}
+        self._is_flush_scheduled = False
+        self._server = None
+
+        for name, numeric_set in self.numeric_sets.items():
+            intervals = numeric_set.intervals
+            self._arrays[name] = numeric_set.to_arrays()
+            self._starts[name] = [interval.start for interval in intervals]
+            self._ends[name] = [interval.end for interval in intervals]
+
+    async def start(self, path: str = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Start accepting connections on a Unix socket or on a TCP port.
+
+        :param path: the path of the Unix socket, TCP is used if it is None
+        :param host: the host of the TCP server
+        :param port: the TCP port, 0 picks a free one
+        :return: the asyncio server
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+
+        return self._server
+
+    async def close(self) -> None:
+        """
+        Stop accepting connections and wait until the server is closed.
+        """
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._server is not None:
+            await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Answer the requests of a connection until the client closes it.
+        """
+        tasks = set()
+
+        try:
+            # Buffered lines are read without yielding, so pipelined point queries are batched
+            async for line in reader:
+                if not line.strip():
+                    continue
+
+                task = asyncio.ensure_future(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+                await writer.drain()
+
+            if tasks:
+                await asyncio.wait(tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        """
+        Answer a single request and write the response.
+        """
+        request_id = None
+
+        try:
+            request = json.loads(line)
+
+            if not isinstance(request, dict):
+                raise TypeError('a request must be a JSON object')
+
+            request_id = request.get('id')
+            response = {'id': request_id, 'result': await self.query(request)}
+        except Exception as error:
+            # Every request gets a reply, so a client never waits for a failed one
+            response = {'id': request_id, 'error': f'{type(error).__name__}: {error}'}
+
+        if not writer.is_closing():
+            writer.write(json.dumps(response).encode() + b'\n')
+
+    async def query(self, request: dict):
+        """
+        Answer a request given as a dictionary.
+
+        :param request: a dictionary with the operation and its arguments
+        :return: the result of the operation
+        """
+        operation = request['op']
+
+        if operation == 'sets':
+            return sorted(self.numeric_sets)
+
+        name = request['set']
+        numeric_set = self.numeric_sets[name]
+
+        if operation == 'includes':
+            return await self.includes(name, request['point'])
+
+        if operation == 'slice':
+            return self._slice(name, request['start'], request['end'])
+
+        if operation in ('measure', 'count', 'bounds'):
+            return getattr(numeric_set, operation)()
+
+        if operation in OPERATIONS:
+            if 'other' in request:
+                other = self.numeric_sets[request['other']]
+            else:
+                other = NumericSet()
+                other.add_many(self._parse_intervals(request['intervals']))
+
+            return _formatted(getattr(numeric_set, operation)(other))
+
+        raise ValueError(f'unknown operation {operation!r}')
+
+    @staticmethod
+    def _parse_intervals(raw_intervals) -> list:
+        """
+        Parse a list of formatted intervals sent by a client.
+        """
+        if not isinstance(raw_intervals, list) or \
+                not all(isinstance(raw_interval, str) for raw_interval in raw_intervals):
+            raise TypeError('intervals must be a list of formatted intervals')
+
+        intervals = [_parse_interval(raw_interval) for raw_interval in raw_intervals]
+
+        if None in intervals:
+            raise ValueError('intervals must not be blank')
+
+        return intervals
+
+    def includes(self, name: str, point) -> asyncio.Future:
+        """
+        Return a future that is resolved with whether the named set includes the point.
+        Points queued before the next iteration of the event loop are checked in one batch.
+
+        :param name: the name of a loaded set
+        :param point: a numeric point
+        :return: a future of a boolean
+        """
+        if name not in self.numeric_sets:
+            raise KeyError(name)
+
+        # A bad point is rejected here so that it does not fail the whole batch
+        if isinstance(point, bool) or not isinstance(point, (int, float)):
+            raise TypeError(f'point must be a number, not {type(point).__name__}')
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        points, futures = self._pending.setdefault(name, ([], []))
+        points.append(point)
+        futures.append(future)
+
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            loop.call_soon(self._flush)
+
+        return future
+
+    def _flush(self) -> None:
+        """
+        Resolve all queued point queries with one vectorized search per set.
+        """
+        pending, self._pending = self._pending, {}
+        self._is_flush_scheduled = False
+
+        for name, (points, futures) in pending.items():
+            self.batches += 1
+            results = self._includes(self._arrays[name], points)
+
+            for future, result in zip(futures, results.tolist()):
+                if not future.done():
+                    future.set_result(result)
+
+    @staticmethod
+    def _includes(arrays: tuple, points: list) -> np.ndarray:
+        """
+        Determine whether sorted disjoint intervals include the given points.
+        """
+        starts = arrays[0]
+        points = np.asarray(points)
+
+        if not len(starts):
+            return np.zeros(len(points), dtype=bool)
+
+        # The only interval that may include a point is the last one starting at or before it
+        indexes = np.searchsorted(starts, points, side='right') - 1
+        candidates = tuple(array[np.maximum(indexes, 0)] for array in arrays)
+
+        return (indexes >= 0) & vectorized.includes(candidates, points)
+
+    def _slice(self, name: str, start, end) -> list:
+        """
+        Return the formatted intervals of the named set within the closed range [start, end].
+        """
+        intervals = self.numeric_sets[name].intervals
+        low = bisect_left(self._ends[name], start)
+        high = bisect_right(self._starts[name], end)
+
+        candidates = NumericSet()
+        candidates.intervals = intervals[low:high]
+
+        return _formatted(candidates.intersection(NumericSet([Interval(start, end, True, True)])))
+
+
+class Client:
+    """Class for sending concurrent requests to a NumericSetServer."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Initialize a client of an open connection.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._futures = {}
+        self._next_id = 0
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @staticmethod
+    async def connect(path: str = None, host: str = '127.0.0.1', port: int = None):
+        """
+        Connect to a server on a Unix socket or on a TCP port.
+
+        :param path: the path of the Unix socket, TCP is used if it is None
+        :param host: the host of the TCP server
+        :param port: the TCP port
+        :return: the client
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+
+        return Client(reader, writer)
+
+    async def _receive(self) -> None:
+        """
+        Resolve the futures of requests with the responses of the server.
+        """
+        try:
+            async for line in self._reader:
+                response = json.loads(line)
+                future = self._futures.pop(response['id'], None)
+
+                if future is None or future.done():
+                    continue
+
+                if 'error' in response:
+                    future.set_exception(ValueError(response['error']))
+                else:
+                    future.set_result(response['result'])
+        finally:
+            for future in self._futures.values():
+                if not future.done():
+                    future.set_exception(ConnectionError('connection closed'))
+
+            self._futures.clear()
+
+    async def request(self, operation: str, **arguments):
+        """
+        Send a request and wait for its result.
+        Errors reported by the server are raised as ValueError.
+
+        :param operation: the name of the operation
+        :param arguments: the arguments of the operation
+        :return: the result of the operation
+        """
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._futures[request_id] = future
+
+        self._writer.write(json.dumps({'id': request_id, 'op': operation, **arguments})
+                           .encode() + b'\n')
+        await self._writer.drain()
+
+        return await future
+
+    async def includes(self, name: str, point) -> bool:
+        """
+        Determine whether the named set includes the given point.
+
+        :param name: the name of a set of the server
+        :param point: a numeric point
+        :return: True if the set includes the point, False otherwise
+        """
+        return await self.request('includes', set=name, point=point)
+
+    async def slice(self, name: str, start, end) -> list:
+        """
+        Return the formatted intervals of the named set within the closed range [start, end].
+
+        :param name: the name of a set of the server
+        :param start: the start of the range
+        :param end: the end of the range
+        :return: a list of formatted intervals
+        """
+        return await self.request('slice', set=name, start=start, end=end)
+
+    async def measure(self, name: str):
+        """
+        Return the total length of the intervals of the named set.
+
+        :param name: the name of a set of the server
+        :return: the measure of the set
+        """
+        return await self.request('measure', set=name)
+
+    async def close(self) -> None:
+        """
+        Close the connection.
+        """
+        self._writer.close()
+        await self._writer.wait_closed()
+        await asyncio.gather(self._receiver, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+async def serve(filenames: Dict[str, str], path: str = None, host: str = '127.0.0.1',
+                port: int = 0, parse=float, binary: bool = False) -> None:
+    """
+    Load numeric sets from files and serve them until the task is cancelled.
+
+    :param filenames: names of files by the names of the sets
+    :param path: the path of the Unix socket, TCP is used if it is None
+    :param host: the host of the TCP server
+    :param port: the TCP port
+    :param parse: a function that converts a formatted endpoint to a value
+    :param binary: whether the files are written by packed.save
+    """
+    numeric_sets = {name: packed.read(filename) if binary else NumericSet.read(filename, parse)
+                    for name, filename in filenames.items()}
+
+    async with NumericSetServer(numeric_sets) as server:
+        asyncio_server = await server.start(path, host, port)
+        await asyncio_server.serve_forever()
+
+
+def main(argv=None) -> None:
+    """
+    Run the server from the command line.
+
+    :param argv: command-line arguments, sys.argv[1:] by default
+    """
+    parser = argparse.ArgumentParser(prog='python -m numeric_sets.server',
+                                     description='Serve queries about named numeric sets.')
+    parser.add_argument('sets', nargs='+', metavar='name=file')
+    parser.add_argument('--unix', help='the path of the Unix socket')
+    parser.add_argument('--host', default='127.0.0.1', help='the host of the TCP server')
+    parser.add_argument('--port', type=int, default=7878, help='the TCP port')
+    parser.add_argument('--parse', choices=('float', 'int'), default='float',
+                        help='the type of endpoints of text files')
+    parser.add_argument('--binary', action='store_true', help='read packed binary files')
+    args = parser.parse_args(argv)
+
+    if not all('=' in spec for spec in args.sets):
+        parser.error('sets must be given as name=file')
+
+    filenames = dict(spec.split('=', 1) for spec in args.sets)
+    parse = {'float': float, 'int': int}[args.parse]
+
+    try:
+        asyncio.run(serve(filenames, args.unix, args.host, args.port, parse, args.binary))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""Numeric sets published in shared memory for worker processes.
+
+    publish packs the intervals of a numeric set into a block of
+    multiprocessing.shared_memory using the layout of the packed module.
+    Worker processes attach to the block by its name and get a read-only
+    SharedNumericSet that answers membership queries with a binary search
+    over the packed arrays and builds Interval objects only on access.
+    A SharedNumericSet is pickled as the name of its block, so passing
+    it to a pool task does not copy the intervals.
+
+    The process that published a set owns the block and must unlink it
+    once workers are done with it.
+
+    Functions and classes
+    ----------------
+        SharedNumericSet - read-only view of a numeric set in shared memory
+        publish - copy a numeric set into a new shared memory block
+        attach - attach to a numeric set published by another process
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+
+from numeric_sets import packed
+from numeric_sets.main import Interval, NumericSet
+
+
+class _IntervalsView(Sequence):
+    """Sequence of intervals built on access from packed arrays."""
+
+    def __init__(self, starts, ends, flags):
+        self.starts = starts
+        self.ends = ends
+        self.flags = flags
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        flags = self.flags[index]
+
+        return Interval(self.starts[index], self.ends[index],
+                        bool(flags & packed.IS_START_INCLUSIVE),
+                        bool(flags & packed.IS_END_INCLUSIVE))
+
+
+class SharedNumericSet:
+    """Class for a read-only view of a numeric set stored in shared memory."""
+
+    def __init__(self, shared_memory_block: shared_memory.SharedMemory):
+        """
+        Initialize a view of the numeric set packed into the shared memory block.
+        """
+        self.shared_memory = shared_memory_block
+
+        buffer = self.shared_memory.buf.toreadonly()
+        self.typecode, starts, ends, flags = packed.unpack_views(buffer)
+        self._views = [buffer, starts, ends, flags]
+
+        self.intervals = _IntervalsView(starts, ends, flags)
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the shared memory block.
+        """
+        return self.shared_memory.name
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __getitem__(self, index):
+        """
+        Return the interval at the index, or a list of intervals for a slice.
+        """
+        return self.intervals[index]
+
+    def __reduce__(self):
+        return attach, (self.name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def includes(self, point) -> bool:
+        """
+        Determine whether the set includes the given point.
+        Only the interval found by a binary search over the starts is constructed.
+
+        :param point: a numeric point
+        :return: True if the set includes the point, False otherweise
+        """
+        index = bisect_right(self.intervals.starts, point)
+
+        return index > 0 and self.intervals[index - 1].includes(point)
+
+    def is_empty(self) -> bool:
+        """
+        Determine whether the set is empty.
+
+        :return: whether the set is empty
+        """
+        return len(self.intervals) == 0
+
+    def to_numeric_set(self) -> NumericSet:
+        """
+        Copy the intervals into a numeric set of the current process.
+
+        :return: the numeric set
+        """
+        return NumericSet(list(self.intervals))
+
+    def __del__(self):
+        # Views must be released before the block is closed by its own finalizer
+        self._release_views()
+
+    def _release_views(self) -> None:
+        self.intervals = _IntervalsView((), (), ())
+
+        while self._views:
+            self._views.pop().release()
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block.
+        The set cannot be used after it is closed.
+        """
+        self._release_views()
+        self.shared_memory.close()
+
+    def unlink(self) -> None:
+        """
+        Free the shared memory block. Only the publishing process should call it.
+        """
+        self.shared_memory.unlink()
+
+
+def publish(numeric_set: NumericSet, name: str = None) -> SharedNumericSet:
+    """
+    Copy a numeric set into a new shared memory block.
+    Endpoints are stored as int64 if all of them are integers and as float64 otherwise.
+
+    :param numeric_set: a numeric set
+    :param name: an optional name of the block, chosen by the system by default
+    :return: a view of the published set
+    """
+    intervals = numeric_set.intervals
+    shared_memory_block = shared_memory.SharedMemory(
+        name, create=True, size=packed.get_size(len(intervals)))
+
+    try:
+        packed.pack_into(shared_memory_block.buf, intervals)
+    except BaseException:
+        shared_memory_block.close()
+        shared_memory_block.unlink()
+        raise
+
+    return SharedNumericSet(shared_memory_block)
+
+
+def attach(name: str) -> SharedNumericSet:
+    """
+    Attach to a numeric set published by another process.
+
+    :param name: the name of the shared memory block
+    :return: a read-only view of the set
+    """
+    return SharedNumericSet(shared_memory.SharedMemory(name))
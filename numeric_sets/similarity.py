@@ -0,0 +1,238 @@
+"""Similarity metrics between numeric sets.
+
+    Every metric walks the sorted intervals of both sets once with two
+    pointers, so neither the intersection nor the union is constructed.
+    Measures ignore the inclusivity of endpoints, and the Hausdorff
+    distance is that of the closures of the sets.
+
+    Functions
+    ----------------
+        intersection_measure - return the measure of the intersection of two sets
+        union_measure - return the measure of the union of two sets
+        jaccard - return the Jaccard similarity of two sets
+        hausdorff - return the Hausdorff distance between two sets
+        similarity_matrix - return a metric for all pairs of sets
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from numeric_sets.main import NumericSet
+
+
+def intersection_measure(numeric_set_1: NumericSet, numeric_set_2: NumericSet):
+    """
+    Return the measure of the intersection of two sets in a single pass.
+
+    :param numeric_set_1: a numeric set
+    :param numeric_set_2: a numeric set
+    :return: the total length of the intersection
+    """
+    intervals_1, intervals_2 = numeric_set_1.intervals, numeric_set_2.intervals
+    measure = None
+    i = j = 0
+
+    while i < len(intervals_1) and j < len(intervals_2):
+        start = max(intervals_1[i].start, intervals_2[j].start)
+        end = min(intervals_1[i].end, intervals_2[j].end)
+
+        # The sum starts from the first length, so timedelta lengths are summed too
+        if end > start:
+            measure = end - start if measure is None else measure + (end - start)
+
+        # Move past the interval that ends first
+        if intervals_1[i].end < intervals_2[j].end:
+            i += 1
+        else:
+            j += 1
+
+    return 0 if measure is None else measure
+
+
+def _union_measure(measure_1, measure_2, intersection):
+    """
+    Return the measure of a union, skipping zero terms that may not add to timedeltas.
+    """
+    if not measure_1:
+        return measure_2
+
+    if not measure_2:
+        return measure_1
+
+    if not intersection:
+        return measure_1 + measure_2
+
+    return measure_1 + measure_2 - intersection
+
+
+def union_measure(numeric_set_1: NumericSet, numeric_set_2: NumericSet):
+    """
+    Return the measure of the union of two sets.
+
+    :param numeric_set_1: a numeric set
+    :param numeric_set_2: a numeric set
+    :return: the total length of the union
+    """
+    return _union_measure(numeric_set_1.measure(), numeric_set_2.measure(),
+                          intersection_measure(numeric_set_1, numeric_set_2))
+
+
+def jaccard(numeric_set_1: NumericSet, numeric_set_2: NumericSet) -> float:
+    """
+    Return the measure of the intersection of two sets divided by the measure of their union.
+    Two sets of zero measure are considered identical.
+
+    :param numeric_set_1: a numeric set
+    :param numeric_set_2: a numeric set
+    :return: the Jaccard similarity between 0 and 1
+    """
+    intersection = intersection_measure(numeric_set_1, numeric_set_2)
+    union = _union_measure(numeric_set_1.measure(), numeric_set_2.measure(), intersection)
+
+    if not union:
+        return 1.0
+
+    if not intersection:
+        return 0.0
+
+    return intersection / union
+
+
+def _gaps(intervals) -> list:
+    """
+    Return the gaps around and between sorted disjoint intervals as (start, end) pairs.
+    """
+    if not intervals:
+        return [(-math.inf, math.inf)]
+
+    gaps = [(-math.inf, intervals[0].start)]
+    gaps += [(intervals[index].end, intervals[index + 1].start)
+             for index in range(len(intervals) - 1)]
+    gaps.append((intervals[-1].end, math.inf))
+
+    return gaps
+
+
+def _farthest(start, end, gap_start, gap_end):
+    """
+    Return the largest distance from a point of [start, end] inside the gap to its ends.
+    """
+    if gap_start == -math.inf:
+        return gap_end - start
+
+    if gap_end == math.inf:
+        return end - gap_start
+
+    middle = (gap_start + gap_end) / 2
+
+    if start <= middle <= end:
+        return (gap_end - gap_start) / 2
+
+    point = end if end < middle else start
+
+    return min(point - gap_start, gap_end - point)
+
+
+def _directed_hausdorff(intervals_1, intervals_2):
+    """
+    Return the largest distance from a point of the first intervals to the second ones.
+    """
+    gaps = _gaps(intervals_2)
+    distance = 0
+    j = 0
+
+    for interval in intervals_1:
+        # Skip gaps that end before the interval
+        while gaps[j][1] < interval.start:
+            j += 1
+
+        k = j
+
+        while k < len(gaps) and gaps[k][0] <= interval.end:
+            start, end = max(interval.start, gaps[k][0]), min(interval.end, gaps[k][1])
+
+            if start <= end:
+                distance = max(distance, _farthest(start, end, *gaps[k]))
+
+            k += 1
+
+    return distance
+
+
+def hausdorff(numeric_set_1: NumericSet, numeric_set_2: NumericSet):
+    """
+    Return the Hausdorff distance between the closures of two sets.
+    The distance is infinite if exactly one of the sets is empty.
+
+    :param numeric_set_1: a numeric set
+    :param numeric_set_2: a numeric set
+    :return: the largest distance from a point of one set to the other set
+    """
+    intervals_1, intervals_2 = numeric_set_1.intervals, numeric_set_2.intervals
+
+    if not intervals_1 and not intervals_2:
+        return 0
+
+    if not intervals_1 or not intervals_2:
+        return math.inf
+
+    return max(_directed_hausdorff(intervals_1, intervals_2),
+               _directed_hausdorff(intervals_2, intervals_1))
+
+
+_worker_sets = None
+_worker_metric = None
+
+
+def _init_worker(numeric_sets, metric) -> None:
+    global _worker_sets, _worker_metric
+
+    _worker_sets = numeric_sets
+    _worker_metric = metric
+
+
+def _row(index: int) -> list:
+    """
+    Return the metric between the set at the index and every set after it.
+    """
+    return [_worker_metric(_worker_sets[index], _worker_sets[other])
+            for other in range(index + 1, len(_worker_sets))]
+
+
+def similarity_matrix(numeric_sets: List[NumericSet], metric=jaccard,
+                      max_workers: int = None) -> List[list]:
+    """
+    Return a symmetric matrix of a metric between all pairs of sets.
+    Rows are computed in a process pool that receives the sets once per worker.
+    With max_workers=1 the matrix is computed in the current process.
+
+    :param numeric_sets: a list of numeric sets
+    :param metric: a picklable function of two sets, jaccard by default
+    :param max_workers: the number of worker processes, the number of CPUs by default
+    :return: a list of rows of the matrix
+    """
+    count = len(numeric_sets)
+
+    if max_workers == 1:
+        _init_worker(numeric_sets, metric)
+
+        try:
+            rows = [_row(index) for index in range(count)]
+        finally:
+            _init_worker(None, None)
+    else:
+        with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                                 initargs=(numeric_sets, metric)) as executor:
+            rows = list(executor.map(_row, range(count), chunksize=max(1, count // 64)))
+
+    matrix = [[None] * count for _ in range(count)]
+
+    for index in range(count):
+        matrix[index][index] = metric(numeric_sets[index], numeric_sets[index])
+
+        for offset, value in enumerate(rows[index]):
+            matrix[index][index + 1 + offset] = value
+            matrix[index + 1 + offset][index] = value
+
+    return matrix
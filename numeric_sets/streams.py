@@ -0,0 +1,194 @@
+"""Set operations over sorted streams of numeric intervals.
+
+    The functions take iterables of intervals sorted by their starts,
+    such as files written by NumericSet.save, and lazily yield sorted
+    disjoint intervals of the result. Input intervals may overlap or touch,
+    and intervals with equal starts may come in any order.
+    Only the current interval of every input is kept in memory, so
+    streams larger than the available memory can be combined.
+    An input that is not sorted raises ValueError.
+
+    Functions
+    ----------------
+        iter_read - lazily read numeric intervals from the given file
+        iter_save - save a stream of numeric intervals in the given file
+        iter_coalesce - merge a sorted stream into disjoint intervals
+        iter_union - return a union of sorted streams
+        iter_intersection - return an intersection of sorted streams
+        iter_difference - return the difference between two sorted streams
+        iter_symmetric_difference - return the symmetric difference of two sorted streams
+"""
+
+import heapq
+from typing import Iterable, Iterator
+
+from numeric_sets.main import (
+    Interval, _from_cuts, _iter_coalesce, _lower_cut, _parse_interval, _upper_cut)
+
+
+def iter_read(filename: str, parse=float) -> Iterator[Interval]:
+    """
+    Lazily read numeric intervals from the given file line by line.
+
+    :param filename: the name of the file
+    :param parse: a function that converts a formatted endpoint to a value
+    :return: an iterator of numeric intervals
+    """
+    with open(filename, 'r') as input_file:
+        for raw_interval in input_file:
+            interval = _parse_interval(raw_interval, parse)
+
+            if interval is not None:
+                yield interval
+
+
+def iter_save(intervals: Iterable[Interval], filename: str) -> None:
+    """
+    Save a stream of numeric intervals in the given file.
+
+    :param intervals: an iterable of numeric intervals
+    :param filename: the name of the file
+    """
+    with open(filename, 'w') as output_file:
+        for interval in intervals:
+            output_file.write(interval.get_formatted() + '\n')
+
+
+def _check_sorted(intervals: Iterable[Interval]) -> Iterator[Interval]:
+    """
+    Pass intervals through, raising ValueError if they are not sorted by their starts.
+    """
+    previous = None
+
+    for interval in intervals:
+        if previous is not None and interval.start < previous.start:
+            raise ValueError(f'Interval {interval.get_formatted()} follows '
+                             f'{previous.get_formatted()} in a sorted stream')
+
+        previous = interval
+
+        yield interval
+
+
+def iter_coalesce(intervals: Iterable[Interval]) -> Iterator[Interval]:
+    """
+    Merge a sorted stream of intervals into disjoint intervals.
+
+    :param intervals: an iterable of numeric intervals sorted by their starts
+    :return: an iterator of sorted disjoint intervals
+    """
+    return _iter_coalesce(_check_sorted(intervals))
+
+
+def _boundaries(intervals: Iterable[Interval]):
+    """
+    Yield cuts where the coverage of a coalesced stream changes.
+    """
+    for interval in iter_coalesce(intervals):
+        yield _lower_cut(interval)
+        yield _upper_cut(interval)
+
+
+def _sweep(streams, predicate, required=()) -> Iterator[Interval]:
+    """
+    Sweep over cuts of all streams and yield intervals where
+    the predicate of their coverage holds.
+
+    :param streams: a list of iterables of sorted intervals
+    :param predicate: a function of the list of coverage flags of the streams
+    :param required: indices of streams without which the predicate never holds
+    :return: an iterator of sorted disjoint intervals
+    """
+    boundaries = [_boundaries(stream) for stream in streams]
+    is_covered = [False] * len(streams)
+    is_inside = False
+    lower = None
+
+    # The next cut of every stream that is not exhausted
+    events = []
+
+    for index, stream_boundaries in enumerate(boundaries):
+        cut = next(stream_boundaries, None)
+
+        if cut is None:
+            if index in required:
+                return
+        else:
+            events.append((cut, index))
+
+    heapq.heapify(events)
+
+    while events:
+        cut = events[0][0]
+        is_exhausted = False
+
+        # All streams that change their coverage at the same cut are updated together
+        while events and events[0][0] == cut:
+            _, index = heapq.heappop(events)
+            is_covered[index] = not is_covered[index]
+
+            next_cut = next(boundaries[index], None)
+
+            if next_cut is not None:
+                heapq.heappush(events, (next_cut, index))
+            elif index in required:
+                is_exhausted = True
+
+        is_now_inside = predicate(is_covered)
+
+        if is_now_inside and not is_inside:
+            lower = cut
+        elif is_inside and not is_now_inside:
+            yield _from_cuts(lower, cut)
+
+        is_inside = is_now_inside
+
+        # The predicate cannot hold once a required stream is over
+        if is_exhausted:
+            return
+
+
+def iter_union(*streams: Iterable[Interval]) -> Iterator[Interval]:
+    """
+    Return a union of sorted streams of intervals.
+
+    :param streams: iterables of numeric intervals sorted by their starts
+    :return: an iterator of sorted disjoint intervals
+    """
+    return _sweep(streams, any)
+
+
+def iter_intersection(*streams: Iterable[Interval]) -> Iterator[Interval]:
+    """
+    Return an intersection of sorted streams of intervals.
+
+    :param streams: iterables of numeric intervals sorted by their starts
+    :return: an iterator of sorted disjoint intervals
+    """
+    return _sweep(streams, all, range(len(streams)))
+
+
+def iter_difference(stream_1: Iterable[Interval],
+                    stream_2: Iterable[Interval]) -> Iterator[Interval]:
+    """
+    Return the difference between two sorted streams of intervals.
+
+    :param stream_1: an iterable of numeric intervals sorted by their starts
+    :param stream_2: an iterable of numeric intervals sorted by their starts
+    :return: an iterator of sorted disjoint intervals
+    """
+    return _sweep([stream_1, stream_2],
+                  lambda is_covered: is_covered[0] and not is_covered[1], (0,))
+
+
+def iter_symmetric_difference(stream_1: Iterable[Interval],
+                              stream_2: Iterable[Interval]) -> Iterator[Interval]:
+    """
+    Return the symmetric difference of two sorted streams of intervals.
+
+    :param stream_1: an iterable of numeric intervals sorted by their starts
+    :param stream_2: an iterable of numeric intervals sorted by their starts
+    :return: an iterator of sorted disjoint intervals
+    """
+    return _sweep([stream_1, stream_2],
+                  lambda is_covered: is_covered[0] != is_covered[1])
@@ -0,0 +1,93 @@
+"""Conversions between datetime endpoints and int64 nanosecond timestamps.
+
+    Intervals and numeric sets accept any ordered endpoints, including
+    datetime and timedelta values. Converting them to integer nanoseconds
+    keeps them exact and makes comparisons as cheap as for plain integers,
+    and such sets are saved by the packed module as int64 values.
+    Naive datetime values are treated as UTC.
+
+    Functions
+    ----------------
+        to_nanoseconds - convert a datetime, timedelta or integer to nanoseconds
+        to_datetime - convert nanoseconds since the epoch to a datetime
+        to_timedelta - convert nanoseconds to a timedelta
+        map_endpoints - return a numeric set with converted endpoints
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from numeric_sets.main import Interval, NumericSet
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_nanoseconds(value) -> int:
+    """
+    Convert a datetime to nanoseconds since the epoch and a timedelta to nanoseconds.
+    Integers are returned unchanged.
+
+    :param value: a datetime, timedelta or integer
+    :return: the number of nanoseconds
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+
+        value = value - EPOCH
+
+    if isinstance(value, timedelta):
+        return value // _MICROSECOND * 1000
+
+    if isinstance(value, int):
+        return value
+
+    raise TypeError(f'Cannot convert {type(value).__name__} to nanoseconds')
+
+
+def to_datetime(nanoseconds: int, tz=timezone.utc) -> datetime:
+    """
+    Convert nanoseconds since the epoch to a datetime.
+    Nanoseconds below one microsecond are truncated.
+
+    :param nanoseconds: the number of nanoseconds since the epoch
+    :param tz: the time zone of the result, or None for a naive UTC datetime
+    :return: the datetime
+    """
+    value = EPOCH + timedelta(microseconds=nanoseconds // 1000)
+
+    if tz is None:
+        return value.replace(tzinfo=None)
+
+    return value.astimezone(tz)
+
+
+def to_timedelta(nanoseconds: int) -> timedelta:
+    """
+    Convert nanoseconds to a timedelta.
+    Nanoseconds below one microsecond are truncated.
+
+    :param nanoseconds: the number of nanoseconds
+    :return: the timedelta
+    """
+    return timedelta(microseconds=nanoseconds // 1000)
+
+
+def map_endpoints(numeric_set: NumericSet, function) -> NumericSet:
+    """
+    Return a numeric set with every endpoint converted by a non-decreasing function,
+    such as to_nanoseconds or to_datetime.
+
+    :param numeric_set: a numeric set
+    :param function: a function that converts an endpoint
+    :return: the converted numeric set
+    """
+    converted_set = NumericSet()
+    converted_set.add_many(
+        Interval(function(interval.start), function(interval.end),
+                 interval.is_start_inclusive, interval.is_end_inclusive)
+        for interval in numeric_set.intervals)
+
+    return converted_set
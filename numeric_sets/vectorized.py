@@ -0,0 +1,351 @@
+"""Vectorized counterparts of Interval predicates over NumPy arrays.
+
+    Batches of intervals are passed as tuples of four arrays
+    (starts, ends, is_start_inclusive, is_end_inclusive). Arrays of
+    two batches are broadcast against each other, so the functions
+    compare intervals pairwise, one against many or all against all.
+    Every function follows the semantics of the Interval method of the
+    same name, including the rule that a single point is closed.
+
+    Functions
+    ----------------
+        to_arrays - pack a list of intervals into arrays
+        to_intervals - unpack arrays into a list of intervals
+        as_arrays - view buffers of starts, ends and flags as arrays
+        validate - check and normalize arrays of intervals
+        is_canonical - determine whether intervals are sorted and disjoint
+        is_overlapping - determine whether intervals overlap
+        is_almost_overlapping - determine whether intervals almost overlap
+        includes - determine whether intervals include the given points
+        intersection - return intersections of intervals
+        histogram - return coverage and interval counts per bin of a sorted set
+        parse_text - parse intervals formatted by Interval.get_formatted into arrays
+        format_text - format arrays of intervals as lines of Interval.get_formatted
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from numeric_sets.main import Interval
+
+
+def _normalize(intervals) -> tuple:
+    """
+    Convert a batch of intervals to arrays and close single points.
+
+    :param intervals: a tuple of starts, ends and inclusivity flags
+    :return: a tuple of arrays
+    """
+    starts, ends, is_start_inclusive, is_end_inclusive = map(np.asarray, intervals)
+    is_point = starts == ends
+
+    is_start_inclusive = is_start_inclusive.astype(bool) | is_point
+    is_end_inclusive = is_end_inclusive.astype(bool) | is_point
+
+    return starts, ends, is_start_inclusive, is_end_inclusive
+
+
+def to_arrays(intervals: List[Interval]) -> tuple:
+    """
+    Pack a list of intervals into arrays.
+
+    :param intervals: a list of numeric intervals
+    :return: a tuple of starts, ends and inclusivity flags
+    """
+    return (
+        np.array([interval.start for interval in intervals]),
+        np.array([interval.end for interval in intervals]),
+        np.array([interval.is_start_inclusive for interval in intervals], dtype=bool),
+        np.array([interval.is_end_inclusive for interval in intervals], dtype=bool),
+    )
+
+
+def to_intervals(intervals, mask=None) -> List[Interval]:
+    """
+    Unpack arrays into a list of intervals.
+
+    :param intervals: a tuple of starts, ends and inclusivity flags
+    :param mask: an optional boolean array selecting the intervals to unpack
+    :return: a list of numeric intervals
+    """
+    starts, ends, is_start_inclusive, is_end_inclusive = map(np.ravel, intervals)
+
+    if mask is not None:
+        mask = np.ravel(mask)
+        starts, ends = starts[mask], ends[mask]
+        is_start_inclusive = is_start_inclusive[mask]
+        is_end_inclusive = is_end_inclusive[mask]
+
+    values = zip(starts.tolist(), ends.tolist(),
+                 is_start_inclusive.tolist(), is_end_inclusive.tolist())
+
+    return [Interval(*interval_values) for interval_values in values]
+
+
+def as_arrays(starts, ends, is_start_inclusive, is_end_inclusive) -> tuple:
+    """
+    View starts, ends and inclusivity flags as arrays.
+    NumPy arrays and other objects supporting the buffer protocol are not copied.
+
+    :param starts: starts of the intervals
+    :param ends: ends of the intervals
+    :param is_start_inclusive: whether starts of the intervals are inclusive
+    :param is_end_inclusive: whether ends of the intervals are inclusive
+    :return: a tuple of arrays
+    """
+    return (np.asarray(starts), np.asarray(ends),
+            np.asarray(is_start_inclusive, dtype=bool),
+            np.asarray(is_end_inclusive, dtype=bool))
+
+
+def validate(starts, ends, is_start_inclusive, is_end_inclusive) -> tuple:
+    """
+    Check that arrays describe intervals and close single points.
+    Arrays that need no changes are returned without copying.
+
+    :param starts: starts of the intervals
+    :param ends: ends of the intervals
+    :param is_start_inclusive: whether starts of the intervals are inclusive
+    :param is_end_inclusive: whether ends of the intervals are inclusive
+    :return: a tuple of arrays
+    """
+    arrays = as_arrays(starts, ends, is_start_inclusive, is_end_inclusive)
+
+    if any(array.ndim != 1 for array in arrays):
+        raise ValueError('Arrays of intervals must be one-dimensional')
+
+    if len({len(array) for array in arrays}) > 1:
+        raise ValueError('Arrays of intervals must have equal lengths')
+
+    if np.any(arrays[0] > arrays[1]):
+        raise ValueError('Starts of intervals must not exceed their ends')
+
+    starts, ends, is_start_inclusive, is_end_inclusive = arrays
+
+    # Flags are only copied when a single point is not closed yet
+    if np.any((starts == ends) & ~(is_start_inclusive & is_end_inclusive)):
+        return _normalize(arrays)
+
+    return arrays
+
+
+def is_canonical(intervals) -> bool:
+    """
+    Determine whether intervals are sorted, non-empty and
+    separated by gaps, as intervals of a numeric set are.
+
+    :param intervals: a tuple of starts, ends and inclusivity flags
+    :return: whether the intervals are canonical
+    """
+    starts, ends, is_start_inclusive, is_end_inclusive = intervals
+
+    is_non_empty = (starts < ends) | (is_start_inclusive & is_end_inclusive)
+
+    # Each interval starts after the previous one ends, and a shared point is excluded
+    is_separated = (starts[1:] > ends[:-1]) | (
+        (starts[1:] == ends[:-1]) & ~is_end_inclusive[:-1] & ~is_start_inclusive[1:])
+
+    return bool(np.all(is_non_empty) and np.all(is_separated))
+
+
+def is_overlapping(intervals_1, intervals_2) -> np.ndarray:
+    """
+    Determine whether intervals of the first batch overlap with intervals of the second one.
+
+    :param intervals_1: a tuple of starts, ends and inclusivity flags
+    :param intervals_2: a tuple of starts, ends and inclusivity flags
+    :return: a boolean array
+    """
+    start_1, end_1, is_start_inclusive_1, is_end_inclusive_1 = _normalize(intervals_1)
+    start_2, end_2, is_start_inclusive_2, is_end_inclusive_2 = _normalize(intervals_2)
+
+    is_both_start_inclusive = is_start_inclusive_1 & is_start_inclusive_2
+
+    # Check if start of the first interval is to
+    # the right from the start of the second interval
+    start_check_1 = np.where(is_both_start_inclusive,
+                             start_1 >= start_2, start_1 > start_2)
+
+    # Check if start of the first interval is to
+    # the left from the end of the second interval
+    end_check_1 = np.where(is_start_inclusive_1 & is_end_inclusive_2,
+                           start_1 <= end_2, start_1 < end_2)
+
+    # Check if start of the second interval is to
+    # the right from the start of the first interval
+    start_check_2 = np.where(is_both_start_inclusive,
+                             start_2 >= start_1, start_2 > start_1)
+
+    # Check if start of the second interval is to
+    # the left from the end of the first interval
+    end_check_2 = np.where(is_start_inclusive_2 & is_end_inclusive_1,
+                           start_2 <= end_1, start_2 < end_1)
+
+    return (start_check_1 & end_check_1) | (start_check_2 & end_check_2)
+
+
+def is_almost_overlapping(intervals_1, intervals_2) -> np.ndarray:
+    """
+    Determine whether intervals of the first batch almost
+    overlap with intervals of the second one.
+
+    :param intervals_1: a tuple of starts, ends and inclusivity flags
+    :param intervals_2: a tuple of starts, ends and inclusivity flags
+    :return: a boolean array
+    """
+    start_1, end_1, is_start_inclusive_1, is_end_inclusive_1 = _normalize(intervals_1)
+    start_2, end_2, is_start_inclusive_2, is_end_inclusive_2 = _normalize(intervals_2)
+
+    is_start_junction = (start_1 == end_2) & (is_start_inclusive_1 | is_end_inclusive_2)
+    is_end_junction = (end_1 == start_2) & (is_end_inclusive_1 | is_start_inclusive_2)
+
+    return ~is_overlapping(intervals_1, intervals_2) & (is_start_junction | is_end_junction)
+
+
+def includes(intervals, points) -> np.ndarray:
+    """
+    Determine whether intervals include the given points.
+
+    :param intervals: a tuple of starts, ends and inclusivity flags
+    :param points: an array of numeric points
+    :return: a boolean array
+    """
+    starts, ends, is_start_inclusive, is_end_inclusive = _normalize(intervals)
+    points = np.asarray(points)
+
+    is_inside = (starts < points) & (points < ends)
+    is_start = is_start_inclusive & (starts == points)
+    is_end = is_end_inclusive & (ends == points)
+
+    return is_inside | is_start | is_end
+
+
+def intersection(intervals_1, intervals_2) -> Tuple[tuple, np.ndarray]:
+    """
+    Return intersections of intervals of the first batch with intervals of the second one.
+    Intersections that are empty are marked False in the returned mask.
+
+    :param intervals_1: a tuple of starts, ends and inclusivity flags
+    :param intervals_2: a tuple of starts, ends and inclusivity flags
+    :return: a tuple of intersection arrays and a boolean mask of non-empty intersections
+    """
+    intervals_1, intervals_2 = _normalize(intervals_1), _normalize(intervals_2)
+
+    starts = np.maximum(intervals_1[0], intervals_2[0])
+    ends = np.minimum(intervals_1[1], intervals_2[1])
+
+    is_start_inclusive = includes(intervals_1, starts) & includes(intervals_2, starts)
+    is_end_inclusive = includes(intervals_1, ends) & includes(intervals_2, ends)
+
+    is_empty = (starts > ends) | ((starts == ends) & ~is_start_inclusive)
+
+    return (starts, ends, is_start_inclusive, is_end_inclusive), ~is_empty
+
+
+def histogram(intervals, edges) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return how much of each bin [edges[i], edges[i + 1]) sorted disjoint intervals
+    cover and how many of the intervals include a point of each bin.
+    Every edge is located with one vectorized binary search.
+
+    :param intervals: a tuple of starts, ends and inclusivity flags of sorted disjoint intervals
+    :param edges: a sorted array of bin edges
+    :return: a tuple of coverage and count arrays with one value per bin
+    """
+    starts, ends, _, is_end_inclusive = _normalize(intervals)
+    edges = np.asarray(edges)
+
+    if edges.ndim != 1 or np.any(edges[1:] < edges[:-1]):
+        raise ValueError('Bin edges must be a sorted one-dimensional array')
+
+    if len(starts) == 0:
+        return np.zeros(max(len(edges) - 1, 0)), np.zeros(max(len(edges) - 1, 0), dtype=int)
+
+    last = len(starts) - 1
+
+    # Measure covered to the left from every edge
+    prefix = np.concatenate(([0], np.cumsum(ends - starts)))
+    ended = np.searchsorted(ends, edges, 'right')
+    partial = np.maximum(edges - starts[np.minimum(ended, last)], 0)
+    covered = prefix[ended] + np.where(ended <= last, partial, 0)
+
+    # Intervals that start to the left from the right edge of a bin,
+    # minus those that end before its left edge or exactly at it without including it
+    started = np.searchsorted(starts, edges[1:], 'left')
+    before = np.searchsorted(ends, edges[:-1], 'left')
+    is_open_end = ((before <= last) & (ends[np.minimum(before, last)] == edges[:-1])
+                   & ~is_end_inclusive[np.minimum(before, last)])
+
+    return np.diff(covered), started - before - is_open_end
+
+
+# Bytes other than brackets, deleted to leave one opening and one closing bracket per interval
+_NON_BRACKETS = bytes(set(range(256)) - set(b'[](){}'))
+_BRACKETS_TO_SPACES = bytes.maketrans(b'[](){},', b' ' * 7)
+
+
+def parse_text(data: bytes, parse=float) -> tuple:
+    """
+    Parse intervals formatted by Interval.get_formatted, one per line, into arrays.
+    The whole buffer is tokenized at once: brackets are picked out with bytes.translate
+    and all endpoints are converted by the parse function into one preallocated array.
+
+    :param data: the contents of a file written by NumericSet.save
+    :param parse: int for int64 endpoints or float for float64 endpoints
+    :return: a tuple of starts, ends and inclusivity flags
+    """
+    dtypes = {int: np.int64, float: np.float64}
+
+    if parse not in dtypes:
+        raise ValueError('Endpoints can only be parsed as int or float')
+
+    brackets = np.frombuffer(data.translate(None, _NON_BRACKETS), dtype=np.uint8)
+    opening, closing = brackets[0::2], brackets[1::2]
+
+    if len(opening) != len(closing) or not (
+            np.all(np.isin(opening, list(b'[({'))) and np.all(np.isin(closing, list(b'])}')))):
+        raise ValueError('Intervals must be enclosed in brackets')
+
+    tokens = data.translate(_BRACKETS_TO_SPACES).split()
+
+    try:
+        values = np.fromiter(map(parse, tokens), dtype=dtypes[parse], count=len(tokens))
+    except OverflowError:
+        raise ValueError('Integer endpoints must fit into int64') from None
+
+    # A single point has one endpoint, and any other interval has two
+    is_point = opening == ord('{')
+    counts = 2 - is_point
+
+    if len(values) != np.sum(counts):
+        raise ValueError('Intervals must have one or two endpoints')
+
+    offsets = np.cumsum(counts) - counts
+    starts, ends = values[offsets], values[offsets + counts - 1]
+
+    return (starts, ends, (opening == ord('[')) | is_point,
+            (closing == ord(']')) | is_point)
+
+
+def format_text(intervals) -> str:
+    """
+    Format arrays of intervals as lines of Interval.get_formatted.
+    All lines are formatted by a single %-formatting of one template.
+
+    :param intervals: a tuple of starts, ends and inclusivity flags
+    :return: the formatted intervals, each followed by a newline
+    """
+    starts, ends, is_start_inclusive, is_end_inclusive = _normalize(intervals)
+
+    values = np.empty((len(starts), 4), dtype=object)
+    values[:, 0] = np.array(['(', '['], dtype=object)[is_start_inclusive.astype(np.intp)]
+    values[:, 1] = starts.tolist()
+    values[:, 2] = ends.tolist()
+    values[:, 3] = np.array([')', ']'], dtype=object)[is_end_inclusive.astype(np.intp)]
+
+    # The template of a single point skips its brackets and its end
+    templates = np.array(['%s%s, %s%s\n', '%.0s{%s}%.0s%.0s\n'], dtype=object)[
+        (starts == ends).astype(np.intp)]
+
+    return ''.join(templates.tolist()) % tuple(values.ravel().tolist())
@@ -0,0 +1,209 @@
+"""WindowedNumericSet class that keeps only recent coverage of a numeric set.
+
+    A windowed set keeps a low-water mark that only moves forward.
+    advance(t) moves it to t - window and drops all coverage below it.
+    Expired intervals are always at the front of the sorted list, so they
+    are skipped by a head index instead of being removed one by one, and
+    the list is compacted once more than half of it has expired. Each
+    interval is therefore evicted in amortized constant time.
+
+    Intervals that start at or after the start of the last interval are
+    appended or merged into the last interval without rebuilding the list,
+    which is the common case for streams ordered by time. The cached measure
+    of the set is updated by advance and by such additions, so measure and
+    count do not compact the list.
+
+    WindowedNumericSet methods
+    ----------------
+        advance - move the low-water mark and drop expired coverage
+        add - add a numeric interval to the set
+        includes - determine whether the set includes the given point
+        count - return the number of intervals of the set
+        is_empty - determine whether the set is empty
+        copy - return a copy of the windowed set
+"""
+
+from numbers import Number
+
+from numeric_sets.main import (
+    Interval, NumericSet, _from_cuts, _length, _lower_cut, _notifies, _upper_cut)
+
+
+class WindowedNumericSet(NumericSet):
+    """Class for a numeric set that expires coverage below a moving low-water mark."""
+
+    def __init__(self, window: Number, intervals=None):
+        """
+        Initialize a windowed set that keeps coverage of the last window units.
+        """
+        self.window = window
+        self.low_water_mark = None
+        self._head = 0
+
+        super().__init__(intervals)
+
+    @property
+    def intervals(self):
+        """
+        Sorted list of disjoint intervals of the set that have not expired.
+        """
+        intervals = NumericSet.intervals.fget(self)
+
+        if self._head:
+            del intervals[:self._head]
+            self._head = 0
+
+        return intervals
+
+    @intervals.setter
+    def intervals(self, intervals) -> None:
+        if self.low_water_mark is not None:
+            intervals = self._clip(intervals)
+
+        NumericSet.intervals.fset(self, intervals)
+        self._head = 0
+
+    def _clip(self, intervals):
+        """
+        Drop the parts of sorted disjoint intervals that lie below the low-water mark.
+
+        :param intervals: a sorted list of disjoint intervals
+        :return: the list of intervals that have not expired
+        """
+        low = (self.low_water_mark, 0)
+        index = 0
+
+        while index < len(intervals) and _upper_cut(intervals[index]) <= low:
+            index += 1
+
+        intervals = intervals[index:]
+
+        if intervals and _lower_cut(intervals[0]) < low:
+            intervals[0] = _from_cuts(low, _upper_cut(intervals[0]))
+
+        return intervals
+
+    @_notifies
+    def advance(self, t: Number) -> None:
+        """
+        Move the low-water mark to t - window and drop coverage below it.
+        The low-water mark never moves back.
+
+        :param t: the current time
+        """
+        low_water_mark = t - self.window
+
+        if self.low_water_mark is not None and low_water_mark <= self.low_water_mark:
+            return
+
+        self.low_water_mark = low_water_mark
+        low = (low_water_mark, 0)
+        intervals = NumericSet.intervals.fget(self)
+
+        while self._head < len(intervals) and _upper_cut(intervals[self._head]) <= low:
+            if self._measure is not None:
+                self._measure -= _length(intervals[self._head])
+
+            self._head += 1
+
+        if self._head < len(intervals) and _lower_cut(intervals[self._head]) < low:
+            expired = intervals[self._head]
+            intervals[self._head] = _from_cuts(low, _upper_cut(expired))
+
+            if self._measure is not None:
+                self._measure -= low_water_mark - expired.start
+
+        # Compact the list once most of it has expired
+        if self._head * 2 > len(intervals):
+            del intervals[:self._head]
+            self._head = 0
+
+    @_notifies
+    def add(self, new_interval: Interval) -> None:
+        """
+        Add a numeric interval to the set, dropping its part below the low-water mark.
+        Intervals that start at or after the start of the last interval are added
+        in constant time.
+
+        :param new_interval: a numeric interval
+        """
+        if self.low_water_mark is not None:
+            clipped = self._clip([new_interval])
+
+            if not clipped:
+                return
+
+            new_interval = clipped[0]
+
+        lower, upper = _lower_cut(new_interval), _upper_cut(new_interval)
+
+        if lower >= upper:
+            return
+
+        intervals = NumericSet.intervals.fget(self)
+
+        if len(intervals) == self._head or lower > _upper_cut(intervals[-1]):
+            intervals.append(_from_cuts(lower, upper))
+
+            if self._measure is not None:
+                self._measure += _length(intervals[-1])
+        elif lower >= _lower_cut(intervals[-1]):
+            last = intervals[-1]
+
+            if upper > _upper_cut(last):
+                intervals[-1] = _from_cuts(_lower_cut(last), upper)
+
+                if self._measure is not None:
+                    self._measure += _length(intervals[-1]) - _length(last)
+        else:
+            self.add_many([new_interval])
+
+    def includes(self, point: Number) -> bool:
+        """
+        Determine whether the set includes the given point.
+        Expired intervals are skipped by the binary search.
+
+        :param point: a numeric point
+        :return: True if the set includes the point, False otherweise
+        """
+        intervals = NumericSet.intervals.fget(self)
+        low, high = self._head, len(intervals)
+
+        # Find the first interval that starts to the right from the point
+        while low < high:
+            middle = (low + high) // 2
+
+            if intervals[middle].start <= point:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low > self._head and intervals[low - 1].includes(point)
+
+    def count(self) -> int:
+        """
+        Return the number of intervals of the set that have not expired.
+
+        :return: the number of intervals
+        """
+        return len(NumericSet.intervals.fget(self)) - self._head
+
+    def is_empty(self) -> bool:
+        """
+        Determine whether the set is empty.
+
+        :return: whether the set is empty
+        """
+        return len(NumericSet.intervals.fget(self)) == self._head
+
+    def copy(self):
+        """
+        Return a copy of the windowed set.
+
+        :return: a copy of the windowed set
+        """
+        windowed_set = WindowedNumericSet(self.window)
+        windowed_set.low_water_mark = self.low_water_mark
+        windowed_set.intervals = [interval.copy() for interval in self.intervals]
+
+        return windowed_set
@@ -24,4 +24,7 @@ setup(
     python_requires='>=3.8',
     packages=["numeric_sets"],
     package_dir={"numeric_sets": "numeric_sets"},
+    extras_require={
+        "numpy": ["numpy"],
+    },
 )
@@ -0,0 +1,34 @@
+"""Helpers shared by tests of the 'numeric_sets' module."""
+
+
+from numeric_sets.main import Interval
+
+
+# Integer and half-integer points around the intervals made by random_intervals
+POINTS = [point / 2 for point in range(-2, 100)]
+
+
+def random_intervals(generator, count):
+    intervals = []
+
+    for _ in range(count):
+        start = generator.randint(0, 40)
+        end = start + generator.randint(0, 4)
+        intervals.append(
+            Interval(start, end, generator.random() < 0.5, generator.random() < 0.5))
+
+    return intervals
+
+
+def formatted(intervals):
+    return [interval.get_formatted() for interval in intervals]
+
+
+def includes(intervals, point):
+    return any(interval.includes(point) for interval in intervals)
+
+
+def assert_canonical(test_case, intervals):
+    for left, right in zip(intervals, intervals[1:]):
+        test_case.assertFalse(left.is_overlapping(right) or left.is_almost_overlapping(right))
+        test_case.assertLessEqual(left.end, right.start)
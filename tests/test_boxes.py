@@ -0,0 +1,156 @@
+"""Test the Box and BoxSet classes from the 'numeric_sets' module using unittest."""
+
+
+import random
+import unittest
+
+from numeric_sets.boxes import Box, BoxSet
+from numeric_sets.main import Interval
+from tests.helpers import formatted
+
+
+# Integer and half-integer coordinates around the boxes made by _random_boxes
+COORDINATES = [coordinate / 2 for coordinate in range(-1, 30)]
+
+
+def _random_interval(generator):
+    start = generator.randint(0, 12)
+
+    return Interval(start, start + generator.randint(0, 3),
+                    generator.random() < 0.5, generator.random() < 0.5)
+
+
+def _random_boxes(generator, count):
+    return [Box(_random_interval(generator), _random_interval(generator))
+            for _ in range(count)]
+
+
+def _includes(boxes, x, y):
+    return any(box.includes(x, y) for box in boxes)
+
+
+def _formatted_slabs(box_set):
+    return [(x.get_formatted(), formatted(numeric_set.intervals))
+            for x, numeric_set in box_set.slabs]
+
+
+class TestBox(unittest.TestCase):
+    def test_box(self):
+        box = Box(Interval(0, 2, True, False), Interval(1, 4))
+
+        self.assertEqual(box.get_formatted(), '[0, 2) x (1, 4)')
+        self.assertTrue(box.includes(0, 2))
+        self.assertFalse(box.includes(2, 2))
+        self.assertEqual(box.area(), 6)
+
+
+class TestBoxSet(unittest.TestCase):
+    def setUp(self):
+        self.box_set = BoxSet([Box(Interval(0, 4), Interval(0, 2)),
+                               Box(Interval(2, 6), Interval(1, 3))])
+
+    def test_slabs(self):
+        self.assertEqual(_formatted_slabs(self.box_set),
+                         [('(0, 2]', ['(0, 2)']),
+                          ('(2, 4)', ['(0, 3)']),
+                          ('[4, 6)', ['(1, 3)'])])
+
+    def test_neighbouring_slabs_are_merged(self):
+        box_set = BoxSet([Box(Interval(0, 2, True, True), Interval(0, 1)),
+                          Box(Interval(2, 5), Interval(0, 1))])
+
+        self.assertEqual(_formatted_slabs(box_set), [('[0, 5)', ['(0, 1)'])])
+
+    def test_duplicate_boxes(self):
+        box = Box(Interval(0, 4), Interval(0, 2))
+        box_set = BoxSet([box, box, Box(Interval(2, 6), Interval(1, 3))])
+
+        self.assertEqual(_formatted_slabs(box_set), _formatted_slabs(self.box_set))
+
+    def test_area(self):
+        self.assertEqual(self.box_set.area(), 14)
+        self.assertEqual(BoxSet().area(), 0)
+
+    def test_includes(self):
+        self.assertTrue(self.box_set.includes(3, 2.5))
+        self.assertFalse(self.box_set.includes(1, 2.5))
+        self.assertFalse(self.box_set.includes(6, 2))
+        self.assertFalse(BoxSet().includes(0, 0))
+
+    def test_box_queries(self):
+        self.assertTrue(self.box_set.intersects(Box(Interval(5, 9), Interval(2, 9))))
+        self.assertFalse(self.box_set.intersects(Box(Interval(0, 1), Interval(2, 3))))
+        self.assertTrue(self.box_set.covers(Box(Interval(1, 5), Interval(1, 1.5))))
+        self.assertFalse(self.box_set.covers(Box(Interval(1, 5), Interval(1, 2.5))))
+        self.assertFalse(self.box_set.covers(Box(Interval(5, 7), Interval(2, 2))))
+
+    def test_operations(self):
+        other = BoxSet([Box(Interval(1, 3), Interval(-1, 5))])
+
+        # The intersection is (1, 2] x (0, 2) and (2, 3) x (0, 3)
+        self.assertEqual(self.box_set.intersection(other).area(), 5)
+        self.assertEqual(self.box_set.union(other).area(), 14 + 12 - 5)
+        self.assertEqual(self.box_set.difference(other).area(), 14 - 5)
+        self.assertEqual(self.box_set.symmetric_difference(other).area(), 14 + 12 - 10)
+        self.assertTrue(self.box_set.difference(self.box_set).is_empty())
+
+    def test_boxes(self):
+        boxes = self.box_set.boxes()
+
+        self.assertEqual([box.get_formatted() for box in boxes],
+                         ['(0, 2] x (0, 2)', '(2, 4) x (0, 3)', '[4, 6) x (1, 3)'])
+        self.assertEqual(sum(box.area() for box in boxes), self.box_set.area())
+
+    def test_random(self):
+        generator = random.Random(10)
+
+        for _ in range(20):
+            boxes_1 = _random_boxes(generator, 8)
+            boxes_2 = _random_boxes(generator, 8)
+            box_set_1, box_set_2 = BoxSet(boxes_1), BoxSet(boxes_2)
+            results = {
+                'union': (box_set_1.union(box_set_2), lambda a, b: a or b),
+                'intersection': (box_set_1.intersection(box_set_2), lambda a, b: a and b),
+                'difference': (box_set_1.difference(box_set_2), lambda a, b: a and not b),
+                'symmetric_difference': (box_set_1.symmetric_difference(box_set_2),
+                                         lambda a, b: a != b),
+            }
+
+            # The representation does not depend on the order of the boxes
+            generator.shuffle(boxes_1)
+            self.assertEqual(_formatted_slabs(BoxSet(boxes_1)), _formatted_slabs(box_set_1))
+
+            for x in COORDINATES:
+                for y in COORDINATES:
+                    is_in_1, is_in_2 = _includes(boxes_1, x, y), _includes(boxes_2, x, y)
+
+                    self.assertEqual(box_set_1.includes(x, y), is_in_1)
+
+                    for name, (box_set, predicate) in results.items():
+                        self.assertEqual(box_set.includes(x, y), predicate(is_in_1, is_in_2),
+                                         (name, x, y))
+
+            # Unit cells of integer boxes are either covered or not
+            cells = sum(_includes(boxes_1, x + 0.5, y + 0.5)
+                        for x in range(16) for y in range(16))
+            self.assertEqual(box_set_1.area(), cells)
+
+    def test_random_box_queries(self):
+        generator = random.Random(11)
+
+        for _ in range(20):
+            boxes = _random_boxes(generator, 8)
+            box_set = BoxSet(boxes)
+
+            for query in _random_boxes(generator, 10):
+                points = [(x, y) for x in COORDINATES for y in COORDINATES
+                          if query.includes(x, y)]
+
+                self.assertEqual(box_set.intersects(query),
+                                 any(_includes(boxes, x, y) for x, y in points))
+                self.assertEqual(box_set.covers(query),
+                                 all(_includes(boxes, x, y) for x, y in points))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Test the command-line tool from the 'numeric_sets' module using unittest."""
+
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from numeric_sets import packed
+from numeric_sets.__main__ import main
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets.streams import iter_read, iter_save
+from tests.helpers import formatted, random_intervals
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        self.numeric_sets = [NumericSet([Interval(0, 4), Interval(6, 10)]),
+                             NumericSet([Interval(2, 7, True, True)]),
+                             NumericSet([Interval(3, 8)])]
+        self.filenames = [self._path(f'input_{index}.txt') for index in range(3)]
+
+        for numeric_set, filename in zip(self.numeric_sets, self.filenames):
+            numeric_set.save(filename)
+
+        self.output_filename = self._path('output.txt')
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _run(self, *argv):
+        stdout = io.StringIO()
+
+        with contextlib.redirect_stdout(stdout):
+            status = main(list(argv))
+
+        return status, stdout.getvalue().splitlines()
+
+    def test_union(self):
+        status, lines = self._run('union', *self.filenames)
+
+        self.assertEqual(status, 0)
+        self.assertEqual(lines, ['(0.0, 10.0)'])
+
+    def test_intersection_to_file(self):
+        status, lines = self._run('intersection', *self.filenames, '-o', self.output_filename)
+
+        self.assertEqual((status, lines), (0, []))
+        self.assertEqual(formatted(iter_read(self.output_filename)), ['(3.0, 4.0)', '(6.0, 7.0]'])
+
+    def test_difference(self):
+        _, lines = self._run('difference', *self.filenames)
+
+        self.assertEqual(lines, ['(0.0, 2.0)', '[8.0, 10.0)'])
+
+    def test_symmetric_difference(self):
+        _, lines = self._run('symmetric-difference', *self.filenames, '--parse', 'int')
+
+        expected = self.numeric_sets[0].symmetric_difference(
+            self.numeric_sets[1]).symmetric_difference(self.numeric_sets[2])
+
+        self.assertEqual(lines, formatted(expected.intervals))
+
+    def test_symmetric_difference_of_one_file(self):
+        iter_save([Interval(0, 2), Interval(1, 3)], self.output_filename)
+        _, lines = self._run('symmetric-difference', self.output_filename)
+
+        self.assertEqual(lines, ['(0.0, 3.0)'])
+
+        iter_save([Interval(5, 6), Interval(0, 1)], self.output_filename)
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            status, _ = self._run('symmetric-difference', self.output_filename)
+
+        self.assertEqual(status, 2)
+
+    def test_subset(self):
+        self.assertEqual(self._run('subset', self.filenames[2], *self.filenames[:2]),
+                         (0, ['True']))
+        self.assertEqual(self._run('subset', self.filenames[0], self.filenames[1]),
+                         (1, ['False']))
+
+    def test_stats(self):
+        _, lines = self._run('stats', self.filenames[0], '--parse', 'int')
+
+        self.assertEqual(lines, [f'{self.filenames[0]}: count=2 measure=8 start=0 end=10'])
+
+    def test_binary(self):
+        binary_filenames = [self._path(f'input_{index}.bin') for index in range(3)]
+
+        for numeric_set, filename in zip(self.numeric_sets, binary_filenames):
+            packed.save(numeric_set, filename)
+
+        status, _ = self._run('union', *binary_filenames, '--binary', '-o', self.output_filename)
+
+        self.assertEqual(status, 0)
+        self.assertEqual(formatted(packed.read(self.output_filename).intervals), ['(0, 10)'])
+
+        # Commands that only print do not need an output file
+        self.assertEqual(self._run('subset', *binary_filenames[:2], '--binary'), (1, ['False']))
+        self.assertEqual(self._run('stats', binary_filenames[1], '--binary'),
+                         (0, [f'{binary_filenames[1]}: count=1 measure=5 start=2 end=7']))
+
+    def test_sort(self):
+        unsorted_filename = self._path('unsorted.txt')
+        iter_save(random_intervals(random.Random(3), 12), unsorted_filename)
+
+        self._run('sort', unsorted_filename, '-o', self.output_filename, '--chunk-size', '5')
+        _, lines = self._run('union', self.output_filename)
+
+        self.assertEqual(lines, formatted(NumericSet.read(unsorted_filename).intervals))
+
+    def test_sort_integers(self):
+        unsorted_filename = self._path('unsorted.txt')
+        iter_save([Interval(10**17 + 1, 10**17 + 3), Interval(0, 2)], unsorted_filename)
+
+        self._run('sort', unsorted_filename, '-o', self.output_filename, '--parse', 'int')
+
+        self.assertEqual(formatted(iter_read(self.output_filename, int)),
+                         ['(0, 2)', '(100000000000000001, 100000000000000003)'])
+
+    def test_unsorted_input(self):
+        iter_save([Interval(5, 6), Interval(0, 1)], self.output_filename)
+
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            status, _ = self._run('union', self.output_filename)
+
+        self.assertEqual(status, 2)
+        self.assertIn('error', stderr.getvalue())
+
+    def test_usage_errors(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                main(['subset', self.filenames[0]])
+
+            with self.assertRaises(SystemExit):
+                main(['union', self.filenames[0], '--binary'])
+
+            with self.assertRaises(SystemExit):
+                main(['sort', *self.filenames, '-o', self.output_filename])
+
+
+class TestPackedIterRead(unittest.TestCase):
+    def test_round_trip(self):
+        numeric_set = NumericSet()
+        numeric_set.add_many(random_intervals(random.Random(5), 50))
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'set.bin')
+            packed.save(numeric_set, filename)
+
+            self.assertEqual(formatted(packed.iter_read(filename)),
+                             formatted(numeric_set.intervals))
+
+    def test_empty(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'set.bin')
+            packed.save(NumericSet(), filename)
+
+            self.assertEqual(list(packed.iter_read(filename)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
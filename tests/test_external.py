@@ -0,0 +1,73 @@
+"""Test the external-memory sort from the 'numeric_sets' module using unittest."""
+
+
+import os
+import random
+import tempfile
+import unittest
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets.external import external_sort
+from numeric_sets.streams import iter_read, iter_save
+from tests.helpers import formatted, random_intervals
+
+
+class TestExternalSort(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        self.input_filename = os.path.join(self.directory, 'input.txt')
+        self.output_filename = os.path.join(self.directory, 'output.txt')
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_ordinary(self):
+        intervals = random_intervals(random.Random(0), 500)
+        iter_save(intervals, self.input_filename)
+
+        external_sort(self.input_filename, self.output_filename,
+                      chunk_size=37, max_open_runs=3)
+
+        self.assertEqual(formatted(iter_read(self.output_filename)),
+                         formatted(NumericSet.read(self.input_filename).intervals))
+
+    def test_single_run(self):
+        intervals = [Interval(5, 6), Interval(0, 2), Interval(1, 3, True, True)]
+        iter_save(intervals, self.input_filename)
+
+        external_sort(self.input_filename, self.output_filename)
+
+        self.assertEqual(formatted(iter_read(self.output_filename)),
+                         ['(0.0, 3.0]', '(5.0, 6.0)'])
+
+    def test_parse(self):
+        intervals = [Interval(10**17 + 1, 10**17 + 3), Interval(0, 2), Interval(1, 3)]
+        iter_save(intervals, self.input_filename)
+
+        external_sort(self.input_filename, self.output_filename, chunk_size=1,
+                      max_open_runs=2, parse=int)
+
+        # Integers beyond the precision of floats are kept exactly
+        self.assertEqual(formatted(iter_read(self.output_filename, int)),
+                         ['(0, 3)', '(100000000000000001, 100000000000000003)'])
+
+    def test_empty(self):
+        iter_save([], self.input_filename)
+
+        external_sort(self.input_filename, self.output_filename, chunk_size=10)
+
+        self.assertEqual(formatted(iter_read(self.output_filename)), [])
+
+    def test_temporary_files(self):
+        iter_save(random_intervals(random.Random(1), 100), self.input_filename)
+        runs_directory = os.path.join(self.directory, 'runs')
+        os.mkdir(runs_directory)
+
+        external_sort(self.input_filename, self.output_filename, chunk_size=10,
+                      max_open_runs=2, directory=runs_directory)
+
+        self.assertEqual(os.listdir(runs_directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Test instrumentation of operations from the 'numeric_sets' module using unittest."""
+
+
+import unittest
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets import instrumentation, main
+
+
+class TestInstrumented(unittest.TestCase):
+    def test_stats(self):
+        myset = NumericSet([Interval(0, 1), Interval(4, 5)])
+
+        with instrumentation.instrumented() as stats:
+            myset.add(Interval(2, 3))
+            myset.union(NumericSet([Interval(6, 7)]))
+
+        add = stats.operations['NumericSet.add']
+        union = stats.operations['NumericSet.union']
+
+        self.assertEqual(add.calls, 1)
+        self.assertEqual(union.calls, 1)
+        self.assertGreater(add.comparisons, 0)
+        self.assertEqual(add.allocations, 1)
+        # union copies 3 intervals and merges 4 intervals into 4 new ones
+        self.assertEqual(union.comparisons, 4)
+        self.assertEqual(union.allocations, 7)
+        self.assertGreater(union.elapsed, 0)
+
+    def test_nested(self):
+        with instrumentation.instrumented() as stats:
+            NumericSet([Interval(0, 2)]).update(NumericSet([Interval(1, 3), Interval(5, 6)]))
+
+        update = stats.operations['NumericSet.update']
+        add_many = stats.operations['NumericSet.add_many']
+
+        self.assertEqual(add_many.calls, 1)
+        self.assertEqual(add_many.comparisons, 3)
+        self.assertEqual(add_many.allocations, 2)
+        self.assertEqual(update.comparisons, add_many.comparisons)
+        self.assertEqual(update.allocations, add_many.allocations)
+
+    def test_remove_many(self):
+        myset = NumericSet([Interval(0, 4), Interval(6, 8)])
+
+        with instrumentation.instrumented() as stats:
+            myset.difference_update(NumericSet([Interval(1, 2), Interval(7, 9)]))
+
+        difference_update = stats.operations['NumericSet.difference_update']
+
+        # remove_many merges the batch of 2 and subtracts it from 2 intervals
+        self.assertEqual(difference_update.comparisons, 6)
+        self.assertEqual(difference_update.allocations, 5)
+
+    def test_disable(self):
+        add = NumericSet.add
+        intersection = Interval.intersection
+        subtract = main._subtract
+
+        instrumentation.enable()
+        self.assertIsNot(NumericSet.add, add)
+        instrumentation.disable()
+
+        self.assertIs(NumericSet.add, add)
+        self.assertIs(Interval.intersection, intersection)
+        self.assertIs(main._subtract, subtract)
+
+
+class TestTracer(unittest.TestCase):
+    def test_callback(self):
+        finished = []
+
+        def callback(name, stats):
+            finished.append((name, stats.calls))
+
+        with instrumentation.instrumented(callback):
+            Interval.intersection(Interval(0, 2), Interval(1, 3))
+
+        self.assertEqual(finished, [('Interval.intersection', 1)])
+
+    def test_tracer(self):
+        events = []
+
+        class MyTracer(instrumentation.Tracer):
+            def on_start(self, operation):
+                events.append(('start', operation))
+
+            def on_end(self, operation, stats):
+                events.append(('end', operation))
+
+        with instrumentation.instrumented(MyTracer()):
+            NumericSet().copy()
+
+        self.assertEqual(events, [('start', 'NumericSet.copy'), ('end', 'NumericSet.copy')])
+
+
+if __name__ == '__main__':
+    unittest.main()
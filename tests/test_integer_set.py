@@ -0,0 +1,85 @@
+"""Test IntegerSet class methods from the 'numeric_sets' module using unittest."""
+
+
+import unittest
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets.integer_set import IntegerSet
+
+
+class TestInit(unittest.TestCase):
+    def test_ordinary(self):
+        integer_set = IntegerSet([(5, 7), (1, 2), (3, 3), (10, 12), (11, 15)])
+
+        self.assertEqual(list(integer_set.runs()), [(1, 3), (5, 7), (10, 15)])
+        self.assertEqual(integer_set.cardinality(), 12)
+
+    def test_empty(self):
+        integer_set = IntegerSet([(3, 2)])
+
+        self.assertTrue(integer_set.is_empty())
+        self.assertEqual(integer_set.cardinality(), 0)
+
+
+class TestIncludes(unittest.TestCase):
+    def test_ordinary(self):
+        integer_set = IntegerSet([(1, 3), (5, 7)])
+
+        self.assertTrue(integer_set.includes(1))
+        self.assertTrue(integer_set.includes(7))
+        self.assertFalse(integer_set.includes(4))
+        self.assertFalse(integer_set.includes(0))
+        self.assertFalse(integer_set.includes(8))
+
+
+class TestOperations(unittest.TestCase):
+    def setUp(self):
+        self.integer_set_1 = IntegerSet([(1, 5), (10, 20), (30, 30)])
+        self.integer_set_2 = IntegerSet([(3, 12), (15, 16), (21, 29)])
+
+    def test_union(self):
+        union = self.integer_set_1.union(self.integer_set_2)
+
+        self.assertEqual(list(union.runs()), [(1, 30)])
+
+    def test_intersection(self):
+        intersection = self.integer_set_1.intersection(self.integer_set_2)
+
+        self.assertEqual(list(intersection.runs()), [(3, 5), (10, 12), (15, 16)])
+
+    def test_difference(self):
+        difference = self.integer_set_1.difference(self.integer_set_2)
+
+        self.assertEqual(list(difference.runs()), [(1, 2), (13, 14), (17, 20), (30, 30)])
+
+    def test_copy(self):
+        copy = self.integer_set_1.copy()
+        copy.ends[0] = 7
+
+        self.assertEqual(self.integer_set_1.ends[0], 5)
+
+
+class TestConversion(unittest.TestCase):
+    def test_from_numeric_set(self):
+        numeric_set = NumericSet([
+            Interval(0, 3),  # (0, 3) -> 1..2
+            Interval(3, 5, True, True),  # [3, 5] -> 3..5
+            Interval(7.5, 10, is_end_inclusive=True),  # (7.5, 10] -> 8..10
+            Interval(12.2, 12.8),  # no integers
+        ])
+
+        integer_set = IntegerSet.from_numeric_set(numeric_set)
+
+        self.assertEqual(list(integer_set.runs()), [(1, 5), (8, 10)])
+
+    def test_round_trip(self):
+        numeric_set = NumericSet([Interval(1, 3, True, True), Interval(5, 5)])
+
+        numeric_set = IntegerSet.from_numeric_set(numeric_set).to_numeric_set()
+
+        self.assertEqual(len(numeric_set.intervals), 2)
+        self.assertEqual(numeric_set.intervals[0].get_formatted(), '[1, 3]')
+        self.assertEqual(numeric_set.intervals[1].get_formatted(), '{5}')
+
+
+if __name__ == '__main__':
+    unittest.main()
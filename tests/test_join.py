@@ -0,0 +1,61 @@
+"""Test the overlap join from the 'numeric_sets' module using unittest."""
+
+
+import itertools
+import random
+import unittest
+from numeric_sets.main import Interval
+from numeric_sets.join import overlap_join
+
+
+class TestOverlapJoin(unittest.TestCase):
+    def test_ordinary(self):
+        left = [(Interval(0, 5), 'a'), (Interval(6, 8, True, True), 'b')]
+        right = [(Interval(4, 6), 'x'), (Interval(8, 9, True), 'y'), (Interval(10, 11), 'z')]
+
+        pairs = sorted((l[1], r[1]) for l, r in overlap_join(left, right))
+
+        self.assertEqual(pairs, [('a', 'x'), ('b', 'y')])
+
+    def test_touching(self):
+        left = [(Interval(0, 2, is_end_inclusive=True), 'a')]
+        right = [(Interval(2, 3), 'x'), (Interval(2, 2), 'y')]
+
+        pairs = [(l[1], r[1]) for l, r in overlap_join(left, right)]
+
+        self.assertEqual(pairs, [('a', 'y')])
+
+    def test_intersection(self):
+        left = [(Interval(0, 5, True), 'a')]
+        right = [(Interval(3, 7, is_end_inclusive=True), 'x')]
+
+        (l, r, intersection), = overlap_join(left, right, with_intersection=True)
+
+        self.assertEqual(intersection.get_formatted(), '(3, 5)')
+
+    def test_random(self):
+        generator = random.Random(0)
+
+        def random_items(count):
+            items = []
+
+            for i in range(count):
+                start = generator.randint(0, 30)
+                end = start + generator.randint(0, 5)
+                interval = Interval(
+                    start, end, generator.random() < 0.5, generator.random() < 0.5)
+                items.append((interval, i))
+
+            return items
+
+        left, right = random_items(100), random_items(100)
+
+        expected = sorted((l[1], r[1]) for l, r in itertools.product(left, right)
+                          if Interval.intersection(l[0], r[0]) is not None)
+        actual = sorted((l[1], r[1]) for l, r in overlap_join(left, right))
+
+        self.assertEqual(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,14 @@
 """Test NumericSet class methods from the 'NumericSets' module using unittest."""
 
 
+import asyncio
+import os
+import random
+import tempfile
 import unittest
+from numeric_sets import instrumentation
 from numeric_sets.main import Interval, NumericSet
+from tests.helpers import POINTS, assert_canonical, formatted, includes, random_intervals
 
 
 class TestAdd(unittest.TestCase):
@@ -63,6 +69,407 @@ class TestAdd(unittest.TestCase):
         self.assertEqual(myset.intervals[0].get_formatted(), '(1, 3)')
 
 
+class TestAddMany(unittest.TestCase):
+    def test_ordinary(self):
+        myset = NumericSet([Interval(0, 1), Interval(9, 10)])
+        myset.add_many([Interval(6, 8), Interval(2, 3), Interval(2.5, 8.5, is_end_inclusive=True)])
+
+        # result: (0, 1) (2, 8.5] (9, 10)
+        self.assertEqual(formatted(myset.intervals), ['(0, 1)', '(2, 8.5]', '(9, 10)'])
+
+    def test_random(self):
+        generator = random.Random(0)
+
+        for _ in range(50):
+            initial = random_intervals(generator, 10)
+            batch = random_intervals(generator, 10)
+
+            myset = NumericSet()
+            myset.add_many(initial)
+            myset.add_many(batch)
+
+            assert_canonical(self, myset.intervals)
+
+            for point in POINTS:
+                self.assertEqual(includes(myset.intervals, point),
+                                 includes(initial + batch, point))
+
+
+class TestRemoveMany(unittest.TestCase):
+    def test_ordinary(self):
+        myset = NumericSet([Interval(0, 10, True, True)])
+        myset.remove_many([Interval(6, 8), Interval(2, 3, True), Interval(7, 9)])
+
+        # result: [0, 2) [3, 6] [9, 10]
+        self.assertEqual(formatted(myset.intervals), ['[0, 2)', '[3, 6]', '[9, 10]'])
+
+    def test_random(self):
+        generator = random.Random(1)
+
+        for _ in range(50):
+            initial = random_intervals(generator, 10)
+            batch = random_intervals(generator, 10)
+
+            myset = NumericSet()
+            myset.add_many(initial)
+            myset.remove_many(batch)
+
+            assert_canonical(self, myset.intervals)
+
+            for point in POINTS:
+                self.assertEqual(includes(myset.intervals, point),
+                                 includes(initial, point) and not includes(batch, point))
+
+
+class TestDeferred(unittest.TestCase):
+    def test_pending(self):
+        myset = NumericSet(deferred=True)
+
+        with instrumentation.instrumented() as stats:
+            myset.add(Interval(0, 5))
+            myset.add(Interval(4, 8))
+            myset.remove(Interval(2, 3, True, True))
+            myset.add(Interval(10, 12))
+
+            # Nothing is merged before the first read
+            self.assertNotIn('NumericSet.add_many', stats.operations)
+            self.assertNotIn('NumericSet.remove_many', stats.operations)
+
+            # result: (0, 2) (3, 8) (10, 12)
+            self.assertEqual(formatted(myset.intervals), ['(0, 2)', '(3, 8)', '(10, 12)'])
+
+            # Runs of additions and removals are merged once each
+            self.assertEqual(stats.operations['NumericSet.add_many'].calls, 2)
+            self.assertEqual(stats.operations['NumericSet.remove_many'].calls, 1)
+
+    def test_buffer_size(self):
+        myset = NumericSet(deferred=True, buffer_size=2)
+
+        with instrumentation.instrumented() as stats:
+            myset.add(Interval(0, 1))
+            myset.add(Interval(2, 3))
+
+            self.assertNotIn('NumericSet.add_many', stats.operations)
+
+            myset.add(Interval(4, 5))
+
+            self.assertEqual(stats.operations['NumericSet.add_many'].calls, 1)
+
+        self.assertEqual(formatted(myset.intervals), ['(0, 1)', '(2, 3)', '(4, 5)'])
+
+    def test_random(self):
+        generator = random.Random(2)
+        myset = NumericSet(deferred=True, buffer_size=16)
+        changes = []
+
+        for _ in range(200):
+            interval = random_intervals(generator, 1)[0]
+            is_addition = generator.random() < 0.7
+            changes.append((is_addition, interval))
+
+            if is_addition:
+                myset.add(interval)
+            else:
+                myset.remove(interval)
+
+        assert_canonical(self, myset.intervals)
+
+        # Replay the changes for every point
+        for point in POINTS:
+            is_included = False
+
+            for is_addition, interval in changes:
+                if interval.includes(point):
+                    is_included = is_addition
+
+            self.assertEqual(myset.includes(point), is_included)
+
+
+class TestSubscribers(unittest.TestCase):
+    def setUp(self):
+        self.myset = NumericSet([Interval(0, 5)])
+        self.deltas = []
+        self.myset.subscribe(self.deltas.append)
+
+    def test_add(self):
+        self.myset.add(Interval(3, 8, False, True))
+
+        self.assertEqual(len(self.deltas), 1)
+        self.assertEqual(formatted(self.deltas[0].added), ['[5, 8]'])
+        self.assertEqual(self.deltas[0].removed, [])
+
+    def test_remove(self):
+        self.myset.remove_many([Interval(1, 2, True, True), Interval(4, 9)])
+
+        self.assertEqual(self.deltas[0].added, [])
+        self.assertEqual(formatted(self.deltas[0].removed), ['[1, 2]', '(4, 5)'])
+
+    def test_unchanged(self):
+        self.myset.add(Interval(1, 2))
+        self.myset.difference_update(NumericSet([Interval(7, 9)]))
+
+        self.assertEqual(self.deltas, [])
+
+    def test_nested_mutation(self):
+        # update calls add_many, which is reported as part of update
+        self.myset.update(NumericSet([Interval(6, 7), Interval(8, 9)]))
+
+        self.assertEqual(len(self.deltas), 1)
+        self.assertEqual(formatted(self.deltas[0].added), ['(6, 7)', '(8, 9)'])
+
+    def test_intersection_update(self):
+        self.myset.intersection_update(NumericSet([Interval(2, 3, True, True)]))
+
+        self.assertEqual(formatted(self.deltas[0].removed), ['(0, 2)', '(3, 5)'])
+
+    def test_unsubscribe(self):
+        self.myset.unsubscribe(self.deltas.append)
+        self.myset.clear()
+
+        self.assertEqual(self.deltas, [])
+
+    def test_deferred(self):
+        myset = NumericSet(deferred=True)
+        deltas = []
+        myset.subscribe(deltas.append)
+
+        myset.add(Interval(0, 5))
+        myset.add(Interval(4, 8))
+
+        self.assertEqual([formatted(delta.added) for delta in deltas], [['(0, 5)'], ['[5, 8)']])
+
+    def test_random_mirror(self):
+        generator = random.Random(3)
+        mirror = self.myset.copy()
+
+        def apply(delta):
+            mirror.add_many(delta.added)
+            mirror.remove_many(delta.removed)
+
+        self.myset.subscribe(apply)
+
+        for _ in range(60):
+            intervals = random_intervals(generator, generator.randint(1, 4))
+            other = NumericSet()
+            other.add_many(intervals)
+
+            operation = generator.choice(['add', 'add_many', 'remove_many', 'update',
+                                          'difference_update', 'intersection_update'])
+
+            if operation == 'add':
+                self.myset.add(intervals[0])
+            elif operation in ('add_many', 'remove_many'):
+                getattr(self.myset, operation)(intervals)
+            else:
+                getattr(self.myset, operation)(other)
+
+            for point in POINTS:
+                self.assertEqual(mirror.includes(point), self.myset.includes(point))
+
+
+class TestCoalesce(unittest.TestCase):
+    def test_regular(self):
+        myset = NumericSet([Interval(0, 1), Interval(1, 2), Interval(2.5, 4, True, True),
+                            Interval(6, 7)])
+
+        myset.coalesce(0.5)
+
+        # result: (0, 4] (6, 7)
+        self.assertEqual(formatted(myset.intervals), ['(0, 4]', '(6, 7)'])
+
+    def test_zero_gap(self):
+        myset = NumericSet([Interval(0, 1), Interval(1, 2), Interval(3, 4)])
+
+        myset.coalesce(0)
+
+        self.assertEqual(formatted(myset.intervals), ['(0, 2)', '(3, 4)'])
+
+    def test_negative_gap(self):
+        with self.assertRaises(ValueError):
+            NumericSet().coalesce(-1)
+
+
+class TestSimplify(unittest.TestCase):
+    def test_regular(self):
+        myset = NumericSet([Interval(0, 1), Interval(2, 3), Interval(3.5, 4), Interval(8, 9),
+                            Interval(9.25, 10, False, True)])
+
+        added = myset.simplify(3)
+
+        # The gaps 0.25 and 0.5 are closed
+        self.assertEqual(added, 0.75)
+        self.assertEqual(formatted(myset.intervals), ['(0, 1)', '(2, 4)', '(8, 10]'])
+
+    def test_within_budget(self):
+        myset = NumericSet([Interval(0, 1), Interval(2, 3)])
+
+        self.assertEqual(myset.simplify(2), 0)
+        self.assertEqual(formatted(myset.intervals), ['(0, 1)', '(2, 3)'])
+
+    def test_above_budget(self):
+        myset = NumericSet([Interval(index * 10, index * 10 + 1) for index in range(10)])
+
+        self.assertEqual(myset.simplify(11), 0)
+        self.assertEqual(myset.count(), 10)
+        self.assertEqual(myset.measure(), 10)
+
+    def test_random(self):
+        generator = random.Random(5)
+
+        for max_intervals in range(1, 8):
+            myset = NumericSet()
+            myset.add_many(random_intervals(generator, 12))
+            measure = myset.measure()
+
+            added = myset.simplify(max_intervals)
+
+            self.assertLessEqual(len(myset.intervals), max_intervals)
+            self.assertEqual(myset.measure(), measure + added)
+            assert_canonical(self, myset.intervals)
+
+    def test_invalid_budget(self):
+        with self.assertRaises(ValueError):
+            NumericSet().simplify(0)
+
+
+class TestMorphology(unittest.TestCase):
+    def setUp(self):
+        self.myset = NumericSet([Interval(0, 2), Interval(3, 3), Interval(4, 10, True, False),
+                                 Interval(10.5, 11, False, True)])
+
+    def test_dilate(self):
+        # (10.25, 11.25] does not touch [3.75, 10.25), which excludes 10.25
+        self.assertEqual(formatted(self.myset.dilate(0.25).intervals),
+                         ['(-0.25, 2.25)', '[2.75, 3.25]', '[3.75, 10.25)', '(10.25, 11.25]'])
+        self.assertEqual(formatted(self.myset.dilate(1).intervals), ['(-1, 12]'])
+
+    def test_erode(self):
+        # The point {3} and the interval (10.5, 11] become empty
+        self.assertEqual(formatted(self.myset.erode(1).intervals), ['[5, 9)'])
+
+    def test_zero_margin(self):
+        self.assertEqual(formatted(self.myset.dilate(0).intervals),
+                         formatted(self.myset.intervals))
+        self.assertEqual(formatted(self.myset.erode(0).intervals),
+                         formatted(self.myset.intervals))
+
+    def test_opening(self):
+        # Intervals narrower than 1 are removed
+        self.assertEqual(formatted(self.myset.opening(0.5).intervals),
+                         ['(0.0, 2.0)', '[4.0, 10.0)'])
+
+    def test_closing(self):
+        # Gaps narrower than 2 are closed
+        self.assertEqual(formatted(self.myset.closing(1).intervals), ['(0, 11]'])
+
+    def test_random(self):
+        generator = random.Random(6)
+        myset = NumericSet()
+        myset.add_many(random_intervals(generator, 20))
+
+        dilated = myset.dilate(1)
+        eroded = myset.erode(1)
+
+        for point in POINTS:
+            self.assertEqual(dilated.includes(point),
+                             any(includes(myset.intervals, point + offset / 8)
+                                 for offset in range(-8, 9)))
+            self.assertEqual(eroded.includes(point),
+                             all(includes(myset.intervals, point + offset / 8)
+                                 for offset in range(-8, 9)))
+
+        assert_canonical(self, dilated.intervals)
+        assert_canonical(self, eroded.intervals)
+
+    def test_negative_margin(self):
+        with self.assertRaises(ValueError):
+            self.myset.dilate(-1)
+
+        with self.assertRaises(ValueError):
+            self.myset.erode(-1)
+
+
+class TestAggregates(unittest.TestCase):
+    def test_regular(self):
+        myset = NumericSet([Interval(0, 2), Interval(5, 6, True, True)])
+
+        self.assertEqual(myset.count(), 2)
+        self.assertEqual(myset.bounds(), (0, 6))
+        self.assertEqual(myset.measure(), 3)
+
+        myset.add(Interval(1, 4))
+        myset.add(Interval(8, 9))
+        myset.remove(Interval(1, 2))
+
+        # result: (0, 1] [2, 4) [5, 6] (8, 9)
+        self.assertEqual(myset.measure(), 5)
+        self.assertEqual(myset.count(), 4)
+        self.assertEqual(myset.bounds(), (0, 9))
+
+        self.assertEqual(myset.pop().get_formatted(), '(8, 9)')
+        self.assertEqual(myset.measure(), 4)
+
+    def test_empty(self):
+        myset = NumericSet()
+
+        self.assertEqual(myset.count(), 0)
+        self.assertIsNone(myset.bounds())
+        self.assertEqual(myset.measure(), 0)
+
+    def test_random(self):
+        generator = random.Random(11)
+        myset = NumericSet()
+
+        for _ in range(200):
+            operation = generator.choice(['add', 'add_many', 'remove_many', 'pop', 'update'])
+            intervals = random_intervals(generator, generator.randint(1, 3))
+
+            if operation == 'add':
+                myset.add(intervals[0])
+            elif operation == 'pop':
+                myset.pop()
+            elif operation == 'update':
+                myset.update(NumericSet(intervals[:1]))
+            else:
+                getattr(myset, operation)(intervals)
+
+            self.assertEqual(myset.measure(), sum(interval.end - interval.start
+                                                  for interval in myset.intervals))
+
+    def test_deferred(self):
+        myset = NumericSet(deferred=True)
+        myset.add(Interval(0, 4))
+
+        self.assertEqual(myset.measure(), 4)
+
+        myset.add(Interval(2, 6))
+        myset.remove(Interval(0, 1))
+
+        self.assertEqual(myset.measure(), 5)
+        self.assertEqual(myset.bounds(), (1, 6))
+
+
+class TestIncludes(unittest.TestCase):
+    def test_ordinary(self):
+        myset = NumericSet([Interval(0, 2), Interval(3, 5, True, True), Interval(7, 7)])
+
+        self.assertFalse(myset.includes(-1))
+        self.assertFalse(myset.includes(0))
+        self.assertTrue(myset.includes(1))
+        self.assertFalse(myset.includes(2.5))
+        self.assertTrue(myset.includes(3))
+        self.assertTrue(myset.includes(5))
+        self.assertFalse(myset.includes(6))
+        self.assertTrue(myset.includes(7))
+        self.assertFalse(myset.includes(8))
+
+    def test_deferred(self):
+        myset = NumericSet(deferred=True)
+        myset.add(Interval(0, 2))
+
+        self.assertTrue(myset.includes(1))
+
+
 class TestLeftIntervals(unittest.TestCase):
     def test_empty(self):
         myset = NumericSet()
@@ -456,5 +863,113 @@ class TestEmpty(unittest.TestCase):
         self.assertFalse(myset.is_empty())
 
 
+class TestRead(unittest.TestCase):
+    def test_inclusive(self):
+        myset = NumericSet()
+        myset.add(Interval(2, 4, True, True))  # [2, 4]
+        myset.add(Interval(5, 5))  # {5}
+        myset.add(Interval(8, 10, is_end_inclusive=True))  # (8, 10]
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'myset.txt')
+            myset.save(filename)
+
+            read_set = NumericSet.read(filename)
+
+        self.assertEqual(len(read_set.intervals), 3)
+        self.assertEqual(read_set.intervals[0].get_formatted(), '[2.0, 4.0]')
+        self.assertEqual(read_set.intervals[1].get_formatted(), '{5.0}')
+        self.assertEqual(read_set.intervals[2].get_formatted(), '(8.0, 10.0]')
+
+    def test_unsorted_and_int(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'myset.txt')
+
+            with open(filename, 'w') as output_file:
+                output_file.write('(6, 9)\n{2}\n\n[1, 3)\n(8, 12]\n')
+
+            read_set = NumericSet.read(filename, parse=int)
+
+        self.assertEqual([interval.get_formatted() for interval in read_set.intervals],
+                         ['[1, 3)', '(6, 12]'])
+
+    def test_fallback(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'myset.txt')
+
+            with open(filename, 'w') as output_file:
+                output_file.write(f'(0, {2 ** 70})\n(5, 3)\n')
+
+            # Integers beyond int64 and reversed intervals are left to the line parser
+            read_set = NumericSet.read(filename, parse=int)
+
+        self.assertEqual([interval.get_formatted() for interval in read_set.intervals],
+                         [f'(0, {2 ** 70})'])
+
+    def test_save_after_read(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'myset.txt')
+            copy_filename = os.path.join(directory, 'copy.txt')
+
+            with open(filename, 'w') as output_file:
+                output_file.write('[1, 3)\n{5}\n(6, 12]\n')
+
+            NumericSet.read(filename, parse=int).save(copy_filename)
+
+            with open(copy_filename) as input_file:
+                self.assertEqual(input_file.read(), '[1, 3)\n{5}\n(6, 12]\n')
+
+
+class TestAddFrom(unittest.IsolatedAsyncioTestCase):
+    async def test_ordinary(self):
+        queue = asyncio.Queue()
+
+        intervals = [Interval(6, 8), Interval(2, 3), Interval(3, 6, True, True), Interval(10, 12)]
+
+        for interval in intervals:
+            queue.put_nowait(interval)
+
+        queue.put_nowait(None)
+
+        async def intervals():
+            while (interval := await queue.get()) is not None:
+                yield interval
+
+        myset = NumericSet([Interval(0, 1)])
+        await myset.add_from(intervals(), batch_size=2)
+
+        # result: (0, 1) (2, 8) (10, 12)
+        self.assertEqual(len(myset.intervals), 3)
+        self.assertEqual(myset.intervals[0].get_formatted(), '(0, 1)')
+        self.assertEqual(myset.intervals[1].get_formatted(), '(2, 8)')
+        self.assertEqual(myset.intervals[2].get_formatted(), '(10, 12)')
+
+
+class TestAsyncRead(unittest.IsolatedAsyncioTestCase):
+    async def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'myset.txt')
+
+            with open(filename, 'w') as output_file:
+                output_file.write('(0, 1)\n[3, 5)\n\n{5}\n(9, 10]\n')
+
+            myset = await NumericSet.aread(filename, batch_size=2)
+
+        self.assertEqual(len(myset.intervals), 3)
+        self.assertEqual(myset.intervals[0].get_formatted(), '(0.0, 1.0)')
+        self.assertEqual(myset.intervals[1].get_formatted(), '[3.0, 5.0]')
+        self.assertEqual(myset.intervals[2].get_formatted(), '(9.0, 10.0]')
+
+    async def test_stream(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(b'(2, 4)\n[4, 6)\n')
+        reader.feed_eof()
+
+        myset = await NumericSet.aread(reader)
+
+        self.assertEqual(len(myset.intervals), 1)
+        self.assertEqual(myset.intervals[0].get_formatted(), '(2.0, 6.0)')
+
+
 if __name__ == '__main__':
     unittest.main()
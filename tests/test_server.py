@@ -0,0 +1,160 @@
+"""Test the query server from the 'numeric_sets' module using unittest."""
+
+
+import asyncio
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets.server import Client, NumericSetServer
+from tests.helpers import POINTS, random_intervals
+
+
+class TestNumericSetServer(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temporary_directory.name, 'server.sock')
+
+        self.random_set = NumericSet()
+        self.random_set.add_many(random_intervals(random.Random(6), 30))
+        self.numeric_sets = {
+            'allowed': NumericSet([Interval(0, 4), Interval(6, 10, True, False)]),
+            'denied': NumericSet([Interval(3, 7, True, True)]),
+            'random': self.random_set,
+            'empty': NumericSet(),
+        }
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def _run(self, scenario, use_tcp=False):
+        async def run():
+            async with NumericSetServer(self.numeric_sets) as server:
+                if use_tcp:
+                    asyncio_server = await server.start(port=0)
+                    port = asyncio_server.sockets[0].getsockname()[1]
+                    client = await Client.connect(port=port)
+                else:
+                    await server.start(self.path)
+                    client = await Client.connect(self.path)
+
+                async with client:
+                    return await scenario(server, client)
+
+        return asyncio.run(run())
+
+    def test_includes(self):
+        async def scenario(server, client):
+            return [await client.includes('allowed', point) for point in (0, 2, 4, 6, 10)]
+
+        self.assertEqual(self._run(scenario), [False, True, False, True, False])
+
+    def test_batched_includes(self):
+        async def scenario(server, client):
+            results = await asyncio.gather(
+                *(client.includes('random', point) for point in POINTS))
+
+            return results, server.batches
+
+        results, batches = self._run(scenario)
+
+        self.assertEqual(results, [self.random_set.includes(point) for point in POINTS])
+        self.assertLess(batches, len(POINTS))
+
+    def test_includes_of_empty_set(self):
+        async def scenario(server, client):
+            return await client.includes('empty', 1)
+
+        self.assertFalse(self._run(scenario))
+
+    def test_slice(self):
+        async def scenario(server, client):
+            return (await client.slice('allowed', 2, 7),
+                    await client.slice('allowed', 4, 5),
+                    await client.slice('denied', 0, 3))
+
+        self.assertEqual(self._run(scenario), (['[2, 4)', '[6, 7]'], [], ['{3}']))
+
+    def test_aggregates(self):
+        async def scenario(server, client):
+            return (await client.measure('allowed'),
+                    await client.request('count', set='allowed'),
+                    await client.request('bounds', set='denied'),
+                    await client.request('sets'))
+
+        self.assertEqual(self._run(scenario),
+                         (8, 2, [3, 7], ['allowed', 'denied', 'empty', 'random']))
+
+    def test_set_operations(self):
+        async def scenario(server, client):
+            return (await client.request('difference', set='allowed', other='denied'),
+                    await client.request('union', set='denied', intervals=['[8, 9]']))
+
+        difference, union = self._run(scenario)
+
+        self.assertEqual(difference, ['(0, 3)', '(7, 10)'])
+        self.assertEqual(union, ['[3, 7]', '[8.0, 9.0]'])
+
+    def test_errors(self):
+        async def scenario(server, client):
+            errors = []
+
+            for operation, arguments in (('includes', {'set': 'missing', 'point': 1}),
+                                         ('includes', {'set': 'allowed', 'point': 'a'}),
+                                         ('rotate', {'set': 'allowed'}),
+                                         ('union', {'set': 'allowed', 'intervals': [1]}),
+                                         ('union', {'set': 'allowed', 'intervals': ['']})):
+                try:
+                    await client.request(operation, **arguments)
+                except ValueError as error:
+                    errors.append(str(error))
+
+            # A line that is not a JSON object is answered without an id
+            reader, writer = await asyncio.open_unix_connection(self.path)
+            writer.write(b'[1, 2]\n')
+            response = json.loads(await reader.readline())
+            writer.close()
+
+            errors.append(response['error'])
+
+            # The connection is still usable after errors
+            errors.append(await client.includes('allowed', 1))
+
+            return errors
+
+        errors = self._run(scenario)
+
+        self.assertEqual(len(errors), 7)
+        self.assertTrue(errors[0].startswith('KeyError'))
+        self.assertTrue(errors[1].startswith('TypeError'))
+        self.assertTrue(errors[2].startswith('ValueError'))
+        self.assertTrue(errors[3].startswith('TypeError'))
+        self.assertTrue(errors[4].startswith('ValueError'))
+        self.assertTrue(errors[5].startswith('TypeError'))
+        self.assertTrue(errors[6])
+
+    def test_tcp(self):
+        async def scenario(server, client):
+            return await client.includes('denied', 7)
+
+        self.assertTrue(self._run(scenario, use_tcp=True))
+
+    def test_many_clients(self):
+        async def scenario(server, client):
+            clients = [await Client.connect(self.path) for _ in range(5)]
+
+            try:
+                return await asyncio.gather(
+                    *(other.includes('allowed', point) for other in clients
+                      for point in (1, 5)))
+            finally:
+                await asyncio.gather(*(other.close() for other in clients))
+
+        self.assertEqual(self._run(scenario), [True, False] * 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
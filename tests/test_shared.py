@@ -0,0 +1,107 @@
+"""Test shared memory numeric sets from the 'numeric_sets' module using unittest."""
+
+
+import multiprocessing
+import pickle
+import random
+import unittest
+
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets import packed, shared
+from tests.helpers import POINTS, formatted, random_intervals
+
+
+def _includes_points(shared_set, points):
+    return [shared_set.includes(point) for point in points]
+
+
+class TestPacked(unittest.TestCase):
+    def test_round_trip(self):
+        intervals = [Interval(1, 2, True), Interval(3, 3), Interval(4.5, 6, False, True)]
+        buffer = bytearray(packed.get_size(len(intervals)))
+
+        packed.pack_into(buffer, intervals)
+        typecode, starts, ends, flags = packed.unpack_views(buffer)
+
+        self.assertEqual(typecode, 'd')
+        self.assertEqual(starts.tolist(), [1, 3, 4.5])
+        self.assertEqual(ends.tolist(), [2, 3, 6])
+        self.assertEqual(flags.tolist(), [1, 3, 2])
+
+    def test_typecode(self):
+        self.assertEqual(packed.get_typecode([Interval(1, 2), Interval(2 ** 40, 2 ** 41)]), 'q')
+        self.assertEqual(packed.get_typecode([Interval(1, 2.0)]), 'd')
+
+    def test_unknown_typecode(self):
+        with self.assertRaises(ValueError):
+            packed.unpack_views(bytes(packed.get_size(0)))
+
+
+class TestSharedNumericSet(unittest.TestCase):
+    def setUp(self):
+        self.numeric_set = NumericSet()
+        self.numeric_set.add_many(random_intervals(random.Random(0), 60))
+        self.shared_set = shared.publish(self.numeric_set)
+
+    def tearDown(self):
+        self.shared_set.close()
+        self.shared_set.unlink()
+
+    def test_intervals(self):
+        self.assertEqual(self.shared_set.typecode, 'q')
+        self.assertEqual(len(self.shared_set), len(self.numeric_set.intervals))
+        self.assertEqual(formatted(self.shared_set.intervals),
+                         formatted(self.numeric_set.intervals))
+
+    def test_slicing(self):
+        self.assertEqual(self.shared_set[-1].get_formatted(),
+                         self.numeric_set.intervals[-1].get_formatted())
+        self.assertEqual(formatted(self.shared_set[1:5]),
+                         formatted(self.numeric_set.intervals[1:5]))
+
+    def test_includes(self):
+        for point in POINTS:
+            self.assertEqual(self.shared_set.includes(point), self.numeric_set.includes(point))
+
+    def test_set_operation_input(self):
+        other = NumericSet([Interval(5, 25, True, False)])
+
+        self.assertEqual(formatted(other.difference(self.shared_set).intervals),
+                         formatted(other.difference(self.numeric_set).intervals))
+        self.assertEqual(formatted(other.union(self.shared_set).intervals),
+                         formatted(other.union(self.numeric_set).intervals))
+
+    def test_attach(self):
+        with shared.attach(self.shared_set.name) as attached:
+            self.assertEqual(formatted(attached.to_numeric_set().intervals),
+                             formatted(self.numeric_set.intervals))
+
+    def test_pickle_sends_name(self):
+        payload = pickle.dumps(self.shared_set)
+
+        self.assertLess(len(payload), 200)
+
+        with pickle.loads(payload) as attached:
+            self.assertEqual(len(attached), len(self.shared_set))
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.shared_set.intervals.starts[0] = 100
+
+    def test_worker_processes(self):
+        with multiprocessing.Pool(2) as pool:
+            results = pool.starmap(_includes_points, [(self.shared_set, POINTS[:50]),
+                                                      (self.shared_set, POINTS[50:])])
+
+        self.assertEqual(results[0] + results[1],
+                         [self.numeric_set.includes(point) for point in POINTS])
+
+    def test_empty(self):
+        with shared.publish(NumericSet()) as empty:
+            self.assertTrue(empty.is_empty())
+            self.assertFalse(empty.includes(0))
+            empty.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
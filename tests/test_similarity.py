@@ -0,0 +1,121 @@
+"""Test similarity metrics from the 'numeric_sets' module using unittest."""
+
+
+import math
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets import similarity
+from tests.helpers import random_intervals
+
+
+def _random_set(generator, count):
+    numeric_set = NumericSet()
+    numeric_set.add_many(random_intervals(generator, count))
+
+    return numeric_set
+
+
+def _point_distance(point, numeric_set):
+    return min(max(interval.start - point, point - interval.end, 0)
+               for interval in numeric_set.intervals)
+
+
+class TestMeasures(unittest.TestCase):
+    def setUp(self):
+        self.numeric_set_1 = NumericSet([Interval(0, 4), Interval(6, 10)])
+        self.numeric_set_2 = NumericSet([Interval(2, 7, True, True), Interval(9, 12)])
+
+    def test_intersection_measure(self):
+        self.assertEqual(similarity.intersection_measure(self.numeric_set_1,
+                                                         self.numeric_set_2), 4)
+
+    def test_union_measure(self):
+        self.assertEqual(similarity.union_measure(self.numeric_set_1, self.numeric_set_2), 12)
+
+    def test_jaccard(self):
+        self.assertEqual(similarity.jaccard(self.numeric_set_1, self.numeric_set_2), 4 / 12)
+        self.assertEqual(similarity.jaccard(NumericSet(), NumericSet()), 1.0)
+
+    def test_datetimes(self):
+        start = datetime(2024, 1, 1)
+        hours = [start + timedelta(hours=hour) for hour in range(8)]
+        numeric_set_1 = NumericSet([Interval(hours[0], hours[4])])
+        numeric_set_2 = NumericSet([Interval(hours[2], hours[6])])
+        disjoint = NumericSet([Interval(hours[6], hours[7])])
+
+        self.assertEqual(similarity.intersection_measure(numeric_set_1, numeric_set_2),
+                         timedelta(hours=2))
+        self.assertEqual(similarity.union_measure(numeric_set_1, numeric_set_2),
+                         timedelta(hours=6))
+        self.assertEqual(similarity.jaccard(numeric_set_1, numeric_set_2), 1 / 3)
+        self.assertEqual(similarity.jaccard(numeric_set_1, disjoint), 0.0)
+        self.assertEqual(similarity.union_measure(numeric_set_1, NumericSet()),
+                         timedelta(hours=4))
+
+    def test_random(self):
+        generator = random.Random(7)
+
+        for _ in range(20):
+            numeric_set_1 = _random_set(generator, 8)
+            numeric_set_2 = _random_set(generator, 8)
+
+            self.assertEqual(similarity.intersection_measure(numeric_set_1, numeric_set_2),
+                             numeric_set_1.intersection(numeric_set_2).measure())
+            self.assertEqual(similarity.union_measure(numeric_set_1, numeric_set_2),
+                             numeric_set_1.union(numeric_set_2).measure())
+
+
+class TestHausdorff(unittest.TestCase):
+    def test_regular(self):
+        numeric_set_1 = NumericSet([Interval(0, 10)])
+        numeric_set_2 = NumericSet([Interval(0, 2), Interval(8, 9)])
+
+        # The point 5 is 3 away from the second set, and 10 is 1 away
+        self.assertEqual(similarity.hausdorff(numeric_set_1, numeric_set_2), 3)
+
+    def test_empty(self):
+        self.assertEqual(similarity.hausdorff(NumericSet(), NumericSet()), 0)
+        self.assertEqual(similarity.hausdorff(NumericSet([Interval(0, 1)]), NumericSet()),
+                         math.inf)
+
+    def test_random(self):
+        generator = random.Random(8)
+        points = [point / 4 for point in range(-20, 200)]
+
+        for _ in range(20):
+            numeric_set_1 = _random_set(generator, 5)
+            numeric_set_2 = _random_set(generator, 5)
+
+            # Distances between closures are attained at quarter points for integer endpoints
+            expected = max(
+                max(_point_distance(point, numeric_set_2) for point in points
+                    if _point_distance(point, numeric_set_1) == 0),
+                max(_point_distance(point, numeric_set_1) for point in points
+                    if _point_distance(point, numeric_set_2) == 0))
+
+            self.assertEqual(similarity.hausdorff(numeric_set_1, numeric_set_2), expected)
+
+
+class TestSimilarityMatrix(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(9)
+        self.numeric_sets = [_random_set(generator, 6) for _ in range(5)]
+
+    def test_in_process(self):
+        matrix = similarity.similarity_matrix(self.numeric_sets, max_workers=1)
+
+        for i, numeric_set_1 in enumerate(self.numeric_sets):
+            for j, numeric_set_2 in enumerate(self.numeric_sets):
+                self.assertEqual(matrix[i][j], similarity.jaccard(numeric_set_1, numeric_set_2))
+
+    def test_process_pool(self):
+        self.assertEqual(
+            similarity.similarity_matrix(self.numeric_sets, similarity.hausdorff, max_workers=2),
+            similarity.similarity_matrix(self.numeric_sets, similarity.hausdorff, max_workers=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Test set operations over interval streams from the 'numeric_sets' module using unittest."""
+
+
+import os
+import random
+import tempfile
+import unittest
+from itertools import islice
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets import streams
+from tests.helpers import POINTS, assert_canonical, formatted, includes, random_intervals
+
+
+def _sorted_intervals(generator, count):
+    # Intervals with equal starts keep a random order of inclusivity
+    return sorted(random_intervals(generator, count), key=lambda interval: interval.start)
+
+
+class TestOperations(unittest.TestCase):
+    def assert_operation(self, operation, predicate):
+        generator = random.Random(0)
+
+        for _ in range(50):
+            intervals_1 = _sorted_intervals(generator, 10)
+            intervals_2 = _sorted_intervals(generator, 10)
+
+            result = list(operation(iter(intervals_1), iter(intervals_2)))
+
+            assert_canonical(self, result)
+
+            for point in POINTS:
+                self.assertEqual(includes(result, point),
+                                 predicate(includes(intervals_1, point),
+                                           includes(intervals_2, point)))
+
+    def test_union(self):
+        self.assert_operation(streams.iter_union,
+                              lambda is_in_1, is_in_2: is_in_1 or is_in_2)
+
+    def test_intersection(self):
+        self.assert_operation(streams.iter_intersection,
+                              lambda is_in_1, is_in_2: is_in_1 and is_in_2)
+
+    def test_difference(self):
+        self.assert_operation(streams.iter_difference,
+                              lambda is_in_1, is_in_2: is_in_1 and not is_in_2)
+
+    def test_symmetric_difference(self):
+        self.assert_operation(streams.iter_symmetric_difference,
+                              lambda is_in_1, is_in_2: is_in_1 != is_in_2)
+
+    def test_many_streams(self):
+        union = streams.iter_union([Interval(0, 1)], [Interval(1, 2, True)], [Interval(5, 6)])
+
+        self.assertEqual(formatted(union), ['(0, 2)', '(5, 6)'])
+
+    def test_equal_starts(self):
+        union = streams.iter_union([Interval(1, 3), Interval(1, 2, True)])
+
+        self.assertEqual(formatted(union), ['[1, 3)'])
+
+    def test_unsorted(self):
+        with self.assertRaises(ValueError):
+            list(streams.iter_union([Interval(3, 4), Interval(1, 2)]))
+
+
+class TestLaziness(unittest.TestCase):
+    def setUp(self):
+        self.pulled = 0
+
+    def endless(self):
+        start = 0
+
+        while True:
+            self.pulled += 1
+            yield Interval(start, start + 1)
+            start += 2
+
+    def test_union(self):
+        union = streams.iter_union(self.endless(), [Interval(3, 6)])
+
+        self.assertEqual(formatted(islice(union, 2)), ['(0, 1)', '(2, 3)'])
+        self.assertLess(self.pulled, 10)
+
+    def test_intersection(self):
+        intersection = streams.iter_intersection(self.endless(), [Interval(3, 6)])
+
+        self.assertEqual(formatted(intersection), ['(4, 5)'])
+        self.assertLess(self.pulled, 10)
+
+    def test_difference(self):
+        difference = streams.iter_difference([Interval(0, 5)], self.endless())
+
+        self.assertEqual(formatted(difference), ['[1, 2]', '[3, 4]'])
+        self.assertLess(self.pulled, 10)
+
+
+class TestReadSave(unittest.TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename_1 = os.path.join(directory, 'myset_1.txt')
+            filename_2 = os.path.join(directory, 'myset_2.txt')
+            result = os.path.join(directory, 'result.txt')
+
+            NumericSet([Interval(0, 2), Interval(4, 6, True, True)]).save(filename_1)
+            NumericSet([Interval(1, 5)]).save(filename_2)
+
+            difference = streams.iter_difference(
+                streams.iter_read(filename_1), streams.iter_read(filename_2))
+            streams.iter_save(difference, result)
+
+            self.assertEqual(formatted(streams.iter_read(result)),
+                             ['(0.0, 1.0]', '[5.0, 6.0]'])
+
+
+if __name__ == '__main__':
+    unittest.main()
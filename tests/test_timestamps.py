@@ -0,0 +1,141 @@
+"""Test timestamp endpoints from the 'numeric_sets' module using unittest."""
+
+
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets import packed, timestamps
+from numeric_sets.streams import iter_read
+from tests.helpers import formatted
+
+
+# A nanosecond timestamp that a float cannot represent exactly
+NANOSECONDS = 1_700_000_000_123_456_789
+
+
+class TestConversion(unittest.TestCase):
+    def test_datetime(self):
+        value = datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
+
+        nanoseconds = timestamps.to_nanoseconds(value)
+
+        self.assertEqual(nanoseconds, 1_700_000_000_123_456_000)
+        self.assertEqual(timestamps.to_datetime(nanoseconds), value)
+
+    def test_naive_datetime_is_utc(self):
+        value = datetime(2023, 11, 14, 22, 13, 20)
+
+        self.assertEqual(timestamps.to_nanoseconds(value), 1_700_000_000_000_000_000)
+        self.assertEqual(timestamps.to_datetime(1_700_000_000_000_000_000, tz=None), value)
+
+    def test_timedelta(self):
+        self.assertEqual(timestamps.to_nanoseconds(timedelta(seconds=1, microseconds=5)),
+                         1_000_005_000)
+        self.assertEqual(timestamps.to_timedelta(1_000_005_999),
+                         timedelta(seconds=1, microseconds=5))
+
+    def test_integer(self):
+        self.assertEqual(timestamps.to_nanoseconds(NANOSECONDS), NANOSECONDS)
+
+        with self.assertRaises(TypeError):
+            timestamps.to_nanoseconds(1.5)
+
+    def test_map_endpoints(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        windows = NumericSet()
+        windows.add_many([Interval(start, start + timedelta(hours=1), True),
+                          Interval(start + timedelta(minutes=30), start + timedelta(hours=2))])
+
+        nanosecond_set = timestamps.map_endpoints(windows, timestamps.to_nanoseconds)
+
+        self.assertEqual(formatted(nanosecond_set.intervals),
+                         ['[1704067200000000000, 1704074400000000000)'])
+        self.assertEqual(formatted(timestamps.map_endpoints(
+            nanosecond_set, timestamps.to_datetime).intervals), formatted(windows.intervals))
+
+    def test_datetime_set_operations(self):
+        start = datetime(2024, 1, 1)
+        windows = NumericSet([Interval(start, start + timedelta(days=1), True)])
+
+        self.assertTrue(windows.includes(start + timedelta(hours=5)))
+        self.assertFalse(windows.includes(start + timedelta(days=1)))
+
+    def test_datetime_measure(self):
+        start = datetime(2024, 1, 1)
+        windows = NumericSet()
+
+        self.assertEqual(windows.measure(), 0)
+
+        windows.add(Interval(start, start + timedelta(hours=2)))
+        windows.add(Interval(start + timedelta(hours=5), start + timedelta(hours=6)))
+
+        self.assertEqual(windows.measure(), timedelta(hours=3))
+
+        windows.pop()
+
+        self.assertEqual(windows.measure(), timedelta(hours=2))
+
+
+class TestInputOutput(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temporary_directory.name, 'windows.txt')
+        self.numeric_set = NumericSet([Interval(NANOSECONDS, NANOSECONDS + 1, True),
+                                       Interval(NANOSECONDS + 5, NANOSECONDS + 5)])
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_read_integers(self):
+        self.numeric_set.save(self.filename)
+
+        restored = NumericSet.read(self.filename, parse=int)
+
+        self.assertEqual(formatted(restored.intervals), formatted(self.numeric_set.intervals))
+
+    def test_read_floats_by_default(self):
+        self.numeric_set.save(self.filename)
+
+        restored = NumericSet.read(self.filename)
+
+        self.assertIsInstance(restored.intervals[0].start, float)
+
+    def test_read_datetimes(self):
+        start = datetime(2024, 1, 1, 8, 30)
+        windows = NumericSet([Interval(start, start + timedelta(minutes=15), True)])
+        windows.save(self.filename)
+
+        restored = NumericSet.read(self.filename, parse=datetime.fromisoformat)
+
+        self.assertEqual(restored.intervals[0].start, start)
+        self.assertEqual(formatted(restored.intervals), formatted(windows.intervals))
+
+    def test_iter_read_integers(self):
+        self.numeric_set.save(self.filename)
+
+        self.assertEqual(formatted(iter_read(self.filename, parse=int)),
+                         formatted(self.numeric_set.intervals))
+
+    def test_aread_integers(self):
+        self.numeric_set.save(self.filename)
+
+        restored = asyncio.run(NumericSet.aread(self.filename, parse=int))
+
+        self.assertEqual(formatted(restored.intervals), formatted(self.numeric_set.intervals))
+
+    def test_binary(self):
+        packed.save(self.numeric_set, self.filename)
+
+        restored = packed.read(self.filename)
+
+        self.assertEqual(os.path.getsize(self.filename), packed.get_size(2))
+        self.assertEqual(formatted(restored.intervals), formatted(self.numeric_set.intervals))
+        self.assertIsInstance(restored.intervals[0].start, int)
+
+
+if __name__ == '__main__':
+    unittest.main()
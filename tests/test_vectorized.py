@@ -0,0 +1,309 @@
+"""Test vectorized interval predicates from the 'numeric_sets' module using unittest."""
+
+
+import itertools
+import random
+import unittest
+from array import array
+
+import numpy as np
+
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets import vectorized
+from tests.helpers import formatted, random_intervals
+
+
+def _all_intervals():
+    intervals = []
+
+    for start, end in itertools.combinations_with_replacement(range(4), 2):
+        for flags in itertools.product([False, True], repeat=2):
+            intervals.append(Interval(start, end, *flags))
+
+    return intervals
+
+
+class TestConversion(unittest.TestCase):
+    def test_round_trip(self):
+        intervals = [Interval(1, 2), Interval(3, 5, True), Interval(6, 6)]
+
+        unpacked = vectorized.to_intervals(vectorized.to_arrays(intervals))
+
+        self.assertEqual([interval.get_formatted() for interval in unpacked],
+                         ['(1, 2)', '[3, 5)', '{6}'])
+
+    def test_mask(self):
+        arrays = vectorized.to_arrays([Interval(1, 2), Interval(3, 5)])
+
+        unpacked = vectorized.to_intervals(arrays, np.array([False, True]))
+
+        self.assertEqual([interval.get_formatted() for interval in unpacked], ['(3, 5)'])
+
+
+class TestPredicates(unittest.TestCase):
+    def setUp(self):
+        self.intervals = _all_intervals()
+        self.arrays_2 = vectorized.to_arrays(self.intervals)
+
+        # Compare every interval with every other one
+        self.arrays_1 = tuple(array[:, None] for array in self.arrays_2)
+
+    def test_is_overlapping(self):
+        result = vectorized.is_overlapping(self.arrays_1, self.arrays_2)
+
+        for i, interval_1 in enumerate(self.intervals):
+            for j, interval_2 in enumerate(self.intervals):
+                self.assertEqual(result[i, j], interval_1.is_overlapping(interval_2))
+
+    def test_is_almost_overlapping(self):
+        result = vectorized.is_almost_overlapping(self.arrays_1, self.arrays_2)
+
+        for i, interval_1 in enumerate(self.intervals):
+            for j, interval_2 in enumerate(self.intervals):
+                self.assertEqual(result[i, j], interval_1.is_almost_overlapping(interval_2))
+
+    def test_includes(self):
+        points = np.arange(-0.5, 4, 0.5)
+
+        result = vectorized.includes(self.arrays_1, points)
+
+        for i, interval in enumerate(self.intervals):
+            for j, point in enumerate(points):
+                self.assertEqual(result[i, j], interval.includes(point))
+
+    def test_intersection(self):
+        arrays, mask = vectorized.intersection(self.arrays_1, self.arrays_2)
+
+        for i, interval_1 in enumerate(self.intervals):
+            for j, interval_2 in enumerate(self.intervals):
+                expected = Interval.intersection(interval_1, interval_2)
+
+                self.assertEqual(mask[i, j], expected is not None)
+
+                if expected is not None:
+                    actual = Interval(*(array[i, j] for array in arrays))
+                    self.assertEqual(actual.get_formatted(), expected.get_formatted())
+
+
+class TestNumericSetArrays(unittest.TestCase):
+    def test_is_canonical(self):
+        def canonical(*intervals):
+            return vectorized.is_canonical(vectorized.to_arrays(list(intervals)))
+
+        self.assertTrue(canonical())
+        self.assertTrue(canonical(Interval(1, 2), Interval(2, 3), Interval(4, 4)))
+        self.assertFalse(canonical(Interval(1, 2, False, True), Interval(2, 3)))
+        self.assertFalse(canonical(Interval(3, 4), Interval(1, 2)))
+        self.assertFalse(vectorized.is_canonical(
+            (np.array([1]), np.array([1]), np.array([False]), np.array([False]))))
+
+    def test_aggregates_do_not_build_intervals(self):
+        starts = np.array([0, 5, 9])
+        numeric_set = NumericSet.from_arrays(starts, np.array([2, 6, 9]),
+                                             np.array([False, True, True]),
+                                             np.array([False, True, True]))
+
+        self.assertEqual(numeric_set.measure(), 3)
+        self.assertEqual(numeric_set.count(), 3)
+        self.assertEqual(numeric_set.bounds(), (0, 9))
+        self.assertFalse(numeric_set.is_empty())
+
+        # The arrays are still returned as they are, so no intervals were built
+        self.assertIs(numeric_set.to_arrays()[0], starts)
+
+        empty = NumericSet.from_arrays([], [], [], [])
+
+        self.assertEqual((empty.measure(), empty.count(), empty.bounds()), (0, 0, None))
+        self.assertTrue(empty.is_empty())
+
+    def test_canonical_arrays_are_not_copied(self):
+        arrays = (np.array([1.0, 4.0]), np.array([2.0, 6.0]),
+                  np.array([True, False]), np.array([False, True]))
+
+        numeric_set = NumericSet.from_arrays(*arrays)
+
+        self.assertTrue(all(a is b for a, b in zip(numeric_set.to_arrays(), arrays)))
+        self.assertEqual(formatted(numeric_set.intervals), ['[1.0, 2.0)', '(4.0, 6.0]'])
+
+    def test_unsorted_arrays(self):
+        numeric_set = NumericSet.from_arrays([5, 1, 2], [7, 3, 2], [True, False, False],
+                                             [True, False, False])
+
+        self.assertEqual(formatted(numeric_set.intervals), ['(1, 3)', '[5, 7]'])
+
+    def test_buffers(self):
+        numeric_set = NumericSet.from_arrays(array('d', [1, 3]), array('d', [2, 4]),
+                                             array('b', [1, 0]), array('b', [1, 0]))
+
+        self.assertEqual(formatted(numeric_set.intervals), ['[1.0, 2.0]', '(3.0, 4.0)'])
+
+    def test_trusted(self):
+        starts = np.array([3, 1])
+
+        numeric_set = NumericSet.from_arrays(starts, [4, 2], [True, True], [True, True],
+                                             trusted=True)
+
+        self.assertIs(numeric_set.to_arrays()[0], starts)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            NumericSet.from_arrays([1, 2], [3], [True], [True])
+
+        with self.assertRaises(ValueError):
+            NumericSet.from_arrays([3], [1], [True], [True])
+
+    def test_changes_after_from_arrays(self):
+        numeric_set = NumericSet.from_arrays([1], [2], [True], [True])
+
+        numeric_set.add(Interval(5, 6))
+        copy = numeric_set.copy()
+        numeric_set.intervals = []
+
+        self.assertEqual(formatted(copy.intervals), ['[1, 2]', '(5, 6)'])
+        self.assertEqual(numeric_set.to_arrays()[0].tolist(), [])
+
+    def test_round_trip(self):
+        numeric_set = NumericSet([Interval(1, 2), Interval(3, 3)])
+
+        restored = NumericSet.from_arrays(*numeric_set.to_arrays())
+
+        self.assertEqual(formatted(restored.intervals), ['(1, 2)', '{3}'])
+
+
+class TestText(unittest.TestCase):
+    def test_parse(self):
+        data = b'[2, 4]\n{5}\n\n(8, 10]\r\n(11.5, inf)\n'
+
+        starts, ends, is_start_inclusive, is_end_inclusive = vectorized.parse_text(data)
+
+        self.assertEqual(starts.tolist(), [2.0, 5.0, 8.0, 11.5])
+        self.assertEqual(ends.tolist(), [4.0, 5.0, 10.0, float('inf')])
+        self.assertEqual(is_start_inclusive.tolist(), [True, True, False, False])
+        self.assertEqual(is_end_inclusive.tolist(), [True, True, True, False])
+
+    def test_parse_int(self):
+        starts, ends, _, _ = vectorized.parse_text(f'(-3, {2 ** 40})'.encode(), int)
+
+        self.assertEqual(starts.dtype, np.int64)
+        self.assertEqual((starts.tolist(), ends.tolist()), ([-3], [2 ** 40]))
+
+    def test_parse_int64_limits(self):
+        limits = np.iinfo(np.int64)
+        starts, ends, _, _ = vectorized.parse_text(f'[{limits.min}, {limits.max}]'.encode(), int)
+
+        self.assertEqual((starts.tolist(), ends.tolist()), ([limits.min], [limits.max]))
+
+        with self.assertRaises(ValueError):
+            vectorized.parse_text(f'[0, {limits.max + 1}]'.encode(), int)
+
+    def test_parse_invalid(self):
+        for data, parse in ((b'(1, 2.5)', int), (b'(1, 2', float), (b'(1, 2, 3)', float),
+                            (b'1, 2', float), (b'{a}', float), (b'(1, 2)', str),
+                            (f'({2 ** 70}, {2 ** 71})'.encode(), int)):
+            with self.assertRaises(ValueError):
+                vectorized.parse_text(data, parse)
+
+    def test_round_trip(self):
+        integer_intervals = random_intervals(random.Random(12), 200)
+        float_intervals = [Interval(interval.start / 4, interval.end * 1e15,
+                                    interval.is_start_inclusive, interval.is_end_inclusive)
+                           for interval in integer_intervals]
+
+        for intervals, parse in ((integer_intervals, int), (float_intervals, float)):
+            text = ''.join(interval.get_formatted() + '\n' for interval in intervals)
+
+            self.assertEqual(vectorized.format_text(vectorized.parse_text(text.encode(), parse)),
+                             text)
+
+    def test_empty(self):
+        arrays = vectorized.parse_text(b'')
+
+        self.assertEqual(len(arrays[0]), 0)
+        self.assertEqual(vectorized.format_text(arrays), '')
+
+
+class TestHistogram(unittest.TestCase):
+    def test_regular(self):
+        numeric_set = NumericSet([Interval(0, 2, False, True), Interval(3, 3), Interval(4, 10)])
+
+        coverage, counts = numeric_set.histogram(np.array([-1, 0, 2, 3, 4, 5, 12]))
+
+        self.assertEqual(coverage.tolist(), [0, 2, 0, 0, 1, 5])
+        # (0, 2] includes the left edge of [2, 3), and {3} has no length but is counted
+        self.assertEqual(counts.tolist(), [0, 1, 1, 1, 1, 1])
+
+    def test_open_end_at_edge(self):
+        numeric_set = NumericSet([Interval(0, 2), Interval(5, 6)])
+
+        coverage, counts = numeric_set.histogram(np.array([2, 3, 7]))
+
+        self.assertEqual(coverage.tolist(), [0, 1])
+        self.assertEqual(counts.tolist(), [0, 1])
+
+    def test_empty(self):
+        coverage, counts = NumericSet().histogram(np.array([0, 1, 2]))
+
+        self.assertEqual(coverage.tolist(), [0, 0])
+        self.assertEqual(counts.tolist(), [0, 0])
+
+    def test_random(self):
+        generator = random.Random(10)
+        numeric_set = NumericSet()
+        numeric_set.add_many(random_intervals(generator, 30))
+        edges = np.arange(-2, 50, 1.5)
+
+        coverage, counts = numeric_set.histogram(edges)
+
+        for index, (left, right) in enumerate(zip(edges[:-1], edges[1:])):
+            bin_set = NumericSet([Interval(float(left), float(right), True, False)])
+
+            self.assertEqual(coverage[index], numeric_set.intersection(bin_set).measure())
+            self.assertEqual(counts[index], sum(
+                Interval.intersection(interval, bin_set.intervals[0]) is not None
+                for interval in numeric_set.intervals))
+
+    def test_unsorted_edges(self):
+        with self.assertRaises(ValueError):
+            NumericSet([Interval(0, 1)]).histogram(np.array([1, 0]))
+
+
+class TestSampling(unittest.TestCase):
+    def setUp(self):
+        self.numeric_set = NumericSet([Interval(0, 1), Interval(3, 3), Interval(5, 8)])
+
+    def test_sample(self):
+        points = self.numeric_set.sample(20000, rng=0)
+
+        self.assertEqual(len(points), 20000)
+        self.assertTrue(all(self.numeric_set.includes(point) for point in points[:500]))
+        # (0, 1) holds a quarter of the measure
+        self.assertAlmostEqual(np.mean(points < 1), 0.25, delta=0.02)
+
+    def test_sample_intervals(self):
+        intervals = self.numeric_set.sample_intervals(20000, rng=np.random.default_rng(0))
+        lengths = np.array([interval.end - interval.start for interval in intervals])
+
+        # The point {3} has no length and is never drawn
+        self.assertEqual(set(lengths.tolist()), {1, 3})
+        self.assertAlmostEqual(np.mean(lengths == 3), 0.75, delta=0.02)
+
+    def test_seed(self):
+        self.assertEqual(self.numeric_set.sample(5, rng=1).tolist(),
+                         self.numeric_set.sample(5, rng=1).tolist())
+
+    def test_index_follows_changes(self):
+        self.numeric_set.sample(1, rng=0)
+        self.numeric_set.remove_many([Interval(4, 9)])
+
+        self.assertTrue(np.all(self.numeric_set.sample(100, rng=0) < 1))
+
+    def test_zero_measure(self):
+        with self.assertRaises(ValueError):
+            NumericSet([Interval(3, 3)]).sample(1)
+
+        with self.assertRaises(ValueError):
+            NumericSet().sample_intervals(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Test the WindowedNumericSet class from the 'numeric_sets' module using unittest."""
+
+
+import math
+import random
+import unittest
+
+from numeric_sets import instrumentation
+from numeric_sets.main import Interval, NumericSet
+from numeric_sets.windowed import WindowedNumericSet
+from tests.helpers import POINTS, assert_canonical, formatted
+
+
+class TestWindowedNumericSet(unittest.TestCase):
+    def test_advance(self):
+        windowed_set = WindowedNumericSet(10, [Interval(0, 3), Interval(5, 8, True, True)])
+        windowed_set.add(Interval(12, 14))
+
+        windowed_set.advance(16)
+
+        self.assertEqual(windowed_set.low_water_mark, 6)
+        self.assertEqual(formatted(windowed_set.intervals), ['[6, 8]', '(12, 14)'])
+        self.assertEqual(windowed_set.measure(), 4)
+        self.assertEqual(windowed_set.count(), 2)
+        self.assertFalse(windowed_set.includes(5))
+        self.assertTrue(windowed_set.includes(6))
+
+    def test_low_water_mark_never_moves_back(self):
+        windowed_set = WindowedNumericSet(5, [Interval(0, 10)])
+
+        windowed_set.advance(8)
+        windowed_set.advance(6)
+
+        self.assertEqual(formatted(windowed_set.intervals), ['[3, 10)'])
+
+    def test_late_intervals_are_clipped(self):
+        windowed_set = WindowedNumericSet(5)
+        windowed_set.advance(10)
+
+        windowed_set.add(Interval(1, 2))
+        windowed_set.add(Interval(3, 7))
+        windowed_set.update(NumericSet([Interval(0, 4), Interval(8, 9)]))
+
+        self.assertEqual(formatted(windowed_set.intervals), ['[5, 7)', '(8, 9)'])
+
+    def test_add_in_order_does_not_rebuild(self):
+        windowed_set = WindowedNumericSet(100)
+
+        with instrumentation.instrumented() as stats:
+            for start in range(50):
+                windowed_set.add(Interval(start, start + 1.5))
+                windowed_set.advance(start)
+
+        self.assertNotIn('NumericSet.add_many', stats.operations)
+        self.assertEqual(formatted(windowed_set.intervals), ['(0, 50.5)'])
+
+    def test_is_empty(self):
+        windowed_set = WindowedNumericSet(1, [Interval(0, 1)])
+
+        self.assertFalse(windowed_set.is_empty())
+
+        windowed_set.advance(3)
+
+        self.assertTrue(windowed_set.is_empty())
+
+    def test_advance_reports_delta(self):
+        windowed_set = WindowedNumericSet(5, [Interval(0, 10)])
+        deltas = []
+        windowed_set.subscribe(deltas.append)
+
+        windowed_set.advance(8)
+
+        self.assertEqual(formatted(deltas[0].removed), ['(0, 3)'])
+
+    def test_copy(self):
+        windowed_set = WindowedNumericSet(4, [Interval(0, 10)])
+        windowed_set.advance(6)
+
+        copy = windowed_set.copy()
+        copy.add(Interval(0, 1))
+
+        self.assertIsInstance(copy, WindowedNumericSet)
+        self.assertEqual(formatted(copy.intervals), ['[2, 10)'])
+
+    def test_random(self):
+        generator = random.Random(4)
+        windowed_set = WindowedNumericSet(8)
+        numeric_set = NumericSet()
+
+        for t in range(60):
+            start = t / 2 + generator.randint(-6, 2)
+            interval = Interval(start, start + generator.randint(0, 3),
+                                generator.random() < 0.5, generator.random() < 0.5)
+
+            windowed_set.add(interval)
+            numeric_set.add_many([interval])
+
+            if t % 3 == 0:
+                windowed_set.advance(t / 2)
+                numeric_set.remove_many([Interval(-math.inf, t / 2 - 8)])
+
+            for point in POINTS:
+                self.assertEqual(windowed_set.includes(point), numeric_set.includes(point))
+
+            self.assertEqual(windowed_set.measure(), numeric_set.measure())
+            assert_canonical(self, windowed_set.intervals)
+
+
+if __name__ == '__main__':
+    unittest.main()